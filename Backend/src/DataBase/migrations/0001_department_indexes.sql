@@ -0,0 +1,18 @@
+-- Bölüm filtresiyle okunan tablolar için ikincil indeksler.
+-- class_list_menu, delete_classes, read_exam_program, export_exam_schedule,
+-- get_departments -> classes.department
+-- student_list_for_department, delete_students -> students.department
+-- get_all_classrooms -> classrooms.department_name
+-- get_departments -> users.department
+--
+-- exam_block.schedule_id, UNIQUE (schedule_id, class_id, ...) anahtarının ilk
+-- sütunu olarak; exam_students.student_num ve exam_seating_plan.student_num
+-- ise yabancı anahtarlar için InnoDB'nin açtığı indekslerle zaten indekslidir.
+
+CREATE INDEX idx_classes_department ON classes (department);
+
+CREATE INDEX idx_students_department ON students (department);
+
+CREATE INDEX idx_classrooms_department_name ON classrooms (department_name);
+
+CREATE INDEX idx_users_department ON users (department);
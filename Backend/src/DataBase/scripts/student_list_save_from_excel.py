@@ -5,6 +5,7 @@ import pandas as pd
 def student_list_save_from_excel(student_list_df, department: str) -> None:
     
     students_df: pd.DataFrame = pd.DataFrame()
+    students = []
     
     try:
         student_list_df['Sınıf'] = student_list_df['Sınıf'].apply(get_year_from_str)
@@ -42,16 +43,14 @@ def student_list_save_from_excel(student_list_df, department: str) -> None:
                     'msg': f"[HATA] Satır {excel_row}: 'Ders' sütunu okunamadı veya geçersiz formatta | {e_class}"
                 }
 
-            student_info = {
+            students.append({
                 'student_num': row['Öğrenci No'],
                 'name': name,
                 'surname': surname,
                 'grade': row['Sınıf'],
                 'classes': classes,
                 'department': department
-            }
-
-            students_df = pd.concat([students_df, pd.DataFrame([student_info])], ignore_index=True)
+            })
 
         except Exception as e_row:
             return {
@@ -59,15 +58,31 @@ def student_list_save_from_excel(student_list_df, department: str) -> None:
                 'msg': f"[HATA] Satır {excel_row}: İşlenirken hata oluştu | {e_row}"
             }
 
+    # 🔹 Satırlar listede toplanıp tek seferde DataFrame'e çevrilir (satır başına concat yerine)
+    students_df = pd.DataFrame(students)
+
     try:
-        insert_students(students_df, n_jobs=6)
+        result = insert_students(students_df)
     except Exception as e_insert:
         return {
             'status': 'error',
             'msg': f"[HATA] Öğrenciler veritabanına eklenirken hata oluştu | {e_insert}"
         }
 
+    if result['status'] == 'error':
+        return {
+            'status': 'error',
+            'msg': f"[HATA] Öğrenciler veritabanına eklenirken hata oluştu | {result['errors'][-1]['error']}"
+        }
+
+    if result['status'] == 'partial':
+        details = "; ".join(f"{e['student']}: {e['error']}" for e in result['errors'][:10])
+        return {
+            'status': 'success',
+            'msg': f"{result['inserted']} öğrenci eklendi, {len(result['errors'])} kayıtta hata var: {details}"
+        }
+
     return {
         'status': 'success',
-        'msg': f"{len(students_df)} öğrenci başarıyla eklendi."
+        'msg': f"{result['inserted']} öğrenci başarıyla eklendi."
     }
@@ -1,22 +1,98 @@
 import pymysql
 from dotenv import load_dotenv
+import logging
 import os
+import threading
+
+from Backend.src.DataBase.src.connection_pool import ConnectionPool, PooledConnection
+
+logger = logging.getLogger(__name__)
 
 ENV_PATH = '../../../../.env'
 
 load_dotenv(ENV_PATH)
 
-def get_database() -> pymysql.connections.Connection:
+# Havuz ayarları; süreler saniye cinsinden
+POOL_MIN_SIZE = int(os.getenv("MYSQL_POOL_MIN_SIZE", "2"))
+POOL_MAX_SIZE = int(os.getenv("MYSQL_POOL_MAX_SIZE", "20"))
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("MYSQL_POOL_TIMEOUT", "10"))
+POOL_RECYCLE = float(os.getenv("MYSQL_POOL_RECYCLE", "1800"))
+POOL_PING_INTERVAL = float(os.getenv("MYSQL_POOL_PING_INTERVAL", "30"))
+# LOAD DATA LOCAL INFILE için istemci izni (sunucuda da local_infile açık olmalı)
+LOCAL_INFILE = os.getenv("MYSQL_LOCAL_INFILE", "0") == "1"
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _connect() -> pymysql.connections.Connection:
     try:
-        connection = pymysql.connect(
+        return pymysql.connect(
             host=os.getenv('MYSQL_HOST'),
             user=os.getenv("MYSQL_USER"),
             password=os.getenv("MYSQL_PASSWORD"),
             database=os.getenv("MYSQL_DATABASE"),
             port=3306,
-            autocommit=True
+            autocommit=True,
+            local_infile=LOCAL_INFILE
         )
     except pymysql.MySQLError as e:
         print(f"Error connecting to database: {e}")
         raise
-    return connection
\ No newline at end of file
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _connect,
+                    min_size=POOL_MIN_SIZE,
+                    max_size=POOL_MAX_SIZE,
+                    acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+                    recycle=POOL_RECYCLE,
+                    ping_interval=POOL_PING_INTERVAL
+                )
+    return _pool
+
+
+def _reset_pool_after_fork():
+    # 🔹 fork anında başka bir iş parçacığının tuttuğu kilitler çocukta bırakılmaz
+    global _pool_lock
+    _pool_lock = threading.Lock()
+    if _pool is not None:
+        _pool._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+def get_database() -> PooledConnection:
+    """
+    Havuzdan bir bağlantı alır. Çağıranlar eskisi gibi
+    `with get_database() as db:` kullanır; blok bitince bağlantı kapatılmaz,
+    havuza geri verilir.
+    """
+    return get_pool().acquire()
+
+
+def prewarm_database_pool() -> int:
+    """Uygulama açılışında havuzu min_size bağlantıya tamamlar; veritabanı yoksa açılış engellenmez."""
+    try:
+        opened = get_pool().prewarm()
+    except pymysql.MySQLError as e:
+        logger.warning(f"Veritabanı havuzu önceden ısıtılamadı: {e}")
+        return 0
+    logger.info(f"Veritabanı havuzunda {opened} bağlantı açıldı")
+    return opened
+
+
+def close_database_pool():
+    if _pool is not None:
+        _pool.close()
+
+
+def database_pool_statistics() -> dict:
+    return get_pool().statistics()
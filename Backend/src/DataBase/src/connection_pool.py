@@ -0,0 +1,287 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+import pymysql
+from pymysql.constants import SERVER_STATUS
+
+logger = logging.getLogger(__name__)
+
+# Bağlantı düzeyindeki hatalar; bunlardan sonra bağlantı havuza geri konmaz
+CONNECTION_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError, OSError)
+
+
+class PoolTimeout(pymysql.err.OperationalError):
+    """acquire_timeout içinde boş bağlantı bulunamadı."""
+
+
+class _PooledRaw:
+    __slots__ = ("connection", "created_at", "last_used")
+
+    def __init__(self, connection: pymysql.connections.Connection):
+        self.connection = connection
+        self.created_at = self.last_used = time.monotonic()
+
+
+class PooledConnection:
+    """
+    Havuzdan alınmış bir bağlantı. pymysql.Connection gibi kullanılır
+    (cursor, commit, rollback ...); with bloğundan çıkınca ya da close()
+    çağrılınca bağlantı kapatılmaz, havuza geri verilir. Blok bir hatayla
+    biterse açık işlem geri alınır.
+    """
+    __slots__ = ("_pool", "_raw")
+
+    def __init__(self, pool: "ConnectionPool", raw: _PooledRaw):
+        self._pool = pool
+        self._raw = raw
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release(exc)
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise pymysql.err.InterfaceError(0, "Connection already returned to the pool")
+        return getattr(self._raw.connection, name)
+
+    def close(self):
+        self._release(None)
+
+    def _release(self, exc: BaseException | None):
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw, exc)
+
+
+class ConnectionPool:
+    """
+    Süreç genelinde MySQL bağlantı havuzu.
+
+    En fazla max_size bağlantı açılır; prewarm ile baştan min_size bağlantı
+    açılır. Boş bağlantı yoksa ve sınıra ulaşıldıysa acquire_timeout saniye
+    beklenir, sonra PoolTimeout fırlatılır. recycle saniyeden yaşlı bağlantılar
+    kapatılıp yenilenir; ping_interval saniyeden uzun süre boşta kalan
+    bağlantılar verilmeden önce ping ile denetlenir. fork sonrası çocuk süreç
+    ebeveynin soketlerini kullanmaz, kendi bağlantılarını açar.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], pymysql.connections.Connection],
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 10.0,
+        recycle: float = 3600.0,
+        ping_interval: float = 30.0
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._connect = connect
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self._reset_state()
+
+    def _reset_state(self):
+        self._pid = os.getpid()
+        self._condition = threading.Condition(threading.Lock())
+        # Son verilen bağlantı ilk alınır (LIFO); sık kullanılanlar sıcak kalır
+        self._idle: deque[_PooledRaw] = deque()
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._stats = {
+            "acquired": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "timeouts": 0,
+            "max_in_use": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    def _after_fork(self):
+        # 🔹 Ebeveynin soketlerine QUIT gönderilmez; yalnızca çocuktaki kopyalar bırakılır
+        for raw in self._idle:
+            self._force_close(raw)
+        self._reset_state()
+
+    @staticmethod
+    def _force_close(raw: _PooledRaw):
+        try:
+            raw.connection._force_close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _close(raw: _PooledRaw):
+        try:
+            raw.connection.close()
+        except Exception:
+            pass
+
+    def _open(self) -> _PooledRaw:
+        raw = _PooledRaw(self._connect())
+        with self._condition:
+            self._stats["created"] += 1
+        return raw
+
+    def _discard(self, raw: _PooledRaw, stat: str = "discarded"):
+        self._close(raw)
+        with self._condition:
+            self._size -= 1
+            self._stats[stat] += 1
+            self._condition.notify()
+
+    def _usable(self, raw: _PooledRaw) -> bool:
+        now = time.monotonic()
+        if self.recycle and now - raw.created_at > self.recycle:
+            self._discard(raw, "recycled")
+            return False
+        if self.ping_interval is not None and now - raw.last_used > self.ping_interval:
+            try:
+                raw.connection.ping(reconnect=False)
+            except Exception as e:
+                logger.warning(f"Havuzdaki MySQL bağlantısı yanıt vermiyor, yenileniyor: {e}")
+                self._discard(raw)
+                return False
+        return True
+
+    def acquire(self, timeout: float | None = None) -> PooledConnection:
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            raw = None
+            with self._condition:
+                if self._closed:
+                    raise pymysql.err.InterfaceError(0, "Connection pool is closed")
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(
+                            2013, f"No database connection available within {timeout:.1f}s "
+                            f"(pool size {self.max_size}, in use {self._in_use})"
+                        )
+                    self._condition.wait(remaining)
+                if self._idle:
+                    raw = self._idle.pop()
+                else:
+                    self._size += 1
+                # 🔹 Bağlantı kilit dışında açılır/denetlenir; bekleyenler bu sırada engellenmez
+                self._in_use += 1
+
+            if raw is None:
+                try:
+                    raw = self._open()
+                except BaseException:
+                    with self._condition:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._condition.notify()
+                    raise
+            elif not self._usable(raw):
+                with self._condition:
+                    self._in_use -= 1
+                continue
+
+            waited = time.monotonic() - started
+            with self._condition:
+                stats = self._stats
+                stats["acquired"] += 1
+                stats["wait_total"] += waited
+                stats["wait_max"] = max(stats["wait_max"], waited)
+                stats["max_in_use"] = max(stats["max_in_use"], self._in_use)
+            return PooledConnection(self, raw)
+
+    def release(self, raw: _PooledRaw, exc: BaseException | None = None):
+        if self._pid != os.getpid():
+            # Çocuk süreç ebeveynden kalan bir bağlantıyı geri veriyor; havuza ait değil
+            self._force_close(raw)
+            return
+
+        connection = raw.connection
+        reusable = not isinstance(exc, CONNECTION_ERRORS) and connection.open
+        if reusable:
+            try:
+                # 🔹 Yarıda kalan okuma ya da açık işlem bir sonraki kullanıcıya taşınmaz
+                result = getattr(connection, "_result", None)
+                if result is not None and getattr(result, "unbuffered_active", False):
+                    reusable = False
+                elif exc is not None or connection.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                    connection.rollback()
+            except Exception:
+                reusable = False
+
+        with self._condition:
+            self._in_use -= 1
+            if reusable and not self._closed:
+                raw.last_used = time.monotonic()
+                self._idle.append(raw)
+                self._condition.notify()
+                return
+        self._discard(raw)
+
+    def prewarm(self) -> int:
+        """Havuzu min_size boş bağlantıya tamamlar; açılan bağlantı sayısını döner."""
+        if self._pid != os.getpid():
+            self._after_fork()
+        opened = 0
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size or self._size >= self.max_size:
+                    return opened
+                self._size += 1
+            try:
+                raw = self._open()
+            except BaseException:
+                with self._condition:
+                    self._size -= 1
+                raise
+            with self._condition:
+                self._idle.append(raw)
+                self._condition.notify()
+            opened += 1
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for raw in idle:
+            self._close(raw)
+
+    def statistics(self) -> dict:
+        with self._condition:
+            stats = dict(self._stats)
+            acquired = stats["acquired"]
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "acquired": acquired,
+                "created": stats["created"],
+                "recycled": stats["recycled"],
+                "discarded": stats["discarded"],
+                "timeouts": stats["timeouts"],
+                "max_in_use": stats["max_in_use"],
+                "wait_avg_ms": round(stats["wait_total"] / acquired * 1000, 3) if acquired else 0.0,
+                "wait_max_ms": round(stats["wait_max"] * 1000, 3),
+            }
@@ -0,0 +1,180 @@
+import argparse
+import hashlib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import List
+
+import pymysql
+
+from Backend.src.DataBase.src.Database_connection import get_database
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+# Dosya adı: <sürüm>_<ad>.sql, örn. 0001_department_indexes.sql
+MIGRATION_FILE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+MIGRATION_LOCK = "schema_migrations"
+MIGRATION_LOCK_TIMEOUT = 60
+
+SCHEMA_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        execution_ms INT NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_turkish_ci
+"""
+
+# Nesne zaten var / zaten yok hataları: yarıda kalmış bir göç tekrar
+# çalıştırıldığında uygulanmış ifadeler atlanır
+ALREADY_APPLIED_ERRORS = {
+    1050,  # ER_TABLE_EXISTS_ERROR
+    1060,  # ER_DUP_FIELDNAME
+    1061,  # ER_DUP_KEYNAME
+    1091,  # ER_CANT_DROP_FIELD_OR_KEY
+    1826,  # ER_FK_DUP_NAME
+}
+
+
+class MigrationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    sql: str
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    @property
+    def statements(self) -> List[str]:
+        return split_statements(self.sql)
+
+
+def split_statements(sql: str) -> List[str]:
+    """'--' yorum satırlarını atar ve ';' ile biten ifadelere böler."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = {}
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}: {filename}")
+        with open(os.path.join(directory, filename), encoding="utf-8") as file:
+            migrations[version] = Migration(version, match.group(2), file.read())
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def applied_migrations(cursor) -> dict:
+    cursor.execute(SCHEMA_VERSION_TABLE)
+    cursor.execute("SELECT version, checksum FROM schema_version")
+    return dict(cursor.fetchall())
+
+
+def _apply(cursor, migration: Migration):
+    started = time.perf_counter()
+    for statement in migration.statements:
+        try:
+            cursor.execute(statement)
+        except pymysql.err.MySQLError as e:
+            if e.args and e.args[0] in ALREADY_APPLIED_ERRORS:
+                logger.info(f"Göç {migration.version}: zaten uygulanmış ifade atlandı ({e.args[1]})")
+                continue
+            raise MigrationError(f"Migration {migration.version}_{migration.name} failed: {e}") from e
+    cursor.execute(
+        "INSERT INTO schema_version (version, name, checksum, execution_ms) VALUES (%s, %s, %s, %s)",
+        (migration.version, migration.name, migration.checksum, int((time.perf_counter() - started) * 1000))
+    )
+
+
+def migrate(target: int | None = None, directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Uygulanmamış göçleri sürüm sırasıyla uygular ve schema_version tablosuna
+    yazar; uygulananların listesini döner. Birden çok süreç aynı anda
+    çalıştırırsa GET_LOCK ile sırayla çalışırlar. Uygulanmış bir göç dosyası
+    sonradan değiştirilmişse MigrationError fırlatılır.
+    """
+    migrations = [m for m in load_migrations(directory) if target is None or m.version <= target]
+    applied = []
+
+    with get_database() as db:
+        with db.cursor() as cursor:
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (MIGRATION_LOCK, MIGRATION_LOCK_TIMEOUT))
+            if cursor.fetchone()[0] != 1:
+                raise MigrationError("Could not acquire the migration lock.")
+            try:
+                done = applied_migrations(cursor)
+                for migration in migrations:
+                    if migration.version in done:
+                        if done[migration.version] != migration.checksum:
+                            raise MigrationError(
+                                f"Migration {migration.version}_{migration.name} was modified after it was applied."
+                            )
+                        continue
+                    # 🔹 DDL MySQL'de örtük commit yapar; her göç ayrı ayrı kaydedilir
+                    _apply(cursor, migration)
+                    applied.append(migration)
+                    logger.info(f"Göç uygulandı: {migration.version}_{migration.name}")
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+                cursor.fetchone()
+
+    return applied
+
+
+def migration_status(directory: str = MIGRATIONS_DIR) -> List[dict]:
+    with get_database() as db:
+        with db.cursor() as cursor:
+            done = applied_migrations(cursor)
+    return [
+        {
+            "version": m.version,
+            "name": m.name,
+            "status": ("modified" if done[m.version] != m.checksum else "applied") if m.version in done else "pending"
+        }
+        for m in load_migrations(directory)
+    ]
+
+
+def migrate_on_startup():
+    """MYSQL_MIGRATE_ON_STARTUP=0 değilse bekleyen göçleri uygular; hata açılışı engellemez."""
+    if os.getenv("MYSQL_MIGRATE_ON_STARTUP", "1") == "0":
+        return
+    try:
+        migrate()
+    except Exception as e:
+        logger.warning(f"Veritabanı göçleri uygulanamadı: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Veritabanı şema göçleri")
+    parser.add_argument("command", choices=["migrate", "status"], nargs="?", default="migrate")
+    parser.add_argument("--target", type=int, default=None, help="Bu sürüme kadar uygula")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "status":
+        for row in migration_status():
+            print(f"{row['version']:04d} {row['name']}: {row['status']}")
+        return
+
+    applied = migrate(args.target)
+    print(f"{len(applied)} göç uygulandı." if applied else "Şema güncel.")
+
+
+if __name__ == "__main__":
+    main()
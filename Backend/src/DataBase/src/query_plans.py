@@ -0,0 +1,242 @@
+import contextlib
+import io
+import logging
+import sys
+from dataclasses import dataclass
+from typing import Callable, List
+
+import pandas as pd
+from pymysql.cursors import DictCursor
+
+from Backend.src.DataBase.src.Database_connection import get_database
+from Backend.src.DataBase.src.structures.classrooms import Classroom
+from Backend.src.DataBase.src.structures.user import User
+from Backend.src.DataBase.src.utils import (
+    class_list_menu, delete_classes, delete_classroom, delete_stutent_list, export_exam_schedule,
+    get_all_classrooms, get_departments, insert_exam_schedule, insert_students, read_exam_program,
+    search_classroom, student_list_menu, update_classroom
+)
+from Backend.src.services.Utils import get_current_role
+
+logger = logging.getLogger(__name__)
+
+# Sorguları izlenen modüller; get_database bu modüllerde geçici olarak değiştirilir
+TRACED_MODULES = [
+    class_list_menu, delete_classes, delete_classroom, delete_stutent_list, export_exam_schedule,
+    get_all_classrooms, get_departments, insert_exam_schedule, insert_students, read_exam_program,
+    search_classroom, student_list_menu, update_classroom, get_current_role
+]
+EXPLAINED_VERBS = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclass
+class QueryPlan:
+    name: str
+    sql: str
+    rows: list
+    full_scan_ok: bool = False
+
+    @property
+    def full_scans(self) -> List[str]:
+        """İndeks kullanamayan tam tablo taramaları (type=ALL ve possible_keys boş)."""
+        return [
+            row["table"] for row in self.rows
+            if row.get("type") == "ALL" and not row.get("possible_keys")
+        ]
+
+
+@dataclass
+class _ExplainCursor:
+    """Sorguları çalıştırmaz; SELECT/UPDATE/DELETE için EXPLAIN planını kaydeder ve boş sonuç döner."""
+    cursor: object
+    plans: list
+    name: str
+    full_scan_ok: bool
+    rowcount: int = 0
+    lastrowid: int | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def execute(self, query, args=None):
+        sql = query.strip().rstrip(";")
+        if sql.split(None, 1)[0].upper() in EXPLAINED_VERBS:
+            self.cursor.execute(f"EXPLAIN {sql}", args)
+            self.plans.append(QueryPlan(self.name, sql, self.cursor.fetchall(), self.full_scan_ok))
+        return 0
+
+    def executemany(self, query, args):
+        return 0
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+
+@dataclass
+class _ExplainConnection:
+    connection: object
+    plans: list
+    name: str = ""
+    full_scan_ok: bool = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self, cursor_class=None):
+        return _ExplainCursor(self.connection.cursor(DictCursor), self.plans, self.name, self.full_scan_ok)
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@dataclass
+class _Call:
+    name: str
+    run: Callable[[], object]
+    full_scan_ok: bool = False
+
+
+@dataclass
+class _Samples:
+    department: str = "Bilgisayar Mühendisliği"
+    classroom_id: str = "D-101"
+    class_id: str = "BLM101"
+    student_num: int = 1
+
+
+def _samples(connection) -> _Samples:
+    """Planlar gerçekçi olsun diye örnek değerler veritabanından okunur."""
+    samples = _Samples()
+    with connection.cursor() as cursor:
+        for query, attribute in (
+            ("SELECT department FROM classes LIMIT 1", "department"),
+            ("SELECT classroom_id FROM classrooms LIMIT 1", "classroom_id"),
+            ("SELECT class_id FROM classes LIMIT 1", "class_id"),
+            ("SELECT student_num FROM students LIMIT 1", "student_num"),
+        ):
+            cursor.execute(query)
+            row = cursor.fetchone()
+            if row:
+                setattr(samples, attribute, row[0])
+    return samples
+
+
+def _calls(samples: _Samples) -> List[_Call]:
+    department = samples.department
+    classroom = Classroom(
+        classroom_id=samples.classroom_id, classroom_name=samples.classroom_id, department_name=department,
+        capacity=1, desks_per_row=1, desks_per_column=1, desk_structure="2"
+    )
+    exam_schedule = [{
+        "date": "2000-01-01", "exam_type": "Vize",
+        "exams": [{"classes": [{"id": samples.class_id, "name": samples.class_id, "year": 1, "start_time": 9.0, "end_time": 10.0}]}]
+    }]
+    students = pd.DataFrame([{
+        "student_num": samples.student_num, "name": "-", "surname": "-", "grade": 1,
+        "classes": [samples.class_id], "department": department
+    }])
+    return [
+        _Call("class_list_menu", lambda: class_list_menu.class_list_menu(department)),
+        _Call("class_list_menu (years)", lambda: class_list_menu.class_list_menu(department, True)),
+        _Call("class_dict_for_department", lambda: class_list_menu.class_dict_for_department(department)),
+        _Call("student_list_menu", lambda: student_list_menu.student_list_menu(samples.student_num)),
+        _Call("student_list_for_department", lambda: student_list_menu.student_list_for_department(department)),
+        _Call("get_all_classrooms", lambda: get_all_classrooms.get_all_classrooms(department)),
+        _Call("search_classroom", lambda: search_classroom.search_classroom(samples.classroom_id)),
+        _Call("update_classroom", lambda: update_classroom.update_classroom(classroom)),
+        _Call("delete_classroom", lambda: delete_classroom.delete_classroom(samples.classroom_id)),
+        _Call("delete_classes", lambda: delete_classes.delete_classes(department)),
+        _Call("delete_students", lambda: delete_stutent_list.delete_students(department)),
+        _Call("get_departments", lambda: get_departments.get_departments()),
+        _Call("get_current_role", lambda: get_current_role.get_current_role(
+            User(email="-", password="-", department=department))),
+        _Call("insert_students", lambda: insert_students.insert_students(students)),
+        _Call("insert_exam_schedule", lambda: insert_exam_schedule.insert_exam_schedule(exam_schedule)),
+        _Call("read_exam_schedule_by_department", lambda: read_exam_program.read_exam_schedule_by_department(department)),
+        _Call("export_exam_schedule", lambda: list(export_exam_schedule.iter_exam_schedule_sheets([department], ["Vize"]))),
+        # 🔹 Tüm bölümleri okuyan sorgular tabloların tamamını okumak zorundadır
+        _Call("read_exam_schedule_by_department (all)", lambda: read_exam_program.read_exam_schedule_by_department(), True),
+        _Call("export_exam_schedule (all)", lambda: list(export_exam_schedule.iter_exam_schedule_sheets()), True),
+    ]
+
+
+def _direct_queries() -> List[tuple]:
+    """Yardımcı fonksiyonların boş sonuçla ulaşamadığı sorgular: (ad, sql, parametreler)."""
+    return [
+        ("insert_exam_schedule block ids", insert_exam_schedule.SQL_BLOCK_IDS.format(placeholders="%s"), (1,)),
+    ]
+
+
+def collect_query_plans() -> List[QueryPlan]:
+    """
+    DataBase/src/utils içindeki fonksiyonları örnek değerlerle çağırır;
+    sorgular çalıştırılmaz, yalnızca EXPLAIN planları toplanır.
+    """
+    plans: List[QueryPlan] = []
+    with get_database() as db:
+        samples = _samples(db)
+        explain_db = _ExplainConnection(db, plans)
+        originals = {module: module.get_database for module in TRACED_MODULES}
+        try:
+            for module in TRACED_MODULES:
+                module.get_database = lambda: explain_db
+            for call in _calls(samples):
+                explain_db.name, explain_db.full_scan_ok = call.name, call.full_scan_ok
+                # Boş sonuçla çalışan fonksiyonların hata çıktıları gizlenir; planlar o ana kadar toplanmıştır
+                with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                    try:
+                        call.run()
+                    except Exception:
+                        pass
+        finally:
+            for module, original in originals.items():
+                module.get_database = original
+
+        for name, sql, params in _direct_queries():
+            _ExplainCursor(db.cursor(DictCursor), plans, name, False).execute(sql, params)
+    return plans
+
+
+def failing_plans(plans: List[QueryPlan]) -> List[QueryPlan]:
+    return [plan for plan in plans if plan.full_scans and not plan.full_scan_ok]
+
+
+def check_query_plans() -> List[QueryPlan]:
+    """İndeks kullanamadan tam tablo taraması yapan sorguları döner; liste boşsa tüm planlar temizdir."""
+    return failing_plans(collect_query_plans())
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO)
+    plans = collect_query_plans()
+    failures = failing_plans(plans)
+    for plan in plans:
+        mark = "FAIL" if plan in failures else "ok"
+        tables = ", ".join(f"{row.get('table')}:{row.get('type')}" for row in plan.rows)
+        print(f"[{mark}] {plan.name}: {tables}")
+    for plan in failures:
+        print(f"\n❌ {plan.name}: full table scan on {', '.join(plan.full_scans)}\n{plan.sql}")
+    print(f"\n{len(plans)} sorgu incelendi, {len(failures)} sorguda indeks kullanılamıyor.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+from typing import Dict, List
+from pydantic import BaseModel, Field
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+
+
+class ExamProgramRequest(BaseModel):
+    """Sunucuda sınav programı oluşturma isteği; alanlar ExamProgram ayarlarıdır."""
+    department: str | None = Field(default=None)
+    tarih_baslangic: str = Field(...)
+    tarih_bitis: str = Field(...)
+    haris_gunler: List[str] = Field(default_factory=list)
+    sinav_turu: str = Field(default="Vize")
+    varsayilan_sure: int = Field(default=75)
+    istisna_dersler: Dict[str, int] = Field(default_factory=dict)
+    bekleme_suresi: int = Field(default=15)
+    excluded_courses: List[str] = Field(default_factory=list)
+    exam_conflict: bool = Field(default=False)
+    start_time: float = Field(default=9.0)
+    end_time: float = Field(default=17.0)
+    scheduling_strategy: str = Field(default="greedy")
+    max_exams_per_student_per_day: int | None = Field(default=None)
+    seed: int = Field(default=0)
+    # Çoklu başlangıç (tohum sayısı ve saniye cinsinden süre); verilmezse tek çalıştırma
+    multi_start_runs: int | None = Field(default=None, ge=1)
+    multi_start_time_budget: float | None = Field(default=None, gt=0)
+    # Yerleştirmeden sonraki iyileştirme aşaması; ikisi de boşsa çalışmaz
+    improve_iterations: int = Field(default=0, ge=0)
+    improve_time_budget: float | None = Field(default=None, gt=0)
+
+    class Config:
+        extra = "ignore"
+
+    def to_exam_program(self) -> ExamProgram:
+        exam_program = ExamProgram()
+        exam_program.set_excluded_courses(list(self.excluded_courses))
+        exam_program.set_exam_conflict(self.exam_conflict)
+        exam_program.set_tarih_araligi(self.tarih_baslangic, self.tarih_bitis)
+        exam_program.set_haris_gunler(list(self.haris_gunler))
+        exam_program.set_sinav_turu(self.sinav_turu)
+        exam_program.set_varsayilan_sure(self.varsayilan_sure)
+        for ders, sure in self.istisna_dersler.items():
+            exam_program.set_istisna_ders(ders, sure)
+        exam_program.set_bekleme_suresi(self.bekleme_suresi)
+        exam_program.set_start_end_time(self.start_time, self.end_time)
+        exam_program.set_scheduling_strategy(self.scheduling_strategy)
+        exam_program.set_max_exams_per_student_per_day(self.max_exams_per_student_per_day)
+        exam_program.set_multi_start(self.multi_start_runs, self.multi_start_time_budget)
+        exam_program.set_improvement(self.improve_iterations, self.improve_time_budget)
+        return exam_program
+
+
+class JointExamProgramRequest(ExamProgramRequest):
+    """Birden fazla bölümün ortak derslik havuzuyla birlikte programlanması isteği."""
+    departments: List[str] = Field(...)
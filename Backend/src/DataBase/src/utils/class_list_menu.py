@@ -39,7 +39,32 @@ def class_list_menu(department: str, years_and_instructor=False) -> list[dict]:
         print(f"Error while fetching classes: {e}")
         return [], 'error', str(e)
     return classes, 'success', 'Classes fetched successfully.'
-            
 
-            
-            
\ No newline at end of file
+
+def class_dict_for_department(department: str) -> tuple[dict, str, str]:
+    """Sınav programı girdisi: {class_id: {class_id, class_name, year, instructor, students}}"""
+    class_dict = {}
+    classes_list, status, msg = class_list_menu(department, years_and_instructor=True)
+    if status == 'error':
+        return class_dict, status, msg
+
+    for cls in classes_list:
+        class_id = cls['class_id']
+
+        if class_id not in class_dict:
+            class_dict[class_id] = {
+                'class_id': class_id,
+                'class_name': cls['class_name'],
+                'year': cls.get('year', []),
+                'instructor': cls.get('teacher', ''),
+                'students': []
+            }
+
+        if cls['student_num']:
+            class_dict[class_id]['students'].append({
+                'student_num': cls['student_num'],
+                'name': cls['name'],
+                'surname': cls['surname']
+            })
+
+    return class_dict, 'success', msg
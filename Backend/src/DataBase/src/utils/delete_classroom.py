@@ -1,6 +1,7 @@
 from Backend.src.DataBase.src.Database_connection import get_database
 from typing import Union, List
 import pymysql
+from Backend.src.utils.exams.seat_maps import invalidate_classrooms
 
 def delete_classroom(classroom_id: Union[List[str], str]) -> None:
     try:
@@ -15,5 +16,6 @@ def delete_classroom(classroom_id: Union[List[str], str]) -> None:
                     cursor.execute(sql, (classroom_id,))
     except Exception as e:
         return 'error', str(e)
+    invalidate_classrooms(classroom_id if isinstance(classroom_id, List) else [classroom_id])
     return 'success', 'Classroom updated successfully.'                
     
\ No newline at end of file
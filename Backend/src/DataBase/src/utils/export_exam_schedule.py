@@ -0,0 +1,69 @@
+from itertools import groupby
+from typing import Iterator, List
+
+from pymysql.cursors import SSDictCursor
+
+from Backend.src.DataBase.src.Database_connection import get_database
+from Backend.src.utils.exams.schedule_export import ScheduleSheet, format_time, sheet_title
+
+# Satırlar sayfa sırasında gelir (bölüm, sınav türü), her sayfada tarih ve saate göre
+EXPORT_QUERY = """
+    SELECT
+        cl.department AS department,
+        s.exam_type,
+        s.date,
+        b.exam_start_time,
+        b.name,
+        b.instructor,
+        GROUP_CONCAT(c.classroom_name ORDER BY ec.id SEPARATOR ', ') AS classrooms
+    FROM exam_block b
+    JOIN exam_schedules s ON s.id = b.schedule_id
+    JOIN classes cl ON cl.class_id = b.class_id
+    LEFT JOIN exam_classrooms ec ON ec.exam_id = b.id
+    LEFT JOIN classrooms c ON c.classroom_id = ec.classroom_id
+    {where}
+    GROUP BY b.id, s.id, cl.id
+    ORDER BY cl.department, s.exam_type, s.date, b.exam_start_time, b.name
+"""
+
+
+def _export_query(departments: List[str] | None, exam_types: List[str] | None) -> tuple[str, list]:
+    conditions, params = [], []
+    if departments:
+        conditions.append(f"cl.department IN ({', '.join(['%s'] * len(departments))})")
+        params.extend(departments)
+    if exam_types:
+        conditions.append(f"s.exam_type IN ({', '.join(['%s'] * len(exam_types))})")
+        params.extend(exam_types)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return EXPORT_QUERY.format(where=where), params
+
+
+def iter_exam_schedule_sheets(
+    departments: List[str] | None = None,
+    exam_types: List[str] | None = None
+) -> Iterator[ScheduleSheet]:
+    """
+    Kayıtlı sınav programını (bölüm, sınav türü) başına bir sayfa olarak üretir.
+    Satırlar sunucu taraflı imleçten (SSDictCursor) okundukça sayfaya akar;
+    tablo bellekte tutulmaz. Sayfalar sırayla tüketilmelidir ve bağlantı
+    üreteç bitene kadar açık kalır.
+    """
+    query, params = _export_query(departments, exam_types)
+    with get_database() as db:
+        with db.cursor(SSDictCursor) as cursor:
+            cursor.execute(query, params)
+            for (department, exam_type), records in groupby(
+                cursor, key=lambda record: (record["department"], record["exam_type"])
+            ):
+                rows = (
+                    (
+                        record["date"].isoformat(),
+                        format_time(record["exam_start_time"]),
+                        record["name"],
+                        record["instructor"] or "N/A",
+                        record["classrooms"] or "-"
+                    )
+                    for record in records
+                )
+                yield ScheduleSheet(f"{department} {exam_type}", sheet_title(department, exam_type), rows)
@@ -1,5 +1,6 @@
 from Backend.src.DataBase.src.Database_connection import get_database
 from Backend.src.DataBase.src.structures.classrooms import Classroom
+from Backend.src.utils.exams.seat_maps import cache_classroom
 
 def insert_classroom_to_db(classroom: Classroom):
     try:
@@ -27,4 +28,6 @@ def insert_classroom_to_db(classroom: Classroom):
                 ))
     except Exception as e:
         return 'error', str(e)
+    # 🔹 Oturma şablonu ve gerçek koltuk sayısı bir kez hesaplanır
+    cache_classroom(classroom.model_dump())
     return 'success', 'Classroom inserted/updated successfully.'
\ No newline at end of file
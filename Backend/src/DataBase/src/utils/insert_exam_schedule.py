@@ -1,137 +1,240 @@
 from Backend.src.DataBase.src.Database_connection import get_database
-from joblib import Parallel, delayed
-from datetime import datetime
-import json
-
-def _insert_single_class(schedule_id, day_date, cls):
+from Backend.src.utils.exams.seating_grid import seating_grid
+from dataclasses import dataclass, field
+import csv
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Bu kadar ve daha fazla oturma satırı LOAD DATA LOCAL INFILE ile yazılır
+# (MYSQL_LOCAL_INFILE=1 gerekir); sunucu izin vermezse executemany ile
+# devam edilir. 0: kapalı
+SEATING_LOAD_DATA_MIN_ROWS = int(os.getenv("SEATING_LOAD_DATA_MIN_ROWS", "0"))
+
+SQL_SCHEDULE = """
+    INSERT INTO exam_schedules (date, exam_type) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE id = id
+"""
+SQL_BLOCK = """
+    INSERT INTO exam_block
+    (schedule_id, class_id, name, year, exam_start_time, exam_end_time, duration, instructor, student_count)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+SQL_ROOM = "INSERT INTO exam_classrooms (exam_id, classroom_id) VALUES (%s, %s)"
+SQL_STUDENT = "INSERT INTO exam_students (exam_id, student_num) VALUES (%s, %s)"
+SQL_SEATING = """
+    INSERT INTO exam_seating_plan
+    (exam_id, classroom_id, student_num, `row_number`, `column_number`)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+SQL_BLOCK_IDS = """
+    SELECT id, schedule_id, class_id, exam_start_time, exam_end_time FROM exam_block
+    WHERE schedule_id IN ({placeholders})
+"""
+SQL_SEATING_LOAD = """
+    LOAD DATA LOCAL INFILE %s INTO TABLE exam_seating_plan
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n'
+    (exam_id, classroom_id, student_num, `row_number`, `column_number`)
+"""
+
+
+def to_time(val) -> str:
+    if isinstance(val, str):
+        return val
     try:
-        with get_database() as db:
-            with db.cursor() as cursor:
-                sql_block = """
-                    INSERT INTO exam_block 
-                    (schedule_id, class_id, name, year, exam_start_time, exam_end_time, duration, instructor, student_count)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                sql_room = "INSERT INTO exam_classrooms (exam_id, classroom_id) VALUES (%s, %s)"
-                sql_student = "INSERT INTO exam_students (exam_id, student_num) VALUES (%s, %s)"
-                sql_seating = """
-                    INSERT INTO exam_seating_plan 
-                    (exam_id, classroom_id, student_num, `row_number`, `column_number`)
-                    VALUES (%s, %s, %s, %s, %s)
-                """
-
-
-                def to_time(val):
-                    if isinstance(val, str):
-                        return val  
-                    try:
-                        h = int(val)
-                        m = int(round((val - h) * 60))
-                        return f"{h:02d}:{m:02d}:00"
-                    except Exception:
-                        return "00:00:00"
-
-                start_t = to_time(cls.get("start_time", 0))
-                end_t = to_time(cls.get("end_time", 0))
-
-                cursor.execute(sql_block, (
-                    schedule_id,
-                    cls.get("id"),
-                    cls.get("name"),
-                    cls.get("year"),
-                    start_t,
-                    end_t,
-                    cls.get("duration", 0),
-                    cls.get("instructor", "N/A"),
-                    cls.get("student_count", 0)
-                ))
-                exam_id = cursor.lastrowid
-
-                for room in cls.get("classrooms", []):
-                    classroom_id = room.get("classroom_id") or room.get("id")
-                    if classroom_id:
-                        cursor.execute(sql_room, (exam_id, classroom_id))
-
-                for student in cls.get("students", []):
-                    s_num = student.get("student_num")
-                    if s_num:
-                        cursor.execute(sql_student, (exam_id, s_num))
-
-                for classroom_name, grid in cls.get("seating_plan", {}).items():
-                    for key, student_obj in grid.items():
-                        try:
-                            if isinstance(key, str) and "," in key:
-                                r, c = map(int, key.split(","))
-                            elif isinstance(key, tuple):
-                                r, c = key
-                            else:
-                                continue
-                            if isinstance(student_obj, dict) and student_obj.get("student_num"):
-                                cursor.execute(sql_seating, (
-                                    exam_id,
-                                    classroom_name,
-                                    student_obj["student_num"],
-                                    r,
-                                    c
-                                ))
-                        except Exception as se:
-                            print(f"[WARN] seating insert skipped: {se}")
-
-        return {"status": "ok", "class": cls.get('name'), "date": day_date}
-
-    except Exception as e:
-        return {"status": "error", "error": str(e), "class": cls.get("name")}
-
-
-def insert_exam_schedule(exam_schedule, n_jobs: int = 4):
+        h = int(val)
+        m = int(round((val - h) * 60))
+        return f"{h:02d}:{m:02d}:00"
+    except Exception:
+        return "00:00:00"
+
+
+def _time_key(val) -> int:
+    """'HH:MM[:SS]' metni ya da TIME sütunundan gelen timedelta -> saniye."""
+    if hasattr(val, "total_seconds"):
+        return int(val.total_seconds())
+    parts = [int(float(p)) for p in str(val).split(":")] + [0, 0]
+    return parts[0] * 3600 + parts[1] * 60 + parts[2]
+
+
+def _date_key(val) -> str:
+    return str(val)[:10]
+
+
+@dataclass
+class ExamScheduleRows:
+    """
+    Programın tüm satırları. Sınav blokları henüz id'siz olduğundan alt
+    tablolardaki satırlar bloğun sırasını (block_index) taşır.
+    """
+    days: dict = field(default_factory=dict)        # tarih -> (tarih, sınav türü)
+    blocks: list = field(default_factory=list)      # (tarih, class_id, ad, yıl, başlangıç, bitiş, süre, hoca, öğrenci sayısı)
+    rooms: list = field(default_factory=list)       # (block_index, classroom_id)
+    students: list = field(default_factory=list)    # (block_index, student_num)
+    seating: list = field(default_factory=list)     # (block_index, classroom_id, student_num, satır, sütun)
+
+
+def collect_exam_rows(exam_schedule) -> ExamScheduleRows:
+    rows = ExamScheduleRows()
+
+    for day in exam_schedule:
+        day_date = day.get("date")
+        exams = day.get("exams", [])
+        classes = [cls for exam in exams for cls in exam.get("classes", [])]
+        if not classes:
+            logger.warning(f"⚠️ {day_date} tarihinde eklenebilecek ders yok.")
+            continue
+        rows.days.setdefault(_date_key(day_date), (day_date, day.get("exam_type", "N/A")))
+
+        for cls in classes:
+            block_index = len(rows.blocks)
+            rows.blocks.append((
+                _date_key(day_date),
+                cls.get("id"),
+                cls.get("name"),
+                cls.get("year"),
+                to_time(cls.get("start_time", 0)),
+                to_time(cls.get("end_time", 0)),
+                cls.get("duration", 0),
+                cls.get("instructor", "N/A"),
+                cls.get("student_count", 0)
+            ))
+
+            for room in cls.get("classrooms", []):
+                classroom_id = room.get("classroom_id") or room.get("id")
+                if classroom_id:
+                    rows.rooms.append((block_index, classroom_id))
+
+            for student in cls.get("students", []):
+                s_num = student.get("student_num")
+                if s_num:
+                    rows.students.append((block_index, s_num))
+
+            for classroom_id, grid_data in cls.get("seating_plan", {}).items():
+                try:
+                    grid = seating_grid(grid_data, classroom_id)
+                except Exception as se:
+                    logger.warning(f"[WARN] seating insert skipped ({cls.get('name')}, {classroom_id}): {se}")
+                    continue
+                if grid is None:
+                    continue
+                rows.seating.extend(
+                    (block_index, classroom_id, student_num, r, c)
+                    for r, c, student_num in grid.iter_seats() if student_num
+                )
+
+    return rows
+
+
+def _schedule_ids(cursor, days: dict) -> dict:
+    """
+    Günleri ekler ve tarih -> schedule_id eşlemesini tek sorguda okur.
+
+    Tarih zaten varsa satır değiştirilmez, var olan gün kullanılır. Var olan
+    günün sınav türü farklıysa (ör. aynı tarihte Vize varken Final yazılmak
+    isteniyorsa) ValueError fırlatılır ve işlem geri alınır; sınav türü
+    belirtilmemiş ("N/A") günler var olan türe katılır.
+    """
+    cursor.executemany(SQL_SCHEDULE, list(days.values()))
+    dates = list(days)
+    cursor.execute(
+        f"SELECT id, date, exam_type FROM exam_schedules WHERE date IN ({', '.join(['%s'] * len(dates))})",
+        dates
+    )
+    existing = {_date_key(day_date): (schedule_id, exam_type) for schedule_id, day_date, exam_type in cursor.fetchall()}
+    missing = [d for d in dates if d not in existing]
+    if missing:
+        raise ValueError(f"schedule_id alınamadı ({', '.join(missing)})")
+
+    conflicts = [
+        f"{d} ({existing[d][1]} != {days[d][1]})"
+        for d in dates if days[d][1] not in ("N/A", existing[d][1])
+    ]
+    if conflicts:
+        raise ValueError(f"Tarih başka bir sınav türüyle kayıtlı: {', '.join(conflicts)}")
+    return {d: existing[d][0] for d in dates}
+
+
+def _block_ids(cursor, blocks: list, schedule_ids: dict) -> list:
+    """
+    Blokları çok satırlı INSERT ile ekler ve id'lerini tekil anahtardan
+    (schedule_id, class_id, başlangıç, bitiş) tek sorguda çözer; ardışık
+    AUTO_INCREMENT değerlerine güvenilmez.
+    """
+    block_rows = [(schedule_ids[block[0]],) + block[1:] for block in blocks]
+    cursor.executemany(SQL_BLOCK, block_rows)
+
+    ids = sorted(set(schedule_ids.values()))
+    cursor.execute(SQL_BLOCK_IDS.format(placeholders=', '.join(['%s'] * len(ids))), ids)
+    by_key = {
+        (schedule_id, class_id, _time_key(start), _time_key(end)): exam_id
+        for exam_id, schedule_id, class_id, start, end in cursor.fetchall()
+    }
+    return [by_key[(row[0], row[1], _time_key(row[4]), _time_key(row[5]))] for row in block_rows]
+
+
+def _load_seating(cursor, seating_rows: list) -> bool:
+    """Oturma satırlarını LOAD DATA LOCAL INFILE ile yazar; sunucu izin vermezse False döner."""
+    fd, path = tempfile.mkstemp(suffix=".tsv")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file, delimiter="\t", lineterminator="\n", quoting=csv.QUOTE_NONE, escapechar="\\").writerows(seating_rows)
+        try:
+            cursor.execute(SQL_SEATING_LOAD, (path,))
+        except Exception as e:
+            # Hata yalnızca bu ifadeyi geri alır; işlem executemany ile sürer
+            logger.warning(f"LOAD DATA LOCAL INFILE kullanılamadı, executemany ile devam ediliyor: {e}")
+            return False
+        return True
+    finally:
+        os.remove(path)
+
+
+def write_exam_rows(db, rows: ExamScheduleRows):
+    with db.cursor() as cursor:
+        schedule_ids = _schedule_ids(cursor, rows.days)
+        exam_ids = _block_ids(cursor, rows.blocks, schedule_ids)
+
+        cursor.executemany(SQL_ROOM, [(exam_ids[i], classroom_id) for i, classroom_id in rows.rooms])
+        cursor.executemany(SQL_STUDENT, [(exam_ids[i], s_num) for i, s_num in rows.students])
+
+        seating_rows = [(exam_ids[seat[0]],) + seat[1:] for seat in rows.seating]
+        if not (SEATING_LOAD_DATA_MIN_ROWS and len(seating_rows) >= SEATING_LOAD_DATA_MIN_ROWS
+                and _load_seating(cursor, seating_rows)):
+            cursor.executemany(SQL_SEATING, seating_rows)
+
+
+def insert_exam_schedule(exam_schedule) -> dict:
+    """
+    Programın tüm günlerini, sınav bloklarını, dersliklerini, öğrencilerini
+    ve oturma planlarını tek bir işlemde toplu olarak yazar; herhangi bir
+    satır başarısız olursa hiçbir şey kaydedilmez. Aynı tarih başka bir
+    programda zaten varsa o gün kullanılır; günün sınav türü farklıysa
+    program reddedilir (bkz. _schedule_ids).
+    """
     try:
-        
-        all_results = []
-
-        for day in exam_schedule:
-            day_date = day.get("date")
-            exam_type = day.get("exam_type", "N/A")
-            exams = day.get("exams", [])
-
-            with get_database() as db:
-                with db.cursor() as cursor:
-                    cursor.execute(
-                        "INSERT INTO exam_schedules (date, exam_type) VALUES (%s, %s)",
-                        (day_date, exam_type)
-                    )
-                    db.commit()
-                    cursor.execute("SELECT id FROM exam_schedules WHERE date = %s", (day_date,))
-                    schedule_id_row = cursor.fetchone()
-                    if not schedule_id_row:
-                        raise ValueError(f"schedule_id alınamadı ({day_date})")
-                    schedule_id = schedule_id_row[0]
-
-            all_classes = []
-            for exam in exams:
-                for cls in exam.get("classes", []):
-                    all_classes.append(cls)
-
-            if not all_classes:
-                print(f"⚠️ {day_date} tarihinde eklenebilecek ders yok.")
-                continue
-
-            results = Parallel(n_jobs=n_jobs)(
-                delayed(_insert_single_class)(schedule_id, day_date, cls)
-                for cls in all_classes
-            )
-            all_results.extend(results)
-
-        errors = [r for r in all_results if r["status"] == "error"]
-        if errors:
-            print(f"❌ {len(errors)} hata oluştu:")
-            for e in errors[:5]:
-                print(" -", e)
-            return {"status": "error", "message": errors}
-
-        print(f"✅ {len(all_results)} sınıf başarıyla eklendi.")
-        return {"status": "success", "message": f"{len(all_results)} class inserted."}
+        rows = collect_exam_rows(exam_schedule)
+        if not rows.blocks:
+            return {"status": "success", "message": "0 class inserted."}
+
+        with get_database() as db:
+            db.begin()
+            try:
+                write_exam_rows(db, rows)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        logger.info(
+            f"✅ {len(rows.blocks)} sınıf eklendi ({len(rows.rooms)} derslik, "
+            f"{len(rows.students)} öğrenci, {len(rows.seating)} oturma satırı)"
+        )
+        return {"status": "success", "message": f"{len(rows.blocks)} class inserted."}
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Sınav programı kaydedilemedi: {e}")
         return {"status": "error", "message": str(e)}
@@ -1,58 +1,112 @@
 from Backend.src.DataBase.src.Database_connection import get_database
-from joblib import Parallel, delayed
+import logging
 import pandas as pd
 
-def _insert_single_student(student_info):
+logger = logging.getLogger(__name__)
+
+STUDENT_COLUMNS = ['student_num', 'name', 'surname', 'grade', 'department']
+
+SQL_STUDENT = """
+    INSERT INTO students (student_num, name, surname, grade, department)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        name = VALUES(name),
+        surname = VALUES(surname),
+        grade = VALUES(grade),
+        department = VALUES(department)
+"""
+SQL_STUDENT_CLASS = """
+    INSERT INTO student_classes (student_num, class_id)
+    VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE class_id = VALUES(class_id)
+"""
+
+
+def _error(student, message: str) -> dict:
+    return {"status": "error", "student": student, "error": message}
+
+
+def student_rows(students: pd.DataFrame) -> tuple[pd.DataFrame, list]:
+    """Eksik ya da geçersiz alanı olan satırları ayıklar; (geçerli öğrenciler, hatalar) döner."""
+    df = students.reindex(columns=STUDENT_COLUMNS + ['classes']).reset_index(drop=True)
+    df['student_num'] = pd.to_numeric(df['student_num'], errors='coerce')
+    df['grade'] = pd.to_numeric(df['grade'], errors='coerce')
+
+    invalid = df[STUDENT_COLUMNS].isna()
+    bad_rows = invalid.any(axis=1)
+    errors = [
+        _error(None if pd.isna(num) else int(num), f"Missing or invalid field(s): {', '.join(invalid.columns[mask])}")
+        for num, mask in zip(df.loc[bad_rows, 'student_num'], invalid[bad_rows].to_numpy())
+    ]
+
+    valid = df[~bad_rows].copy()
+    valid['student_num'] = valid['student_num'].astype('int64')
+    valid['grade'] = valid['grade'].astype('int64')
+    # 🔹 Aynı öğrenci birden çok satırdaysa son satır geçerli olur (eski tek tek upsert ile aynı)
+    valid = valid.drop_duplicates('student_num', keep='last')
+    return valid, errors
+
+
+def class_edges(students: pd.DataFrame) -> pd.DataFrame:
+    """
+    classes sütununu (liste ya da virgülle ayrılmış metin) öğrenci-ders
+    kenar listesine açar: satırlar (student_num, class_id).
+    """
+    edges = students[['student_num', 'classes']].rename(columns={'classes': 'class_id'})
+    edges = edges.explode('class_id').dropna(subset=['class_id'])
+    edges['class_id'] = edges['class_id'].astype(str).str.split(',')
+    edges = edges.explode('class_id')
+    edges['class_id'] = edges['class_id'].str.strip()
+    return edges[edges['class_id'] != ''].drop_duplicates()
+
+
+def _known_classes(cursor, class_codes) -> dict:
+    """Derslerde bulunan kodlar -> veritabanındaki yazılışı (karşılaştırma büyük/küçük harf duyarsız)."""
+    class_codes = list(class_codes)
+    if not class_codes:
+        return {}
+    cursor.execute(
+        f"SELECT class_id FROM classes WHERE class_id IN ({', '.join(['%s'] * len(class_codes))})",
+        class_codes
+    )
+    canonical = {class_id.casefold(): class_id for (class_id,) in cursor.fetchall()}
+    return {code: canonical[code.casefold()] for code in class_codes if code.casefold() in canonical}
+
+
+def insert_students(students: pd.DataFrame) -> dict:
+    """
+    Öğrencileri ve ders kayıtlarını tek bağlantıda, tek işlemde toplu
+    upsert eder. Eksik alanı olan öğrenciler ve bilinmeyen ders kodları
+    hatalarda raporlanır; geri kalanlar yazılır.
+    """
+    valid, errors = student_rows(students)
+    edges = class_edges(valid)
+
     try:
         with get_database() as connection:
-            with connection.cursor() as cursor:
-                sql = """
-                INSERT INTO students (student_num, name, surname, grade, department)
-                VALUES (%s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                    name = VALUES(name),
-                    surname = VALUES(surname),
-                    grade = VALUES(grade),
-                    department = VALUES(department)
-                """
-                cursor.execute(sql, (
-                    student_info['student_num'],
-                    student_info['name'],
-                    student_info['surname'],
-                    student_info['grade'],
-                    student_info.get('department', None)
-                ))
-
-                sql_2 = """
-                INSERT INTO student_classes (student_num, class_id)
-                VALUES (%s, %s)
-                ON DUPLICATE KEY UPDATE class_id = VALUES(class_id)
-                """
-
-                classes_value = student_info['classes']
-                if isinstance(classes_value, list):
-                    class_codes = classes_value
-                elif pd.notna(classes_value):
-                    class_codes = [c.strip() for c in str(classes_value).split(',')]
-                else:
-                    class_codes = []
-
-                for class_code in class_codes:
-                    cursor.execute(sql_2, (student_info['student_num'], class_code.strip()))
-
-            connection.commit()
-        return {"status": "ok", "student": student_info['student_num']}
-    except Exception as e:
-        return {"status": "error", "student": student_info.get('student_num'), "error": str(e)}
+            connection.begin()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.executemany(SQL_STUDENT, list(valid[STUDENT_COLUMNS].itertuples(index=False, name=None)))
 
+                    known = _known_classes(cursor, edges['class_id'].unique())
+                    edges['known_id'] = edges['class_id'].map(known)
+                    unknown = edges['known_id'].isna()
+                    for student_num, codes in edges[unknown].groupby('student_num')['class_id']:
+                        errors.append(_error(int(student_num), f"Unknown class code(s): {', '.join(codes)}"))
 
-def insert_students(students: pd.DataFrame, n_jobs: int = 6) -> dict:
-    results = Parallel(n_jobs=n_jobs, prefer="processes")(
-        delayed(_insert_single_student)(row)
-        for _, row in students.iterrows()
-    )
+                    cursor.executemany(
+                        SQL_STUDENT_CLASS,
+                        list(edges.loc[~unknown, ['student_num', 'known_id']].drop_duplicates().itertuples(index=False, name=None))
+                    )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+    except Exception as e:
+        logger.exception(f"Öğrenciler kaydedilemedi: {e}")
+        return {"status": "error", "errors": errors + [_error(None, str(e))], "inserted": 0}
 
-    errors = [r for r in results if r["status"] == "error"]
     if errors:
-        return {"status": "partial", "errors": errors, "inserted": len(results) - len(errors)}
-    return {"status": "success", "inserted": len(results)}
+        return {"status": "partial", "errors": errors, "inserted": len(valid)}
+    return {"status": "success", "inserted": len(valid)}
@@ -1,96 +1,106 @@
 from Backend.src.DataBase.src.Database_connection import get_database
 from pymysql.cursors import DictCursor
+from Backend.src.utils.exams.seating_grid import SeatingGrid
+
+# Bölüm, sınavın dersinden (classes.department) okunur; ortak derslik
+# havuzunda derslikler birden çok bölüme ait sınavlara verilebilir
+BLOCKS_QUERY = """
+    SELECT b.*, s.date, s.exam_type, cl.department
+    FROM exam_block b
+    JOIN exam_schedules s ON s.id = b.schedule_id
+    JOIN classes cl ON cl.class_id = b.class_id
+    {where}
+    ORDER BY s.id, b.id
+"""
+# Alt tablolar aynı bölüm filtresiyle sınavlara bağlanarak tek seferde okunur
+CHILD_QUERY = """
+    SELECT t.exam_id, {columns}
+    FROM {table} t
+    {join}
+    ORDER BY t.exam_id, t.id
+"""
+DEPARTMENT_JOIN = """
+    JOIN exam_block b ON b.id = t.exam_id
+    JOIN classes cl ON cl.class_id = b.class_id
+    WHERE cl.department = %s
+"""
+
+
+def _child_rows(cursor, table: str, columns: str, department_name: str | None):
+    join, params = (DEPARTMENT_JOIN, (department_name,)) if department_name else ("", ())
+    cursor.execute(CHILD_QUERY.format(columns=columns, table=table, join=join), params)
+    return cursor.fetchall()
+
 
 def read_exam_schedule_by_department(department_name: str | None = None):
+    """
+    Kayıtlı sınav programını bölüm -> tarih -> sınavlar biçiminde okur.
+    Sınav sayısından bağımsız olarak dört sorgu çalışır (bloklar, derslikler,
+    öğrenciler, oturma yerleri); bölüm filtresi SQL'de uygulanır ve yanıt
+    satırlar üzerinden tek geçişte kurulur.
+    """
     try:
         with get_database() as db:
+            # 🔹 Dört sorgu aynı anlık görüntüyü okur; aradaki yazmalar eşleşmeyi bozmaz
+            db.begin()
             with db.cursor(DictCursor) as cursor:
-                cursor.execute("SELECT id, date, exam_type FROM exam_schedules")
-                schedules = cursor.fetchall()
-                
-                if not schedules:
-                    return {"status": "empty", "message": "Hiç schedule bulunamadı."}
-
-                all_departments = {}
-
-                for sched in schedules:
-                    sid = sched["id"]
-                    day_date = sched["date"]
-                    exam_type = sched.get("exam_type", "N/A")
-
-                    # 2️⃣ exam_block (ders bilgileri)
-                    cursor.execute("""
-                        SELECT * FROM exam_block 
-                        WHERE schedule_id = %s
-                    """, (sid,))
-                    blocks = cursor.fetchall()
-
-                    for block in blocks:
-                        exam_id = block["id"]
-
-                        # 3️⃣ Bu dersin bağlı olduğu departmanı bul
-                        # (Bunu exam_classrooms -> classrooms tablosundan çekelim)
-                        cursor.execute("""
-                            SELECT c.department_name 
-                            FROM exam_classrooms ec
-                            JOIN classrooms c ON ec.classroom_id = c.classroom_id
-                            WHERE ec.exam_id = %s
-                            LIMIT 1
-                        """, (exam_id,))
-                        dep_row = cursor.fetchone()
-                        dep_name = dep_row["department_name"] if dep_row else "Bilinmiyor"
-                        print(f"Exam ID: {exam_id}, Department: {dep_name}")
-
-                        # Filtre varsa ve eşleşmiyorsa atla
-                        if department_name and dep_name != department_name:
-                            continue
-
-                        # 4️⃣ Sınıfa ait diğer ilişkiler
-                        cursor.execute("""
-                            SELECT classroom_id FROM exam_classrooms WHERE exam_id = %s
-                        """, (exam_id,))
-                        classrooms = [{"classroom_id": r["classroom_id"]} for r in cursor.fetchall()]
-
-                        cursor.execute("""
-                            SELECT student_num FROM exam_students WHERE exam_id = %s
-                        """, (exam_id,))
-                        students = [{"student_num": r["student_num"]} for r in cursor.fetchall()]
-
-                        cursor.execute("""
-                            SELECT classroom_id, student_num, `row_number`, `column_number`
-                            FROM exam_seating_plan WHERE exam_id = %s
-                        """, (exam_id,))
-                        seating_plan_rows = cursor.fetchall()
-                        seating_plan = {}
-                        for r in seating_plan_rows:
-                            cname = r["classroom_id"]
-                            key = f"{r['row_number']},{r['column_number']}"
-                            if cname not in seating_plan:
-                                seating_plan[cname] = {}
-                            seating_plan[cname][key] = {"student_num": r["student_num"]}
-
-                        # 5️⃣ class objesi
-                        cls_obj = {
-                            "id": block["class_id"],
-                            "name": block["name"],
-                            "year": block["year"],
-                            "start_time": str(block["exam_start_time"]),
-                            "end_time": str(block["exam_end_time"]),
-                            "duration": block.get("duration", 0),
-                            "instructor": block.get("instructor", "N/A"),
-                            "student_count": block.get("student_count", 0),
-                            "classrooms": classrooms,
-                            "students": students,
-                            "seating_plan": seating_plan
-                        }
-
-                        # 6️⃣ Departman altında grupla
-                        dep_data = all_departments.setdefault(dep_name, {})
-                        day_data = dep_data.setdefault(day_date, {
-                            "exam_type": exam_type,
-                            "exams": []
-                        })
-                        day_data["exams"].append({"classes": [cls_obj]})
+                where, params = ("WHERE cl.department = %s", (department_name,)) if department_name else ("", ())
+                cursor.execute(BLOCKS_QUERY.format(where=where), params)
+                blocks = cursor.fetchall()
+
+                if not blocks and not department_name:
+                    cursor.execute("SELECT EXISTS(SELECT 1 FROM exam_schedules) AS has_schedule")
+                    if not cursor.fetchone()["has_schedule"]:
+                        db.commit()
+                        return {"status": "empty", "message": "Hiç schedule bulunamadı."}
+
+            with db.cursor() as cursor:
+                classroom_rows = _child_rows(cursor, "exam_classrooms", "t.classroom_id", department_name)
+                student_rows = _child_rows(cursor, "exam_students", "t.student_num", department_name)
+                seat_rows = _child_rows(
+                    cursor, "exam_seating_plan",
+                    "t.classroom_id, t.student_num, t.`row_number`, t.`column_number`",
+                    department_name
+                )
+            db.commit()
+
+        all_departments = {}
+        classes_by_exam = {}
+
+        for block in blocks:
+            cls_obj = {
+                "id": block["class_id"],
+                "name": block["name"],
+                "year": block["year"],
+                "start_time": str(block["exam_start_time"]),
+                "end_time": str(block["exam_end_time"]),
+                "duration": block.get("duration", 0),
+                "instructor": block.get("instructor", "N/A"),
+                "student_count": block.get("student_count", 0),
+                "classrooms": [],
+                "students": [],
+                "seating_plan": {}
+            }
+            classes_by_exam[block["id"]] = cls_obj
+
+            dep_data = all_departments.setdefault(block["department"], {})
+            day_data = dep_data.setdefault(block["date"], {
+                "exam_type": block.get("exam_type", "N/A"),
+                "exams": []
+            })
+            day_data["exams"].append({"classes": [cls_obj]})
+
+        for exam_id, classroom_id in classroom_rows:
+            classes_by_exam[exam_id]["classrooms"].append({"classroom_id": classroom_id})
+
+        for exam_id, student_num in student_rows:
+            classes_by_exam[exam_id]["students"].append({"student_num": student_num})
+
+        seats_per_room = {}
+        for exam_id, classroom_id, student_num, row_number, column_number in seat_rows:
+            seats_per_room.setdefault((exam_id, classroom_id), []).append((row_number, column_number, student_num))
+        for (exam_id, classroom_id), seats in seats_per_room.items():
+            classes_by_exam[exam_id]["seating_plan"][classroom_id] = SeatingGrid.from_seats(classroom_id, seats).to_dict()
 
         if department_name:
             if department_name not in all_departments:
@@ -1,5 +1,6 @@
 from Backend.src.DataBase.src.Database_connection import get_database
 from Backend.src.DataBase.src.structures.classrooms import Classroom
+from Backend.src.utils.exams.seat_maps import cache_classroom
 
 def update_classroom(new_classroom_data: Classroom):
     try:
@@ -28,4 +29,6 @@ def update_classroom(new_classroom_data: Classroom):
                     return 'error', 'Classroom not found.'
     except Exception as e:
         return 'error', str(e)
+    # 🔹 Düzen değişmiş olabilir; şablon yeniden hesaplanır
+    cache_classroom(new_classroom_data.model_dump())
     return 'success', 'Classroom updated successfully.'
\ No newline at end of file
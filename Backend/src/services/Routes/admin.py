@@ -1,9 +1,9 @@
 from Backend.src.DataBase.src.utils.update_classroom import update_classroom as db_update_classroom
 import pandas as pd
-from fastapi import APIRouter, Depends, UploadFile, File, Form, Body
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Body, Query
 from Backend.src.DataBase.src.structures.classrooms import Classroom
 from Backend.src.DataBase.src.structures.user import User
-from Backend.src.DataBase.src.utils.class_list_menu import class_list_menu
+from Backend.src.DataBase.src.utils.class_list_menu import class_list_menu, class_dict_for_department
 from Backend.src.DataBase.src.utils.insert_classroom import insert_classroom_to_db
 from Backend.src.DataBase.src.utils.student_list_menu import student_list_menu, student_list_for_department
 from Backend.src.services.Utils.check_if_admin import require_admin
@@ -18,7 +18,13 @@ from Backend.src.DataBase.src.utils.insert_exam_schedule import insert_exam_sche
 from Backend.src.DataBase.src.utils.read_exam_program import read_exam_schedule_by_department 
 from Backend.src.DataBase.src.utils.delete_stutent_list import delete_students
 from Backend.src.DataBase.src.utils.delete_classes import delete_classes
-from typing import Dict, Any
+from Backend.src.DataBase.src.structures.exam_program import ExamProgramRequest, JointExamProgramRequest
+from Backend.src.services.Utils.schedule_jobs import schedule_jobs, job_event_stream, check_feasibility
+from Backend.src.services.Utils.schedule_export import job_schedule_sheets, workbook_response
+from Backend.src.DataBase.src.utils.export_exam_schedule import iter_exam_schedule_sheets
+from Backend.src.DataBase.src.Database_connection import database_pool_statistics
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List
 import io
 
 
@@ -164,7 +170,7 @@ def classes_with_years(department: str = Form(...), user: User = Depends(require
     class_dict = {}
 
     try:
-        classes_list, status, msg = class_list_menu(department, years_and_instructor=True)
+        class_dict, status, msg = class_dict_for_department(department)
 
         if status == 'error':
             return {
@@ -174,25 +180,6 @@ def classes_with_years(department: str = Form(...), user: User = Depends(require
                 'detail': msg
             }
 
-        for cls in classes_list:
-            class_id = cls['class_id']
-
-            if class_id not in class_dict:
-                class_dict[class_id] = {
-                    'class_id': class_id,
-                    'class_name': cls['class_name'],
-                    'year': cls.get('year', []),
-                    'instructor': cls.get('teacher', ''),
-                    'students': []
-                }
-
-            if cls['student_num']:
-                class_dict[class_id]['students'].append({
-                    'student_num': cls['student_num'],
-                    'name': cls['name'],
-                    'surname': cls['surname']
-                })
-
     except Exception as e:
         return {
             'classes': class_dict,
@@ -254,6 +241,10 @@ def get_departments(user: User = Depends(require_admin)):
     
     return {"departments": departments, "message": "Departments fetched successfully.", 'status': status, 'detail': msg}
 
+@router.get("/database_pool")
+def database_pool(user: User = Depends(require_admin)):
+    return {"pool": database_pool_statistics(), "message": "Database pool statistics fetched.", 'status': 'success'}
+
 @router.post("/exam_classrooms")
 def exam_classrooms(department: str = Form(...), user: User = Depends(require_admin)):
     try:
@@ -292,15 +283,15 @@ def exam_classrooms(department: str = Form(...), user: User = Depends(require_ad
 def insert_exam_schedule_db(exam_schedule: Any = Body(...), user: User = Depends(require_admin)):
     print("📥 Raw exam_schedule string alındı")
     print("type: ", type(exam_schedule))
-    status, msg = insert_exam_schedule(exam_schedule, n_jobs=6)
+    result = insert_exam_schedule(exam_schedule)
     
-    if status == 'error':
+    if result["status"] == 'error':
         print("Error while inserting exam schedule to db.")
         raise ValueError("Error while inserting exam schedule to db.")
     
     return {
-        "status": status,
-        "message": msg
+        "status": result["status"],
+        "message": result["message"]
     }
     
 @router.get("/get_exam_schedules")
@@ -309,6 +300,22 @@ def get_exam_schedules(user: User = Depends(require_admin)):
     result = read_exam_schedule_by_department()
     return result
 
+@router.get("/download_exam_schedule")
+def download_exam_schedule(
+    departments: List[str] | None = Query(default=None),
+    exam_types: List[str] | None = Query(default=None),
+    user: User = Depends(require_admin)
+):
+    # 🔹 Her (bölüm, sınav türü) ayrı sayfa; satırlar veritabanından akarak yazılır
+    try:
+        response = workbook_response(iter_exam_schedule_sheets(departments, exam_types))
+    except Exception as e:
+        return {"message": "Error while exporting exam schedule.", 'status': 'error', 'detail': str(e)}
+    if response is None:
+        return {"message": "No exam schedule found.", 'status': 'error'}
+
+    return response
+
 @router.post("/check_students_exist")
 def check_students_exist(uploaded_department: str = Form(...), user: User = Depends(require_admin)):
     try:
@@ -321,4 +328,102 @@ def check_students_exist(uploaded_department: str = Form(...), user: User = Depe
         return {'students': True, "message": "Students exist in the database for this department.", 'status': 'success'}
         
     except Exception as e:
-        return {'students': False, "message": "Error while checking for students.", 'status': 'error', 'detail': str(e)}
\ No newline at end of file
+        return {'students': False, "message": "Error while checking for students.", 'status': 'error', 'detail': str(e)}
+
+
+@router.post("/start_exam_schedule_job")
+def start_exam_schedule_job(request: ExamProgramRequest, user: User = Depends(require_admin)):
+    if not request.department:
+        return {"message": "Department is required.", 'status': 'error'}
+    try:
+        job, feasibility = schedule_jobs.start(request, department=request.department, owner=user.email)
+    except RuntimeError as e:
+        return {"message": str(e), 'status': 'error'}
+    if job is None:
+        return {"feasibility": feasibility, "message": "Exam schedule is infeasible with these settings.", 'status': 'error'}
+
+    return {"job": job.to_dict(), "feasibility": feasibility, "message": "Exam schedule job started.", 'status': 'success'}
+
+@router.post("/start_joint_exam_schedule_job")
+def start_joint_exam_schedule_job(request: JointExamProgramRequest, user: User = Depends(require_admin)):
+    # 🔹 Bölümler tüm derslikleri ortak havuzda paylaşır; her bölümün programı ayrı döner
+    try:
+        job, feasibility = schedule_jobs.start_joint(request, owner=user.email)
+    except RuntimeError as e:
+        return {"message": str(e), 'status': 'error'}
+    if job is None:
+        return {"feasibility": feasibility, "message": "Joint exam schedule is infeasible with these settings.", 'status': 'error'}
+
+    return {"job": job.to_dict(), "feasibility": feasibility, "message": "Joint exam schedule job started.", 'status': 'success'}
+
+@router.post("/check_exam_schedule_feasibility")
+def check_exam_schedule_feasibility(request: ExamProgramRequest, user: User = Depends(require_admin)):
+    if not request.department:
+        return {"message": "Department is required.", 'status': 'error'}
+    try:
+        feasibility = check_feasibility(request, request.department)
+    except RuntimeError as e:
+        return {"message": str(e), 'status': 'error'}
+
+    return {"feasibility": feasibility, "message": "Feasibility analysis completed.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}")
+def exam_schedule_job(job_id: str, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    return {"job": job.to_dict(), "message": "Exam schedule job fetched.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/events")
+async def exam_schedule_job_events(job_id: str, interval: float | None = None, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    return StreamingResponse(
+        job_event_stream(job, interval),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/exam_schedule_job/{job_id}/cancel")
+def cancel_exam_schedule_job(job_id: str, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    job = schedule_jobs.cancel(job)
+    return {"job": job.to_dict(), "message": "Exam schedule job cancellation requested.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/result")
+def exam_schedule_job_result(job_id: str, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+    if job.status != "done":
+        return {"job": job.to_dict(), "message": "Exam schedule job is not finished.", 'status': 'error', 'detail': job.error}
+
+    return {"job": job.to_dict(), "result": job.result, "message": "Exam schedule fetched.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/download")
+def download_exam_schedule_job(job_id: str, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+    if job.status != "done":
+        return {"job": job.to_dict(), "message": "Exam schedule job is not finished.", 'status': 'error', 'detail': job.error}
+
+    response = workbook_response(job_schedule_sheets(job))
+    if response is None:
+        return {"message": "Exam schedule is empty.", 'status': 'error'}
+    return response
+
+@router.post("/exam_schedule_job/{job_id}/persist")
+def persist_exam_schedule_job(job_id: str, user: User = Depends(require_admin)):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    result = schedule_jobs.persist(job)
+    return {"job": job.to_dict(), "message": result.get("message"), 'status': result.get("status")}
@@ -1,14 +1,14 @@
-from typing import Any
+from typing import Any, List
 from Backend.src.DataBase.src.utils.insert_exam_schedule import insert_exam_schedule
 from Backend.src.DataBase.src.utils.update_classroom import update_classroom as db_update_classroom
-from Backend.src.DataBase.src.utils.class_list_menu import class_list_menu
+from Backend.src.DataBase.src.utils.class_list_menu import class_list_menu, class_dict_for_department
 from Backend.src.DataBase.src.utils.student_list_menu import student_list_menu, student_list_for_department
 from Backend.src.DataBase.scripts.class_list_save_from_excel import class_list_save_from_excel
 from Backend.src.DataBase.scripts.student_list_save_from_excel import student_list_save_from_excel
 from Backend.src.DataBase.src.utils.insert_classroom import insert_classroom_to_db
 from Backend.src.DataBase.src.structures.classrooms import Classroom
 import pandas as pd
-from fastapi import APIRouter, Body, Depends, Form, UploadFile, File
+from fastapi import APIRouter, Body, Depends, Form, UploadFile, File, Query
 from Backend.src.DataBase.src.structures.user import User
 from Backend.src.services.Utils.check_if_coordinator import require_coordinator
 from Backend.src.DataBase.src.utils.search_classroom import search_classroom as db_search_classroom
@@ -17,6 +17,11 @@ from Backend.src.DataBase.src.utils.get_all_classrooms import get_all_classrooms
 from Backend.src.DataBase.src.utils.read_exam_program import read_exam_schedule_by_department
 from Backend.src.DataBase.src.utils.delete_stutent_list import delete_students
 from Backend.src.DataBase.src.utils.delete_classes import delete_classes
+from Backend.src.DataBase.src.structures.exam_program import ExamProgramRequest
+from Backend.src.services.Utils.schedule_jobs import schedule_jobs, job_event_stream, check_feasibility
+from Backend.src.services.Utils.schedule_export import job_schedule_sheets, workbook_response
+from Backend.src.DataBase.src.utils.export_exam_schedule import iter_exam_schedule_sheets
+from fastapi.responses import StreamingResponse
 import io
 
 router = APIRouter(prefix="/department_coordinator", tags=["department_coordinator"])
@@ -151,7 +156,7 @@ def classes_with_years(user: User = Depends(require_coordinator)):
     class_dict = {}
 
     try:
-        classes_list, status, msg = class_list_menu(user.department, years_and_instructor=True)
+        class_dict, status, msg = class_dict_for_department(user.department)
 
         if status == 'error':
             return {
@@ -161,25 +166,6 @@ def classes_with_years(user: User = Depends(require_coordinator)):
                 'detail': msg
             }
 
-        for cls in classes_list:
-            class_id = cls['class_id']
-
-            if class_id not in class_dict:
-                class_dict[class_id] = {
-                    'class_id': class_id,
-                    'class_name': cls['class_name'],
-                    'year': cls.get('year', []),
-                    'instructor': cls.get('teacher', ''),
-                    'students': []
-                }
-
-            if cls['student_num']:
-                class_dict[class_id]['students'].append({
-                    'student_num': cls['student_num'],
-                    'name': cls['name'],
-                    'surname': cls['surname']
-                })
-
     except Exception as e:
         return {
             'classes': class_dict,
@@ -268,15 +254,15 @@ def exam_classrooms(user: User = Depends(require_coordinator)):
 @router.post("/insert_exam_schedule_to_db")
 def insert_exam_schedule_db(exam_schedule: Any = Body(...), user: User = Depends(require_coordinator)):
     print("📥 Raw exam_schedule string alındı")
-    status, msg = insert_exam_schedule(exam_schedule, n_jobs=6)
+    result = insert_exam_schedule(exam_schedule)
     
-    if status == 'error':
+    if result["status"] == 'error':
         print("Error while inserting exam schedule to db.")
         raise ValueError("Error while inserting exam schedule to db.")
     
     return {
-        "status": status,
-        "message": msg
+        "status": result["status"],
+        "message": result["message"]
     }
 
 @router.get("/get_exam_schedule")
@@ -286,6 +272,18 @@ def get_exam_schedule(user: User = Depends(require_coordinator)):
     
     return result
 
+@router.get("/download_exam_schedule")
+def download_exam_schedule(exam_types: List[str] | None = Query(default=None), user: User = Depends(require_coordinator)):
+    # 🔹 Koordinatör yalnızca kendi bölümünü indirir; her sınav türü ayrı sayfa
+    try:
+        response = workbook_response(iter_exam_schedule_sheets([user.department], exam_types))
+    except Exception as e:
+        return {"message": "Error while exporting exam schedule.", 'status': 'error', 'detail': str(e)}
+    if response is None:
+        return {"message": "No exam schedule found.", 'status': 'error'}
+
+    return response
+
 @router.get("/check_students_exist")
 def check_students_exist(user: User = Depends(require_coordinator)):
     try:
@@ -297,4 +295,87 @@ def check_students_exist(user: User = Depends(require_coordinator)):
         return {'students': True, "message": "Students exist in the database for this department.", 'status': 'success'}
         
     except Exception as e:
-        return {'students': False, "message": "Error while checking for students.", 'status': 'error', 'detail': str(e)}
\ No newline at end of file
+        return {'students': False, "message": "Error while checking for students.", 'status': 'error', 'detail': str(e)}
+
+
+@router.post("/start_exam_schedule_job")
+def start_exam_schedule_job(request: ExamProgramRequest, user: User = Depends(require_coordinator)):
+    # 🔹 Koordinatör yalnızca kendi bölümü için program oluşturabilir
+    try:
+        job, feasibility = schedule_jobs.start(request, department=user.department, owner=user.email)
+    except RuntimeError as e:
+        return {"message": str(e), 'status': 'error'}
+    if job is None:
+        return {"feasibility": feasibility, "message": "Exam schedule is infeasible with these settings.", 'status': 'error'}
+
+    return {"job": job.to_dict(), "feasibility": feasibility, "message": "Exam schedule job started.", 'status': 'success'}
+
+@router.post("/check_exam_schedule_feasibility")
+def check_exam_schedule_feasibility(request: ExamProgramRequest, user: User = Depends(require_coordinator)):
+    try:
+        feasibility = check_feasibility(request, user.department)
+    except RuntimeError as e:
+        return {"message": str(e), 'status': 'error'}
+
+    return {"feasibility": feasibility, "message": "Feasibility analysis completed.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}")
+def exam_schedule_job(job_id: str, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    return {"job": job.to_dict(), "message": "Exam schedule job fetched.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/events")
+async def exam_schedule_job_events(job_id: str, interval: float | None = None, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    return StreamingResponse(
+        job_event_stream(job, interval),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/exam_schedule_job/{job_id}/cancel")
+def cancel_exam_schedule_job(job_id: str, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    job = schedule_jobs.cancel(job)
+    return {"job": job.to_dict(), "message": "Exam schedule job cancellation requested.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/result")
+def exam_schedule_job_result(job_id: str, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+    if job.status != "done":
+        return {"job": job.to_dict(), "message": "Exam schedule job is not finished.", 'status': 'error', 'detail': job.error}
+
+    return {"job": job.to_dict(), "result": job.result, "message": "Exam schedule fetched.", 'status': 'success'}
+
+@router.get("/exam_schedule_job/{job_id}/download")
+def download_exam_schedule_job(job_id: str, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+    if job.status != "done":
+        return {"job": job.to_dict(), "message": "Exam schedule job is not finished.", 'status': 'error', 'detail': job.error}
+
+    response = workbook_response(job_schedule_sheets(job))
+    if response is None:
+        return {"message": "Exam schedule is empty.", 'status': 'error'}
+    return response
+
+@router.post("/exam_schedule_job/{job_id}/persist")
+def persist_exam_schedule_job(job_id: str, user: User = Depends(require_coordinator)):
+    job = schedule_jobs.get(job_id, department=user.department)
+    if job is None:
+        return {"message": "Exam schedule job not found.", 'status': 'error'}
+
+    result = schedule_jobs.persist(job)
+    return {"job": job.to_dict(), "message": result.get("message"), 'status': result.get("status")}
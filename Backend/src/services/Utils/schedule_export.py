@@ -0,0 +1,69 @@
+import contextlib
+import logging
+import os
+import tempfile
+from typing import Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from Backend.src.services.Utils.schedule_jobs import ScheduleJob
+from Backend.src.utils.exams.schedule_export import ScheduleSheet, schedule_sheets, write_schedule_workbook
+
+logger = logging.getLogger(__name__)
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def job_schedule_sheets(job: ScheduleJob) -> Iterator[ScheduleSheet]:
+    """Biten işin programı; ortak işte her bölüm ayrı sayfalara yazılır."""
+    if "departments" in job.result:
+        for department, department_result in job.result["departments"].items():
+            yield from schedule_sheets(department_result["exam_schedule"], department)
+    else:
+        yield from schedule_sheets(job.result["exam_schedule"], job.department)
+
+
+def _remove(path: str):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _iter_file(path: str) -> Iterator[bytes]:
+    try:
+        with open(path, "rb") as file:
+            while chunk := file.read(EXPORT_CHUNK_SIZE):
+                yield chunk
+    finally:
+        _remove(path)
+
+
+def workbook_response(sheets: Iterable[ScheduleSheet], filename: str = "sinav_programi.xlsx") -> StreamingResponse | None:
+    """
+    Sayfaları geçici bir dosyaya constant_memory kipinde yazar ve dosyayı
+    parça parça gönderen bir StreamingResponse döner; dosya gönderim bitince
+    silinir. xlsx bir zip arşivi olduğundan arşiv kapanmadan gönderim
+    başlayamaz, ama satırlar hiçbir aşamada bellekte toplanmaz.
+    Yazılacak sayfa yoksa None döner.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        written = write_schedule_workbook(path, sheets)
+    except Exception:
+        _remove(path)
+        raise
+    if not written:
+        _remove(path)
+        return None
+
+    return StreamingResponse(
+        _iter_file(path),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(os.path.getsize(path)),
+        },
+        background=BackgroundTask(_remove, path)
+    )
@@ -0,0 +1,403 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from Backend.src.DataBase.src.structures.exam_program import ExamProgramRequest, JointExamProgramRequest
+from Backend.src.DataBase.src.utils.class_list_menu import class_dict_for_department
+from Backend.src.DataBase.src.utils.get_all_classrooms import get_all_classrooms
+from Backend.src.DataBase.src.utils.insert_exam_schedule import insert_exam_schedule
+from Backend.src.utils.exams.feasibility import analyze_feasibility
+from Backend.src.utils.exams.joint_schedule import create_joint_exam_schedule, shared_classroom_pool
+from Backend.src.utils.exams.schedule_cache import create_exam_schedule_cached
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_JOB_WORKERS = int(os.getenv("SCHEDULE_JOB_WORKERS", "2"))
+# Biten işler bu süre kadar bellekte tutulur (sonuç/persist için)
+SCHEDULE_JOB_TTL = float(os.getenv("SCHEDULE_JOB_TTL_MINUTES", "60")) * 60
+# Olay akışında iki mesaj arasındaki en kısa süre (saniye); hızlı çalışmalar
+# ve çok sayıda abone bağlantıyı boğmasın diye olaylar bu aralıkla toplu gönderilir
+SCHEDULE_JOB_EVENT_INTERVAL = float(os.getenv("SCHEDULE_JOB_EVENT_INTERVAL", "0.25"))
+# Her işte tutulan son olay sayısı ve tek mesajdaki en fazla olay sayısı
+MAX_JOB_EVENTS = 1000
+MAX_EVENTS_PER_MESSAGE = 50
+# Olay yokken bağlantıyı canlı tutmak için yorum satırı gönderilir
+HEARTBEAT_SECONDS = 2.0
+
+FINISHED_STATUSES = ("done", "failed", "cancelled")
+
+
+class ScheduleJobCancelled(Exception):
+    pass
+
+
+def make_json_safe(data):
+    if isinstance(data, dict):
+        new_dict = {}
+        for k, v in data.items():
+            if isinstance(k, tuple):
+                k = f"{k[0]},{k[1]}"
+            new_dict[str(k)] = make_json_safe(v)
+        return new_dict
+    elif isinstance(data, (list, tuple, set)):
+        return [make_json_safe(i) for i in data]
+    elif isinstance(data, (datetime, date)):
+        return data.isoformat()
+    else:
+        return data
+
+
+def load_schedule_inputs(department: str) -> tuple[dict, list]:
+    """Bölümün derslerini ve dersliklerini okur; okunamazsa RuntimeError fırlatır."""
+    class_dict, status, msg = class_dict_for_department(department)
+    if status == 'error':
+        raise RuntimeError(f"Classes could not be fetched: {msg}")
+    classrooms, status, msg = get_all_classrooms(department)
+    if status == 'error':
+        raise RuntimeError(f"Classrooms could not be fetched: {msg}")
+    if not class_dict:
+        raise RuntimeError("No classes found for this department.")
+    if not classrooms:
+        raise RuntimeError("No classrooms found for this department.")
+    return class_dict, classrooms
+
+
+def check_feasibility(request: ExamProgramRequest, department: str, inputs: tuple | None = None) -> dict:
+    class_dict, classrooms = inputs or load_schedule_inputs(department)
+    return analyze_feasibility(request.to_exam_program(), class_dict, classrooms)
+
+
+def load_joint_inputs(departments: list[str]) -> tuple[dict, list]:
+    """
+    Ortak program için bölümlerin derslerini ve tüm bölümlerin dersliklerinden
+    oluşan ortak havuzu okur. Dersliği olmayan bölüm havuzdaki derslikleri kullanır.
+    """
+    class_dicts = {}
+    classrooms_per_department = {}
+    for department in departments:
+        class_dict, status, msg = class_dict_for_department(department)
+        if status == 'error':
+            raise RuntimeError(f"Classes could not be fetched for {department}: {msg}")
+        if not class_dict:
+            raise RuntimeError(f"No classes found for {department}.")
+        classrooms, status, msg = get_all_classrooms(department)
+        if status == 'error':
+            raise RuntimeError(f"Classrooms could not be fetched for {department}: {msg}")
+        class_dicts[department] = class_dict
+        classrooms_per_department[department] = classrooms
+
+    pool = shared_classroom_pool(classrooms_per_department)
+    if not pool:
+        raise RuntimeError("No classrooms found for these departments.")
+    return class_dicts, pool
+
+
+# Ortak işte bölümlerin aşamaları bu sırayla ilerler; işin aşaması en geridekidir
+PHASE_ORDER = ("placement", "improvement", "seating", "finished")
+
+
+def _joint_progress(record):
+    """Bölüm olaylarını işin toplam ilerlemesine çeviren geri çağrı."""
+    processed = {}
+    totals = {}
+    phases = {}
+
+    def progress(event):
+        department = event["department"]
+        processed[department] = event["processed"]
+        totals[department] = event["total"]
+        event = {**event, "processed": sum(processed.values()), "total": sum(totals.values())}
+        if event["type"] == "phase":
+            phases[department] = event["phase"]
+            event["phase"] = min(phases.values(), key=PHASE_ORDER.index)
+        record(event)
+
+    return progress
+
+
+@dataclass
+class ScheduleJob:
+    id: str
+    department: str
+    owner: str
+    status: str = "queued"  # queued | running | done | failed | cancelled
+    phase: str = "queued"   # queued | loading | placement | finished
+    placed: int = 0
+    total: int = 0
+    result: dict | None = None
+    error: str | None = None
+    persisted: bool = False
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    future: Future | None = field(default=None, repr=False)
+    events: deque = field(default_factory=lambda: deque(maxlen=MAX_JOB_EVENTS), repr=False)
+    event_seq: int = 0
+    _events_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, event: dict):
+        """Zamanlayıcı iş parçacığından gelen ilerleme olayını kaydeder."""
+        with self._events_lock:
+            self.event_seq += 1
+            event["seq"] = self.event_seq
+            self.events.append(event)
+        self.placed = event.get("processed", self.placed)
+        self.total = event.get("total", self.total)
+        if event.get("type") == "phase":
+            self.phase = event["phase"]
+
+    def events_since(self, seq: int) -> tuple[list, int]:
+        """seq'ten sonraki olaylar ve tutulamadığı için kaçırılan olay sayısı."""
+        with self._events_lock:
+            if self.event_seq <= seq:
+                return [], 0
+            events = [event for event in self.events if event["seq"] > seq]
+        dropped = events[0]["seq"] - seq - 1 if events else 0
+        return events, dropped
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "department": self.department,
+            "status": self.status,
+            "phase": self.phase,
+            "placed": self.placed,
+            "total": self.total,
+            "percent": round(100 * self.placed / self.total, 1) if self.total else 0.0,
+            "error": self.error,
+            "persisted": self.persisted,
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(timespec="seconds"),
+            "finished_at": (
+                datetime.fromtimestamp(self.finished_at).isoformat(timespec="seconds")
+                if self.finished_at else None
+            ),
+        }
+
+
+class ScheduleJobManager:
+    """
+    Sınav programı oluşturma işlerini arka planda, sabit boyutlu bir işçi
+    havuzunda çalıştırır. Dersler ve derslikler sunucuda okunur; istemci
+    yalnızca ilerlemeyi sorgular, iptal eder, sonucu alır ya da doğrudan
+    veritabanına yazdırır. Farklı bölümlerin işleri aynı anda çalışabilir.
+    """
+
+    def __init__(self, max_workers: int | None = None, ttl: float | None = None):
+        self.max_workers = max_workers or SCHEDULE_JOB_WORKERS
+        self.ttl = SCHEDULE_JOB_TTL if ttl is None else ttl
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="schedule-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        request: ExamProgramRequest,
+        department: str,
+        owner: str,
+        inputs: tuple | None = None
+    ) -> ScheduleJob:
+        """inputs: önceden okunmuş (class_dict, classrooms); verilmezse iş kendisi okur."""
+        self._cleanup()
+        job = ScheduleJob(id=uuid.uuid4().hex, department=department, owner=owner)
+        with self._lock:
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(self._run, job, request, inputs)
+        logger.info("Sınav programı işi kuyruğa alındı: %s (%s)", job.id, department)
+        return job
+
+    def start(self, request: ExamProgramRequest, department: str, owner: str) -> tuple[ScheduleJob | None, dict]:
+        """
+        Girdileri okuyup olurluk ön analizini çalıştırır; program bu girdilerle
+        tamamlanamayacaksa iş başlatılmaz (None döner) ve işçi havuzu meşgul
+        edilmez. Okuma hataları RuntimeError olarak yükselir.
+        """
+        inputs = load_schedule_inputs(department)
+        feasibility = check_feasibility(request, department, inputs)
+        if not feasibility["feasible"]:
+            logger.info("Sınav programı isteği olurluk analizinde reddedildi (%s)", department)
+            return None, feasibility
+        return self.submit(request, department, owner, inputs), feasibility
+
+    def start_joint(self, request: JointExamProgramRequest, owner: str) -> tuple[ScheduleJob | None, dict]:
+        """
+        Birden fazla bölümü ortak derslik havuzuyla tek işte programlar. Her
+        bölüm ortak havuza göre olurluk analizinden geçer; biri bile uygun
+        değilse iş başlatılmaz.
+        """
+        departments = sorted(set(request.departments))
+        if not departments:
+            raise RuntimeError("At least one department is required.")
+        class_dicts, pool = load_joint_inputs(departments)
+        reports = {
+            department: check_feasibility(request, department, (class_dicts[department], pool))
+            for department in departments
+        }
+        feasibility = {"feasible": all(r["feasible"] for r in reports.values()), "departments": reports}
+        if not feasibility["feasible"]:
+            logger.info("Ortak sınav programı isteği olurluk analizinde reddedildi (%s)", ", ".join(departments))
+            return None, feasibility
+
+        self._cleanup()
+        job = ScheduleJob(id=uuid.uuid4().hex, department=", ".join(departments), owner=owner)
+        with self._lock:
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(self._run_joint, job, request, (class_dicts, pool))
+        logger.info("Ortak sınav programı işi kuyruğa alındı: %s (%s)", job.id, job.department)
+        return job, feasibility
+
+    def get(self, job_id: str, department: str | None = None) -> ScheduleJob | None:
+        """department verilirse yalnızca o bölümün işi döner (koordinatör erişimi)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or (department is not None and job.department != department):
+            return None
+        return job
+
+    def cancel(self, job: ScheduleJob) -> ScheduleJob:
+        if job.status in FINISHED_STATUSES:
+            return job
+        job.cancel_event.set()
+        # 🔹 Henüz başlamamış iş kuyruktan hemen düşer; çalışan iş bir sonraki derste durur
+        if job.future is not None and job.future.cancel():
+            self._finish(job, "cancelled")
+        return job
+
+    def persist(self, job: ScheduleJob) -> dict:
+        if job.status != "done" or job.result is None:
+            return {"status": "error", "message": f"Job is not finished (status: {job.status})."}
+        if job.persisted:
+            return {"status": "success", "message": "Exam schedule already saved."}
+
+        if "departments" not in job.result:
+            result = insert_exam_schedule(job.result["exam_schedule"])
+            if result.get("status") == "success":
+                job.persisted = True
+            return result
+
+        # 🔹 Ortak iş: tüm bölümlerin programı tek işlemde kaydedilir; ortak günler bir kez eklenir
+        departments = job.result["departments"]
+        days = [day for department_result in departments.values() for day in department_result["exam_schedule"]]
+        result = insert_exam_schedule(days)
+        if result.get("status") != "success":
+            return result
+        job.persisted = True
+        return {"status": "success", "message": f"Exam schedules saved for {len(departments)} departments."}
+
+    def _run(self, job: ScheduleJob, request: ExamProgramRequest, inputs: tuple | None = None):
+        # İstekte multi_start_runs verilmişse create_exam_schedule_cached çoklu başlangıçla çalışır
+        def work(progress):
+            class_dict, classrooms = inputs or load_schedule_inputs(job.department)
+            return create_exam_schedule_cached(
+                request.to_exam_program(),
+                class_dict,
+                classrooms,
+                seed=request.seed,
+                improve_iterations=request.improve_iterations,
+                improve_time_budget=request.improve_time_budget,
+                progress=progress
+            )
+
+        self._execute(job, work)
+
+    def _run_joint(self, job: ScheduleJob, request: JointExamProgramRequest, inputs: tuple):
+        def work(progress):
+            class_dicts, pool = inputs
+            return create_joint_exam_schedule(
+                {department: (request.to_exam_program(), class_dict) for department, class_dict in class_dicts.items()},
+                pool,
+                seed=request.seed,
+                improve_iterations=request.improve_iterations,
+                improve_time_budget=request.improve_time_budget,
+                progress=_joint_progress(progress)
+            )
+
+        self._execute(job, work)
+
+    def _execute(self, job: ScheduleJob, work):
+        job.status = "running"
+        job.phase = "loading"
+        try:
+            def progress(event):
+                job.record(event)
+                if job.cancel_event.is_set():
+                    raise ScheduleJobCancelled()
+
+            if job.cancel_event.is_set():
+                raise ScheduleJobCancelled()
+            result = work(progress)
+            job.result = make_json_safe(result)
+            job.total = job.total or result["statistics"].get("total_classes", 0)
+            job.placed = job.total
+            self._finish(job, "done")
+
+        except ScheduleJobCancelled:
+            logger.info("Sınav programı işi iptal edildi: %s", job.id)
+            self._finish(job, "cancelled")
+        except Exception as e:
+            logger.exception("Sınav programı işi başarısız: %s", job.id)
+            job.error = str(e)
+            self._finish(job, "failed")
+
+    @staticmethod
+    def _finish(job: ScheduleJob, status: str):
+        job.status = status
+        job.phase = "finished"
+        job.finished_at = time.time()
+
+    def _cleanup(self):
+        now = time.time()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and now - job.finished_at > self.ttl
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# 🔹 Admin ve koordinatör router'ları aynı havuzu paylaşır
+schedule_jobs = ScheduleJobManager()
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def job_event_stream(job: ScheduleJob, interval: float | None = None):
+    """
+    İşin ilerlemesini Server-Sent Events olarak akıtır.
+
+    Olaylar her `interval` saniyede bir tek "progress" mesajında toplanır:
+    işin anlık durumu ve son olaylar (en fazla MAX_EVENTS_PER_MESSAGE;
+    fazlası "dropped" ile bildirilir). İş bitince "end" mesajı gönderilir.
+    """
+    interval = max(interval or SCHEDULE_JOB_EVENT_INTERVAL, SCHEDULE_JOB_EVENT_INTERVAL)
+    last_seq = 0
+    last_sent = 0.0
+    last_status = None
+    while True:
+        finished = job.status in FINISHED_STATUSES
+        events, dropped = job.events_since(last_seq)
+        if events or job.status != last_status or finished:
+            if events:
+                last_seq = events[-1]["seq"]
+                dropped += max(0, len(events) - MAX_EVENTS_PER_MESSAGE)
+                events = events[-MAX_EVENTS_PER_MESSAGE:]
+            last_status = job.status
+            yield _sse("end" if finished else "progress", {**job.to_dict(), "events": events, "dropped": dropped})
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= HEARTBEAT_SECONDS:
+            yield ": heartbeat\n\n"
+            last_sent = time.monotonic()
+
+        if finished:
+            return
+        await asyncio.sleep(interval)
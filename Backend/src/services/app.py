@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from Backend.src.DataBase.src.Database_connection import close_database_pool, prewarm_database_pool
+from Backend.src.DataBase.src.migrations import migrate_on_startup
 from Backend.src.DataBase.src.structures.user import User
 from Backend.src.services.Routes.department_coordinator import router as department_coordinator
 from Backend.src.services.Routes.admin import router as admin
@@ -8,7 +11,17 @@ import os
 import datetime
 from dotenv import load_dotenv
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 🔹 İlk istekler bağlantı kurma maliyetini ödemesin diye havuz açılışta doldurulur
+    prewarm_database_pool()
+    migrate_on_startup()
+    yield
+    close_database_pool()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(department_coordinator)
 app.include_router(admin)
@@ -1,3 +1,7 @@
+import hashlib
+import json
+
+
 class ExamProgram:
     def __init__(self):
         self.dersler = []
@@ -12,6 +16,16 @@ class ExamProgram:
         self.exam_conflict = False
         self.start_time = None
         self.end_time = None
+        self.scheduling_strategy = "greedy"
+        # Bir öğrencinin bir günde girebileceği en fazla sınav (None: sınırsız)
+        self.max_exams_per_student_per_day = None
+        # Çoklu başlangıç: 1'den büyükse program bu kadar tohumla oluşturulur
+        # ve en iyisi seçilir; süre (saniye) dolunca yeni tohum başlatılmaz
+        self.multi_start_runs = None
+        self.multi_start_time_budget = None
+        # Yerleştirmeden sonraki yerel arama (iterasyon sayısı / saniye; 0 ve None: kapalı)
+        self.improve_iterations = 0
+        self.improve_time_budget = None
         
     def set_start_end_time(self, start_time, end_time):
         self.start_time = start_time
@@ -44,6 +58,38 @@ class ExamProgram:
     def get_exam_conflict(self):
         return self.exam_conflict
     
+    def set_scheduling_strategy(self, strategy: str):
+        self.scheduling_strategy = strategy
+    
+    def get_scheduling_strategy(self):
+        return self.scheduling_strategy
+    
+    def set_max_exams_per_student_per_day(self, limit):
+        self.max_exams_per_student_per_day = limit
+    
+    def get_max_exams_per_student_per_day(self):
+        return self.max_exams_per_student_per_day
+    
+    def set_multi_start(self, runs, time_budget=None):
+        self.multi_start_runs = runs
+        self.multi_start_time_budget = time_budget
+    
+    def get_multi_start_runs(self):
+        return self.multi_start_runs
+    
+    def get_multi_start_time_budget(self):
+        return self.multi_start_time_budget
+    
+    def set_improvement(self, iterations=0, time_budget=None):
+        self.improve_iterations = iterations
+        self.improve_time_budget = time_budget
+    
+    def get_improve_iterations(self):
+        return self.improve_iterations
+    
+    def get_improve_time_budget(self):
+        return self.improve_time_budget
+    
     def set_dersler(self, dersler):
         self.dersler = dersler
     
@@ -95,4 +141,53 @@ class ExamProgram:
             "varsayilan_sure": self.varsayilan_sure,
             "istisna_dersler": self.istisna_dersler,
             "bekleme_suresi": self.bekleme_suresi
-        }
\ No newline at end of file
+        }
+    
+    def to_request_dict(self) -> dict:
+        """Sunucudaki start_exam_schedule_job isteğinin (ExamProgramRequest) gövdesi."""
+        return {
+            "tarih_baslangic": self.tarih_baslangic,
+            "tarih_bitis": self.tarih_bitis,
+            "haris_gunler": list(self.haris_gunler or []),
+            "sinav_turu": self.sinav_turu,
+            "varsayilan_sure": self.varsayilan_sure,
+            "istisna_dersler": dict(self.istisna_dersler or {}),
+            "bekleme_suresi": self.bekleme_suresi,
+            "excluded_courses": list(self.excluded_courses or []),
+            "exam_conflict": bool(self.exam_conflict),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "scheduling_strategy": self.scheduling_strategy,
+            "max_exams_per_student_per_day": self.max_exams_per_student_per_day,
+            "multi_start_runs": self.multi_start_runs,
+            "multi_start_time_budget": self.multi_start_time_budget,
+            "improve_iterations": self.improve_iterations,
+            "improve_time_budget": self.improve_time_budget,
+        }
+    
+    def fingerprint(self) -> str:
+        """
+        Programı etkileyen ayarların kararlı özeti (sha256). Aynı ayarlar her
+        zaman aynı özeti verir; sıralaması önemsiz listeler sıralanır.
+        """
+        canonical = {
+            "tarih_baslangic": self.tarih_baslangic,
+            "tarih_bitis": self.tarih_bitis,
+            "haris_gunler": sorted(self.haris_gunler or []),
+            "sinav_turu": self.sinav_turu,
+            "varsayilan_sure": self.varsayilan_sure,
+            "istisna_dersler": sorted((self.istisna_dersler or {}).items()),
+            "bekleme_suresi": self.bekleme_suresi,
+            "excluded_courses": sorted(self.excluded_courses or []),
+            "exam_conflict": bool(self.exam_conflict),
+            "start_time": None if self.start_time is None else float(self.start_time),
+            "end_time": None if self.end_time is None else float(self.end_time),
+            "scheduling_strategy": self.scheduling_strategy,
+            "max_exams_per_student_per_day": self.max_exams_per_student_per_day,
+            "multi_start_runs": self.multi_start_runs,
+            "multi_start_time_budget": self.multi_start_time_budget,
+            "improve_iterations": self.improve_iterations,
+            "improve_time_budget": self.improve_time_budget,
+        }
+        payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
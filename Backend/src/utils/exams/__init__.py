@@ -0,0 +1,5 @@
+import logging
+
+# 🔹 Kütüphane varsayılan olarak sessizdir; ayrıntılı çıktı için uygulama
+# "Backend.src.utils.exams" logger'ını DEBUG seviyesine ayarlayabilir.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,210 @@
+"""
+Sınav programı oluşturucu için performans ölçümü.
+
+Kullanım:
+    python -m Backend.src.utils.exams.benchmark --output benchmark.json
+    python -m Backend.src.utils.exams.benchmark --scenarios data_bilgisayar synthetic_large
+
+Her senaryo için create_exam_schedule, create_seating_plan ve
+download_exam_schedule ayrı ayrı ölçülür: duvar saati süresi (tekrarların
+en küçüğü ve ortancası), tracemalloc ile tepe bellek ve yerleştirme kalitesi.
+Sonuçlar JSON olarak kaydedilir; farklı commit'lerin çıktıları karşılaştırılabilir.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from statistics import median
+
+from Backend.src.utils.exams.benchmark_fixtures import load_data_fixture, make_exam_program, synthetic_fixture
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule, create_seating_plan, download_exam_schedule
+from Backend.src.utils.exams.multi_start import schedule_objective, score_schedule
+
+# 🔹 Senaryo adı -> girdi üreticisi ve sınav dönemi
+SCENARIOS = {
+    "data_bilgisayar": {"fixture": ("data", {"name": "bilgisayar", "n_rooms": 20})},
+    "data_endustri": {"fixture": ("data", {"name": "endustri", "n_rooms": 20})},
+    "synthetic_small": {
+        "fixture": ("synthetic", {"n_students": 800, "n_courses": 60, "n_rooms": 15}),
+    },
+    "synthetic_medium": {
+        "fixture": ("synthetic", {"n_students": 5000, "n_courses": 250, "n_rooms": 50}),
+        "last_date": "2025-11-28",
+    },
+    "synthetic_large": {
+        "fixture": ("synthetic", {"n_students": 20000, "n_courses": 800, "n_rooms": 150}),
+        "last_date": "2025-12-12",
+    },
+    "synthetic_large_sparse": {
+        "fixture": ("synthetic", {"n_students": 20000, "n_courses": 800, "n_rooms": 150, "overlap": 0.2}),
+        "last_date": "2025-12-12",
+    },
+}
+
+
+def _build_inputs(scenario: dict, seed: int):
+    kind, params = scenario["fixture"]
+    if kind == "data":
+        return load_data_fixture(seed=seed, **params)
+    return synthetic_fixture(seed=seed, **params)
+
+
+def _measure(function, repeat: int, trace_memory: bool) -> tuple[dict, object]:
+    """function() her çağrıda taze girdiyle çalışmalı; ölçüm ve son sonuç döner."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+
+    measurement = {
+        "wall_time_min": round(min(timings), 6),
+        "wall_time_median": round(median(timings), 6),
+    }
+    # Bellek ayrı bir çalıştırmada ölçülür; tracemalloc süreleri yavaşlatır
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            result = function()
+            measurement["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 3)
+        finally:
+            tracemalloc.stop()
+    return measurement, result
+
+
+def _quality(result: dict) -> dict:
+    quality = schedule_objective(result)
+    quality["score"] = score_schedule(result)
+    stats = result.get("statistics", {})
+    for key in ("total_classes", "successful_classes", "strategy"):
+        quality[key] = stats.get(key)
+    quality["scheduler_metrics"] = stats.get("metrics", {})
+    quality["student_load"] = stats.get("student_load", {})
+    return quality
+
+
+def run_scenario(
+    name: str,
+    strategy: str = "greedy",
+    exam_conflict: bool = True,
+    repeat: int = 3,
+    seed: int = 0,
+    trace_memory: bool = True,
+    export: bool = True
+) -> dict:
+    scenario = SCENARIOS[name]
+    class_dict, classrooms = _build_inputs(scenario, seed)
+    exam_program = make_exam_program(
+        last_date=scenario.get("last_date", "2025-11-14"),
+        exam_conflict=exam_conflict,
+        strategy=strategy
+    )
+
+    report = {
+        "scenario": name,
+        "strategy": strategy,
+        "exam_conflict": exam_conflict,
+        "seed": seed,
+        "size": {
+            "courses": len(class_dict),
+            "students": len({s["student_num"] for info in class_dict.values() for s in info["students"]}),
+            "enrollments": sum(len(info["students"]) for info in class_dict.values()),
+            "rooms": len(classrooms),
+        },
+        "phases": {},
+    }
+
+    # 🔹 1) Yerleştirme (oturma planı olmadan)
+    def schedule():
+        return create_exam_schedule(exam_program, class_dict, classrooms, seed=seed, seating=False)
+
+    report["phases"]["create_exam_schedule"], result = _measure(schedule, repeat, trace_memory)
+    report["quality"] = _quality(result)
+
+    # 🔹 2) Oturma planı (her çalıştırma aynı programın kopyası üzerinde)
+    def seating():
+        exam_schedule = [
+            {**day, "exams": [{**exam, "classes": [dict(cls) for cls in exam["classes"]]} for exam in day["exams"]]}
+            for day in result["exam_schedule"]
+        ]
+        return create_seating_plan(exam_schedule, rng=random.Random(seed))
+
+    report["phases"]["create_seating_plan"], seated = _measure(seating, repeat, trace_memory)
+
+    # 🔹 3) Excel dışa aktarımı
+    if export:
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "exam_schedule.xlsx")
+            report["phases"]["download_exam_schedule"], _ = _measure(
+                lambda: download_exam_schedule(seated, filename), repeat, trace_memory
+            )
+            report["phases"]["download_exam_schedule"]["file_size_kb"] = round(os.path.getsize(filename) / 1024, 1)
+
+    return report
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sınav programı oluşturucu benchmark")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--strategy", default="greedy")
+    parser.add_argument("--no-conflict", action="store_true", help="Paralel (çakışmalı) yerleştirmeyi kapat")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc ölçümünü atla")
+    parser.add_argument("--no-export", action="store_true", help="Excel dışa aktarımını ölçme")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    results = {
+        "commit": _git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "scenarios": [],
+    }
+    for name in args.scenarios:
+        print(f"⏱️ {name} ölçülüyor...")
+        report = run_scenario(
+            name,
+            strategy=args.strategy,
+            exam_conflict=not args.no_conflict,
+            repeat=args.repeat,
+            seed=args.seed,
+            trace_memory=not args.no_memory,
+            export=not args.no_export
+        )
+        results["scenarios"].append(report)
+        phase = report["phases"]["create_exam_schedule"]
+        print(
+            f"   {phase['wall_time_min']:.3f} sn | "
+            f"{phase.get('peak_memory_mb', '-')} MB | "
+            f"yerleşemeyen: {report['quality']['failed_classes']} | "
+            f"skor: {report['quality']['score']:.1f}"
+        )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"✅ Sonuçlar '{args.output}' dosyasına kaydedildi.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import os
+import random
+from typing import List
+
+import pandas as pd
+
+from Backend.src.DataBase.scripts.Utils.process_class_list import process_class_list
+from Backend.src.DataBase.src.utils.get_year_from_str import get_year_from_str
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "Data")
+
+# 🔹 Repodaki gerçek girdiler: (ders listesi, öğrenci listesi, bölüm)
+DATA_FIXTURES = {
+    "bilgisayar": ("Ders Listesi.xlsx", "ogrenci_listesi.xlsx", "Bilgisayar Mühendisliği"),
+    "endustri": ("endüstri_müh_ders.xlsx", "ogrenci_listesi_endustri_v3.xlsx", "Endüstri Mühendisliği"),
+}
+
+
+def make_exam_program(
+    first_date: str = "2025-11-03",
+    last_date: str = "2025-11-14",
+    exam_conflict: bool = True,
+    strategy: str = "greedy"
+) -> ExamProgram:
+    exam_program = ExamProgram()
+    exam_program.set_tarih_araligi(first_date, last_date)
+    exam_program.set_haris_gunler(["Cumartesi", "Pazar"])
+    exam_program.set_sinav_turu("Vize")
+    exam_program.set_start_end_time(9.0, 17.0)
+    exam_program.set_exam_conflict(exam_conflict)
+    exam_program.set_scheduling_strategy(strategy)
+    return exam_program
+
+
+def synthetic_classrooms(n_rooms: int, seed: int = 0) -> List[dict]:
+    """Classroom yapısında derslikler; kapasite sıra düzeninden hesaplanır."""
+    rng = random.Random(seed)
+    classrooms = []
+    for i in range(n_rooms):
+        desk_structure = rng.choice([2, 3, 3, 4])
+        desks_per_row = rng.choice([3, 4, 5])
+        desks_per_column = rng.randint(6, 12)
+        seats_per_desk = 1 if desk_structure <= 2 else 2
+        classrooms.append({
+            "classroom_id": f"D{i + 1:03d}",
+            "classroom_name": f"D{i + 1:03d}",
+            "department_name": "Benchmark",
+            "capacity": desks_per_row * desks_per_column * seats_per_desk,
+            "desks_per_row": desks_per_row,
+            "desks_per_column": desks_per_column,
+            "desk_structure": str(desk_structure),
+        })
+    return classrooms
+
+
+def synthetic_fixture(
+    n_students: int,
+    n_courses: int,
+    n_rooms: int,
+    courses_per_student: int = 6,
+    overlap: float = 0.7,
+    seed: int = 0
+) -> tuple[dict, List[dict]]:
+    """
+    Bölüm ölçeğinde yapay girdi üretir (class_dict, classrooms).
+
+    Dersler 1-4. yıllara eşit dağıtılır. Her öğrencinin derslerinin
+    `overlap` oranı kendi yılının derslerinden, kalanı tüm derslerden
+    (seçmeli gibi) seçilir; overlap arttıkça aynı yıldaki dersler arasındaki
+    çakışma yoğunlaşır.
+    """
+    rng = random.Random(seed)
+    class_dict = {}
+    courses_by_year = {1: [], 2: [], 3: [], 4: []}
+    for i in range(n_courses):
+        year = i % 4 + 1
+        class_id = f"SYN{i + 1:04d}"
+        class_dict[class_id] = {
+            "class_id": class_id,
+            "class_name": f"Ders {i + 1}",
+            "year": year,
+            "instructor": f"Öğr. Üyesi {i % max(1, n_courses // 3) + 1}",
+            "students": [],
+        }
+        courses_by_year[year].append(class_id)
+
+    all_courses = list(class_dict)
+    for s in range(n_students):
+        year = s % 4 + 1
+        own_courses = courses_by_year[year] or all_courses
+        chosen = set()
+        for _ in range(courses_per_student):
+            pool = own_courses if rng.random() < overlap else all_courses
+            chosen.add(rng.choice(pool))
+        student = {"student_num": f"{200000000 + s}", "name": f"Öğrenci{s}", "surname": "Test"}
+        for class_id in chosen:
+            class_dict[class_id]["students"].append(student)
+
+    return class_dict, synthetic_classrooms(n_rooms, seed)
+
+
+def _read_class_list(path: str, department: str) -> dict:
+    df = pd.read_excel(path, header=None)
+
+    # 🔹 Düz tablo (DERS KODU | DERSİN ADI | ... | SINIF) ya da "N. Sınıf" bloklu liste
+    header = [str(v).strip() for v in df.iloc[0].tolist()]
+    if "SINIF" in header:
+        df.columns = header
+        df = df.iloc[1:]
+        rows = zip(df["DERS KODU"], df["DERSİN ADI"], df["DERSİ VEREN ÖĞR. ELEMANI"], df["SINIF"])
+    else:
+        result = process_class_list(df, department, strict=False)
+        classes_df = result["df"] if isinstance(result, dict) else result
+        rows = zip(classes_df["class_id"], classes_df["class_name"], classes_df["teacher"], classes_df["grade"])
+
+    classes = {}
+    for class_id, class_name, teacher, year in rows:
+        if pd.isna(class_id) or pd.isna(class_name):
+            continue
+        try:
+            year = int(year)
+        except (TypeError, ValueError):
+            year = get_year_from_str(str(year))
+        classes[str(class_id).strip()] = {
+            "class_id": str(class_id).strip(),
+            "class_name": str(class_name).strip(),
+            "year": year,
+            "instructor": "" if pd.isna(teacher) else str(teacher).strip(),
+            "students": [],
+        }
+    return classes
+
+
+def load_data_fixture(name: str, n_rooms: int = 20, seed: int = 0) -> tuple[dict, List[dict]]:
+    """
+    Data/ altındaki ders ve öğrenci listelerinden, classes_with_years
+    endpoint'inin döndürdüğü yapıda class_dict üretir. Repoda derslik
+    listesi bulunmadığından derslikler yapay üretilir.
+    """
+    class_file, student_file, department = DATA_FIXTURES[name]
+    class_dict = _read_class_list(os.path.join(DATA_DIR, class_file), department)
+
+    students_df = pd.read_excel(os.path.join(DATA_DIR, student_file))
+    students = {}
+    enrolled = set()
+    for _, row in students_df.iterrows():
+        if pd.isna(row["Öğrenci No"]) or pd.isna(row["Ders"]):
+            continue
+        student_num = row["Öğrenci No"]
+        student_num = str(int(student_num)) if isinstance(student_num, float) else str(student_num).strip()
+        if student_num not in students:
+            name, _, surname = str(row["Ad Soyad"]).strip().partition(" ")
+            students[student_num] = {"student_num": student_num, "name": name, "surname": surname}
+
+        for class_id in str(row["Ders"]).split(","):
+            class_id = class_id.strip()
+            if class_id in class_dict and (class_id, student_num) not in enrolled:
+                enrolled.add((class_id, student_num))
+                class_dict[class_id]["students"].append(students[student_num])
+
+    return class_dict, synthetic_classrooms(n_rooms, seed)
@@ -0,0 +1,86 @@
+from collections import defaultdict
+from itertools import combinations
+from typing import Iterable, List
+
+
+class StudentConflictGraph:
+    """
+    Ders/öğrenci ilişkisini bir kez kurar, çakışma sorgularını sabit zamanda yanıtlar.
+
+    Her öğrenciye yoğun (dense) bir indeks verilir ve her ders, öğrencilerinin
+    bitlerinin yakıldığı bir tamsayı (bitmask) olarak tutulur. Ortak öğrencisi
+    olan ders çiftleri için çakışan öğrenci sayısı önceden hesaplanır; çakışan
+    öğrencilerin listesi yalnızca hata mesajı gerektiğinde iki maskenin AND'i
+    çözülerek çıkarılır.
+    """
+
+    def __init__(self, class_dict: dict):
+        self.student_index = {}
+        self.students = []
+        self.masks = {}
+        self.sizes = {}
+        self.pair_counts = defaultdict(dict)
+
+        classes_of_student = defaultdict(list)
+        indices_of_class = {}
+        for class_id, info in class_dict.items():
+            indices = set()
+            for student in info.get('students', []):
+                student_num = student.get('student_num')
+                if not student_num:
+                    continue
+                index = self.student_index.get(student_num)
+                if index is None:
+                    index = len(self.students)
+                    self.student_index[student_num] = index
+                    self.students.append(student_num)
+                if index not in indices:
+                    indices.add(index)
+                    classes_of_student[index].append(class_id)
+            indices_of_class[class_id] = indices
+
+        # 🔹 Maskeler tek seferde bayt dizisinden kurulur
+        width = (len(self.students) + 7) // 8
+        for class_id, indices in indices_of_class.items():
+            bits = bytearray(width)
+            for index in indices:
+                bits[index >> 3] |= 1 << (index & 7)
+            self.masks[class_id] = int.from_bytes(bits, 'little')
+            self.sizes[class_id] = len(indices)
+
+        # 🔹 Çakışma matrisi: yalnızca ortak öğrencisi olan çiftler saklanır
+        for class_ids in classes_of_student.values():
+            for a, b in combinations(class_ids, 2):
+                self.pair_counts[a][b] = self.pair_counts[a].get(b, 0) + 1
+                self.pair_counts[b][a] = self.pair_counts[b].get(a, 0) + 1
+
+    def __contains__(self, class_id):
+        return class_id in self.masks
+
+    def conflict_count(self, class_a, class_b) -> int:
+        return self.pair_counts.get(class_a, {}).get(class_b, 0)
+
+    def has_conflict(self, class_a, class_b) -> bool:
+        return class_b in self.pair_counts.get(class_a, ())
+
+    def degree(self, class_id) -> int:
+        return len(self.pair_counts.get(class_id, ()))
+
+    def neighbours(self, class_id) -> dict:
+        return self.pair_counts.get(class_id, {})
+
+    def first_conflict(self, class_id, class_ids: Iterable):
+        conflicts = self.pair_counts.get(class_id, {})
+        for other in class_ids:
+            if other in conflicts:
+                return other
+        return None
+
+    def conflicting_students(self, class_a, class_b) -> List:
+        common = self.masks.get(class_a, 0) & self.masks.get(class_b, 0)
+        students = []
+        while common:
+            low = common & -common
+            students.append(self.students[low.bit_length() - 1])
+            common ^= low
+        return students
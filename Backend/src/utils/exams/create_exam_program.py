@@ -1,14 +1,55 @@
 import math
+import logging
 from Backend.src.utils.exams.ExanProgramClass import ExamProgram
-from typing import List
-from queue import Empty, PriorityQueue
-import itertools
+from Backend.src.utils.exams.room_selector import RoomSetSelector
+from Backend.src.utils.exams.conflict_graph import StudentConflictGraph
+from Backend.src.utils.exams.scheduler_metrics import SchedulerMetrics
+from Backend.src.utils.exams.schedule_model import CourseExam, ExamBlock, ExamDay, Placement, ScheduleModel
+from Backend.src.utils.exams.room_occupancy import OwnerReservations, RoomOccupancy
+from Backend.src.utils.exams.schedule_progress import ProgressReporter
+from Backend.src.utils.exams.schedule_export import schedule_sheets, write_schedule_workbook
+from Backend.src.utils.exams.seating_batch import seat_exams, seating_task
+from Backend.src.utils.exams.seat_maps import seat_map
+from Backend.src.utils.exams.seating_grid import AISLE_KIND, CORRIDOR_KIND, SEAT, STUDENT, SeatingGrid, build_seating_grid
+from Backend.src.utils.exams.student_load import add_students, attach_student_load, student_load_statistics, students_fit
+from typing import Callable, List
 from datetime import timedelta, datetime
-import pandas as pd
 import random
+import heapq
 from collections import defaultdict, deque
 
-def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict], max_per_day: int = 2) -> dict:
+SCHEDULING_STRATEGIES = ("greedy", "dsatur")
+# Esnek modda bir yılın bir güne alabileceği ek sınav sayısı (yeniden denemelerde)
+FLEXIBLE_EXTRA = 3
+
+logger = logging.getLogger(__name__)
+
+def exam_schedule_steps(
+    exam_program,
+    class_dict: dict,
+    classrooms: list[dict],
+    max_per_day: int = 2,
+    strategy: str | None = None,
+    seed: int | None = None,
+    seating: bool = True,
+    improve_iterations: int = 0,
+    improve_time_budget: float | None = None,
+    metrics: SchedulerMetrics | None = None,
+    progress: Callable[[dict], None] | None = None,
+    reservations: OwnerReservations | None = None
+):
+    # create_exam_schedule'ın adım adım çalışan hâli: her ders yerleştirildiğinde
+    # ya da yerleştirilemediğinde yield eder, bitince sonucu (StopIteration.value)
+    # döndürür. Ortak programda bölümler bu adımlarla sırayla ilerletilir.
+    # Ortak derslik havuzunda (joint_schedule) derslik doluluğu ve günlük kullanım
+    # sayaçları reservations üzerinden diğer bölümlerle paylaşılır
+    # Sayaçlar ve aşama süreleri statistics['metrics'] altında döner
+    metrics = metrics or SchedulerMetrics()
+    # İlerleme olayları (schedule_progress) progress geri çağrısına iletilir;
+    # geri çağrının fırlattığı istisna (ör. iptal) çalışmayı durdurur
+    reporter = ProgressReporter(progress)
+    # Tohum verilirse çalışma tekrarlanabilir olur (global random etkilenmez)
+    rng = random.Random(seed) if seed is not None else random
     statistics = {}
     error_per_class = {}
     for class_id, info in class_dict.items():
@@ -18,19 +59,145 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
             "errors": set()
         }
 
-    first_date = datetime.fromisoformat(exam_program.get_first_date_of_exam())
-    last_date = datetime.fromisoformat(exam_program.get_last_date_of_exam())
     exam_type = exam_program.get_exam_type()
-    exclude_weekends = exam_program.get_exclude_weekends() #String contains Cumartesi or Pazar
     exclude_classes = exam_program.get_exclude_classes()
 
     used_classrooms_per_day = {}    
 
     # Günleri oluştur
-    exam_schedule = []
+    with metrics.phase("day_generation"):
+        exam_schedule = []
+        for date_str in exam_dates(exam_program):
+            if reservations is not None:
+                occupancy = reservations.occupancy(date_str)
+                used_classrooms = reservations.usage(date_str)
+                for classroom in classrooms:
+                    used_classrooms.setdefault(classroom['classroom_name'], 0)
+            else:
+                occupancy = RoomOccupancy(len(classrooms), exam_program.get_start_time())
+                used_classrooms = {classroom['classroom_name']: 0 for classroom in classrooms}
+            exam_schedule.append(ExamDay(date_str, exam_type, occupancy=occupancy))
+            used_classrooms_per_day[date_str] = used_classrooms
+
+    # Sınıfları yıllara göre grupla (öğrenciler ve derslikler paylaşılan dizilerde tutulur)
+    model = ScheduleModel(classrooms)
+    classes_by_year = {1: [], 2: [], 3: [], 4: []}
+    for class_id, info in class_dict.items():
+        if info.get("class_name", '') in exclude_classes:
+            logger.info("⚠️ '%s' sınav programından hariç tutuldu.", info.get('class_name', class_id))
+            continue
+        year = info.get('year', 0)
+        if year in classes_by_year:
+            classes_by_year[year].append(model.add_course(class_id, info, year))
+
+    # Öğrenci×gün sınav sayacı (her gün kendi satırını görür)
+    student_load = attach_student_load(len(model.students), exam_schedule)
+
+    strategy = strategy or exam_program.get_scheduling_strategy()
+    if strategy not in SCHEDULING_STRATEGIES:
+        raise ValueError(f"Bilinmeyen yerleştirme stratejisi: {strategy}")
+
+    room_selector = RoomSetSelector(classrooms)
+    logger.debug("Derslik seçici hazırlandı: %d derslik", len(room_selector))
+
+    # Öğrenci çakışma grafiği (paralel yerleştirme ve DSatur için) bir kez kurulur
+    conflict_graph = None
+    if exam_program.get_exam_conflict() or strategy == "dsatur":
+        conflict_graph = StudentConflictGraph(class_dict)
+
+    place_classes = _place_dsatur if strategy == "dsatur" else _place_round_robin
+    with metrics.phase("placement"):
+        failed_classes, success_count, flexible_count = yield from place_classes(
+            exam_program,
+            model,
+            exam_schedule,
+            classes_by_year,
+            room_selector,
+            conflict_graph,
+            used_classrooms_per_day,
+            error_per_class,
+            max_per_day,
+            rng,
+            metrics,
+            reporter
+        )
+
+    # --- İsteğe bağlı yerel arama ile iyileştirme ---
+    if improve_iterations or improve_time_budget:
+        from Backend.src.utils.exams.local_search import improve_schedule
+
+        reporter.phase("improvement", failed_classes=len(failed_classes))
+        with metrics.phase("improvement"):
+            report = improve_schedule(
+                exam_program,
+                model,
+                exam_schedule,
+                failed_classes,
+                room_selector,
+                conflict_graph=conflict_graph,
+                error_per_class=error_per_class,
+                used_classrooms_per_day=used_classrooms_per_day,
+                max_per_day=max_per_day,
+                max_iterations=improve_iterations or 10 ** 9,
+                time_budget=improve_time_budget,
+                rng=rng,
+                metrics=metrics
+            )
+        success_count += report['recovered_classes']
+        statistics['local_search'] = report
+
+    # --- Sözlük yapısına dönüşüm (sınır) ---
+    exam_schedule = model.to_dicts(exam_schedule)
+    failed_classes = [model.course_to_dict(course) for course in failed_classes]
+
+    # --- Oturma planı oluştur ---
+    if seating:
+        reporter.phase("seating")
+        with metrics.phase("seating"):
+            exam_schedule = create_seating_plan(exam_schedule, rng=rng, metrics=metrics)
+
+    # --- İstatistikler ---
+    statistics['total_classes'] = len(class_dict)
+    statistics['failed_classes'] = len(failed_classes)
+    statistics['successful_classes'] = success_count
+    statistics['flexible_classes'] = flexible_count
+    statistics['strategy'] = strategy
+    statistics['student_load'] = student_load_statistics(
+        student_load, exam_program.get_max_exams_per_student_per_day()
+    )
+    if seed is not None:
+        statistics['seed'] = seed
+    statistics['metrics'] = metrics.to_dict()
+
+    logger.info("Yerleştirme tamamlandı. Başarılı: %d | Başarısız: %d", success_count, len(failed_classes))
+    reporter.phase("finished", successful_classes=success_count, failed_classes=len(failed_classes))
+
+    return {
+        "exam_schedule": exam_schedule,
+        "failed_classes": failed_classes,
+        "statistics": statistics,
+        "error_per_class": error_per_class
+    }
+    
+def create_exam_schedule(*args, **kwargs) -> dict:
+    """Sınav programını oluşturur; parametreler exam_schedule_steps ile aynıdır."""
+    steps = exam_schedule_steps(*args, **kwargs)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def exam_dates(exam_program: ExamProgram) -> List[str]:
+    """Sınav dönemindeki günler (YYYY-MM-DD); hariç tutulan hafta sonları atlanır."""
+    first_date = datetime.fromisoformat(exam_program.get_first_date_of_exam())
+    last_date = datetime.fromisoformat(exam_program.get_last_date_of_exam())
+    exclude_weekends = exam_program.get_exclude_weekends() #String contains Cumartesi or Pazar
+
+    dates = []
     current_date = first_date
     while current_date <= last_date:
-        date_str = current_date.strftime("%Y-%m-%d")
         if exclude_weekends:
             if current_date.weekday() == 5 and "Cumartesi" in exclude_weekends:
                 current_date += timedelta(days=1)
@@ -38,55 +205,49 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
             if current_date.weekday() == 6 and "Pazar" in exclude_weekends:
                 current_date += timedelta(days=1)
                 continue
-        exam_schedule.append({
-            "date": date_str,
-            "exam_type": exam_type,
-            "exams": []
-        })        
-        used_classrooms_per_day[date_str] = {classroom['classroom_name']: 0 for classroom in classrooms}
+        dates.append(current_date.strftime("%Y-%m-%d"))
         current_date += timedelta(days=1)
+    return dates
 
-    
-    total_days = len(exam_schedule)
 
-    # Sınıfları yıllara göre grupla
-    classes_by_year = {1: [], 2: [], 3: [], 4: []}
-    for class_id, info in class_dict.items():
-        if info.get("class_name", '') in exclude_classes:
-            print(f"⚠️ '{info.get('class_name', class_id)}' sınav programından hariç tutuldu.")
-            continue
-        year = info.get('year', 0)
-        if year in classes_by_year:
-            classes_by_year[year].append({
-                'id': class_id,
-                'name': info.get('class_name', ''),
-                'year': year,
-                'instructor': info.get('instructor', 'N/A'),
-                "students": info.get('students', []),
-                'student_count': len(info.get('students', []))
-            })
+def _place_round_robin(
+    exam_program: ExamProgram,
+    model: ScheduleModel,
+    exam_schedule: List[ExamDay],
+    classes_by_year: dict,
+    room_selector: RoomSetSelector,
+    conflict_graph: StudentConflictGraph | None,
+    used_classrooms_per_day: dict,
+    error_per_class: dict,
+    max_per_day: int,
+    rng=random,
+    metrics: SchedulerMetrics | None = None,
+    progress: ProgressReporter | None = None
+):
+    total_days = len(exam_schedule)
+    progress = progress or ProgressReporter()
+    progress.total = sum(len(classes) for classes in classes_by_year.values())
+    progress.phase("placement")
 
     # Karıştır ve deque'e çevir
     for y in classes_by_year:
-        random.shuffle(classes_by_year[y])
+        rng.shuffle(classes_by_year[y])
         classes_by_year[y] = deque(classes_by_year[y])
 
-    all_classroom_combinations = _find_all_combinations(classrooms)
-    print(f"Tüm sınıf kombinasyonları bulundu: {len(all_classroom_combinations)} adet")
-
     failed_classes = []
     success_count = 0
+    flexible_count = 0
 
     # Günlük yıl sınav sayacı
     daily_year_counts = [defaultdict(int) for _ in range(total_days)]
 
-    print("Dinamik Yerleştirme başlıyor...")
+    logger.debug("Dinamik Yerleştirme başlıyor...")
     round_counter = 0
     start_day = 0  # round-robin başlangıç günü
 
     while any(classes_by_year[y] for y in classes_by_year):
         year_order = [1, 2, 3, 4]
-        random.shuffle(year_order)
+        rng.shuffle(year_order)
 
         for y in year_order:
             if not classes_by_year[y]:
@@ -98,37 +259,42 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
             
             for offset in range(total_days):
                 test_day = (start_day + offset) % total_days
-                test_date = exam_schedule[test_day]['date'] 
+                test_date = exam_schedule[test_day].date 
                 if daily_year_counts[test_day][y] < max_per_day:
                     found_day = test_day
                     found_date = test_date
                     break
 
             if found_day is None:
-                print(f"⚠️   normal yerleştirme yapılamadı. Esnek mod aktif.")
+                logger.debug("⚠️   normal yerleştirme yapılamadı. Esnek mod aktif.")
                 flexible_mode = True
+                progress.flexible_mode(y)
                 
                 min_count = min(daily_year_counts[d][y] for d in range(total_days))
                 for offset in range(total_days):
                     test_day = (start_day + offset) % total_days
-                    test_date = exam_schedule[test_day]['date']
+                    test_date = exam_schedule[test_day].date
                     if daily_year_counts[test_day][y] == min_count:
                         found_day = test_day
                         found_date = test_date
-                        print(f"   🔹 Esnek modda Gün {found_day+1} seçildi (mevcut: {min_count} sınav)")
+                        logger.debug("   🔹 Esnek modda Gün %d seçildi (mevcut: %d sınav)", found_day + 1, min_count)
                         break
 
             if found_day is None:
-                failed_classes.extend(classes_by_year[y])
+                for class_data in classes_by_year[y]:
+                    failed_classes.append(class_data)
+                    progress.failed(class_data)
+                    yield
                 classes_by_year[y].clear()
                 continue
 
             class_data = classes_by_year[y].popleft()
 
-            if flexible_mode:
-                print(f"Gün {found_day + 1} | {class_data['name']} ({y}. sınıf) yerleştiriliyor... [ESNEK MOD]")
-            else:
-                print(f"Gün {found_day + 1} | {class_data['name']} ({y}. sınıf) yerleştiriliyor...")
+            logger.debug(
+                "Gün %d | %s (%d. sınıf) yerleştiriliyor...%s",
+                found_day + 1, class_data.name, y, " [ESNEK MOD]" if flexible_mode else ""
+            )
+            progress.day_chosen(class_data, found_date, flexible_mode)
             
             # ÖNCELİKLE BULDUĞU GÜNÜ DENE
             is_successful = False
@@ -140,13 +306,16 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
                 round_counter,
                 exam_program,
                 current_day, 
-                all_classroom_combinations,
+                room_selector,
+                model,
                 used_classrooms=used_classrooms_per_day[found_date],
-                errors=error_per_class[class_data['name']]
+                errors=error_per_class[class_data.name],
+                conflict_graph=conflict_graph,
+                metrics=metrics
             )
             
             if not is_successful:
-                print(f"   🔄 Gün {found_day+1} başarısız, diğer günler deneniyor...")
+                logger.debug("   🔄 Gün %d başarısız, diğer günler deneniyor...", found_day + 1)
                 
                 for offset in range(total_days):
                     test_day = (start_day + offset) % total_days
@@ -154,13 +323,13 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
                     if test_day in tried_days:
                         continue
                     
-                    max_allowed = max_per_day if not flexible_mode else max_per_day + 3
+                    max_allowed = max_per_day if not flexible_mode else max_per_day + FLEXIBLE_EXTRA
                     if daily_year_counts[test_day][y] >= max_allowed:
                         continue
                     
-                    print(f"      → Gün {test_day+1} deneniyor... (mevcut: {daily_year_counts[test_day][y]})")
+                    logger.debug("      → Gün %d deneniyor... (mevcut: %d)", test_day + 1, daily_year_counts[test_day][y])
                     
-                    test_date = exam_schedule[test_day]['date']
+                    test_date = exam_schedule[test_day].date
                     current_day = exam_schedule[test_day]
                     tried_days.append(test_day)
                     
@@ -169,347 +338,401 @@ def create_exam_schedule(exam_program, class_dict: dict, classrooms: list[dict],
                         round_counter,
                         exam_program,
                         current_day, 
-                        all_classroom_combinations,
+                        room_selector,
+                        model,
                         used_classrooms=used_classrooms_per_day[test_date],
-                        errors=error_per_class[class_data['name']]
+                        errors=error_per_class[class_data.name],
+                        conflict_graph=conflict_graph,
+                        metrics=metrics
                     )
                     
                     if is_successful:
                         found_day = test_day  # Başarılı günü güncelle
                         found_date = test_date
-                        print(f"      ✅ Gün {test_day+1}'de başarılı!")
+                        logger.debug("      ✅ Gün %d'de başarılı!", test_day + 1)
                         break
 
             if is_successful:
                 success_count += 1
+                flexible_count += flexible_mode
                 daily_year_counts[found_day][y] += 1
-                mode_text = "ESNEK MOD" if flexible_mode else "NORMAL"
-                limit_text = f"(limit: {max_per_day})" if daily_year_counts[found_day][y] > max_per_day else ""
-                print(f"  -> BAŞARILI [{mode_text}] ({y}. sınıf - Gün {found_day+1} toplam {daily_year_counts[found_day][y]}) {limit_text}")
-                error_per_class[class_data['name']]['is_error'] = False
-                error_per_class[class_data['name']]['errors'].clear()
+                logger.debug(
+                    "  -> BAŞARILI [%s] (%d. sınıf - Gün %d toplam %d) %s",
+                    "ESNEK MOD" if flexible_mode else "NORMAL", y, found_day + 1, daily_year_counts[found_day][y],
+                    f"(limit: {max_per_day})" if daily_year_counts[found_day][y] > max_per_day else ""
+                )
+                error_per_class[class_data.name]['is_error'] = False
+                error_per_class[class_data.name]['errors'].clear()
+                progress.placed(class_data, exam_schedule[found_day].date, flexible_mode)
+                yield
             else:
                 failed_classes.append(class_data)
-                print(f"  -> BAŞARISIZ: {class_data['name']} (Tüm günler denendi)")
-
+                logger.debug("  -> BAŞARISIZ: %s (Tüm günler denendi)", class_data.name)
+                progress.failed(class_data)
+                yield
 
             start_day = (found_day + 1) % total_days
             round_counter += 1
 
-    # --- Oturma planı oluştur ---
-    exam_schedule = create_seating_plan(exam_schedule)
+    return failed_classes, success_count, flexible_count
 
-    # --- İstatistikler ---
-    statistics['total_classes'] = len(class_dict)
-    statistics['failed_classes'] = len(failed_classes)
-    statistics['successful_classes'] = success_count
 
-    print("\nYerleştirme tamamlandı.")
-    print(f"Başarılı: {success_count} | Başarısız: {len(failed_classes)}")
+def _place_dsatur(
+    exam_program: ExamProgram,
+    model: ScheduleModel,
+    exam_schedule: List[ExamDay],
+    classes_by_year: dict,
+    room_selector: RoomSetSelector,
+    conflict_graph: StudentConflictGraph,
+    used_classrooms_per_day: dict,
+    error_per_class: dict,
+    max_per_day: int,
+    rng=random,
+    metrics: SchedulerMetrics | None = None,
+    progress: ProgressReporter | None = None
+):
+    """
+    DSatur (saturation degree) sırasıyla yerleştirme.
+
+    Günler "renk" olarak düşünülür: her adımda, çakışan (ortak öğrencili)
+    dersleri en fazla farklı güne dağılmış ders seçilir ve önce o derslerin
+    bulunmadığı, yılı için en az yüklü günlere yerleştirilmeye çalışılır.
+    Günlük yıl limiti, zaman aralığı ve derslik kapasitesi kuralları aynen
+    insert_class_to_program üzerinden uygulanır.
+    """
+    total_days = len(exam_schedule)
 
-    return {
-        "exam_schedule": exam_schedule,
-        "failed_classes": failed_classes,
-        "statistics": statistics,
-        "error_per_class": error_per_class
+    pending = {}
+    for y in sorted(classes_by_year):
+        for class_data in classes_by_year[y]:
+            pending[class_data.id] = class_data
+    progress = progress or ProgressReporter()
+    progress.total = len(pending)
+    progress.phase("placement")
+
+    saturation = {class_id: set() for class_id in pending}
+    degree = {
+        class_id: sum(1 for other in conflict_graph.neighbours(class_id) if other in pending)
+        for class_id in pending
     }
-    
-def _find_all_combinations(classrooms: List[dict]) -> List[List[dict]]:
-    n = len(classrooms)
-    all_combinations = []
 
-    MAX_COMBINATION_SIZE = 5
+    failed_classes = []
+    success_count = 0
+    flexible_count = 0
+
+    # Günlük yıl sınav sayacı ve günlük toplam sınav sayısı
+    daily_year_counts = [defaultdict(int) for _ in range(total_days)]
+    daily_totals = [0] * total_days
+
+    logger.debug("DSatur yerleştirme başlıyor...")
+    round_counter = 0
+
+    # 🔹 En doymuş ders; eşitlikte en çok çakışan, sonra en kalabalık ders.
+    # Doygunluk arttıkça yeni kayıt eklenir, eskiyen kayıtlar atlanır.
+    order = {class_id: i for i, class_id in enumerate(pending)}
+
+    def heap_entry(cid):
+        return (-len(saturation[cid]), -degree[cid], -pending[cid].student_count, order[cid], cid)
+
+    heap = [heap_entry(class_id) for class_id in pending]
+    heapq.heapify(heap)
+
+    while pending:
+        entry = heapq.heappop(heap)
+        class_id = entry[-1]
+        if class_id not in pending or -entry[0] != len(saturation[class_id]):
+            continue
+        class_data = pending.pop(class_id)
+        y = class_data.year
+        conflict_days = saturation[class_id]
+
+        def day_order(day):
+            return (day in conflict_days, daily_year_counts[day][y], daily_totals[day], day)
+
+        normal_days = sorted(
+            (d for d in range(total_days) if daily_year_counts[d][y] < max_per_day),
+            key=day_order
+        )
+        flexible_days = sorted(
+            (d for d in range(total_days) if max_per_day <= daily_year_counts[d][y] < max_per_day + FLEXIBLE_EXTRA),
+            key=day_order
+        )
+
+        found_day = None
+        flexible_mode = False
+        for flexible, days in ((False, normal_days), (True, flexible_days)):
+            if flexible and days:
+                logger.debug("⚠️   normal yerleştirme yapılamadı. Esnek mod aktif.")
+                progress.flexible_mode(y)
+            for day in days:
+                logger.debug("Gün %d | %s (%d. sınıf) yerleştiriliyor... [DSatur]", day + 1, class_data.name, y)
+                progress.day_chosen(class_data, exam_schedule[day].date, flexible)
+                is_successful = insert_class_to_program(
+                    class_data,
+                    round_counter,
+                    exam_program,
+                    exam_schedule[day],
+                    room_selector,
+                    model,
+                    used_classrooms=used_classrooms_per_day[exam_schedule[day].date],
+                    errors=error_per_class[class_data.name],
+                    conflict_graph=conflict_graph,
+                    metrics=metrics
+                )
+                if is_successful:
+                    found_day = day
+                    flexible_mode = flexible
+                    break
+            if found_day is not None:
+                break
+
+        if found_day is not None:
+            success_count += 1
+            flexible_count += flexible_mode
+            daily_year_counts[found_day][y] += 1
+            daily_totals[found_day] += 1
+            logger.debug(
+                "  -> BAŞARILI [%s] (%d. sınıf - Gün %d toplam %d)",
+                "ESNEK MOD" if flexible_mode else "NORMAL", y, found_day + 1, daily_year_counts[found_day][y]
+            )
+            error_per_class[class_data.name]['is_error'] = False
+            error_per_class[class_data.name]['errors'].clear()
+            progress.placed(class_data, exam_schedule[found_day].date, flexible_mode)
+            yield
+
+            for other in conflict_graph.neighbours(class_id):
+                if other in pending and found_day not in saturation[other]:
+                    saturation[other].add(found_day)
+                    heapq.heappush(heap, heap_entry(other))
+        else:
+            failed_classes.append(class_data)
+            logger.debug("  -> BAŞARISIZ: %s (Tüm günler denendi)", class_data.name)
+            progress.failed(class_data)
+            yield
+
+        round_counter += 1
+
+    return failed_classes, success_count, flexible_count
 
-    for r in range(1, min(n, MAX_COMBINATION_SIZE) + 1):
-        comb_list = [list(c) for c in itertools.combinations(classrooms, r)]
-        all_combinations.extend(comb_list)
 
-    return all_combinations
-        
 def insert_class_to_program(
-    class_data: dict,
+    class_data: CourseExam,
     priority: int,
     exam_program: ExamProgram,
-    exam_day: dict, 
-    all_classroom_combs: List[dict],
+    exam_day: ExamDay, 
+    room_selector: RoomSetSelector,
+    model: ScheduleModel,
     used_classrooms: dict = {},
-    errors: dict = {}
+    errors: dict = {},
+    conflict_graph: StudentConflictGraph | None = None,
+    metrics: SchedulerMetrics | None = None
 ) -> bool:
-    class_id = class_data['id']
-    class_name = class_data['name']
-    year = class_data['year']
-    student_count = class_data['student_count']
-    students = class_data.get('students', [])
-    instructor = class_data.get('instructor', 'N/A')
+    if metrics is not None:
+        metrics.count("placements_tried")
+    class_id = class_data.id
+    class_name = class_data.name
+    student_count = class_data.student_count
 
     has_exam_conflict = exam_program.get_exam_conflict()
     start_time = exam_program.get_start_time()
     end_time = exam_program.get_end_time()
-    print(f"⏰ Sınav günleri için zaman aralığı: {float_to_time_str(start_time)} - {float_to_time_str(end_time)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("⏰ Sınav günleri için zaman aralığı: %s - %s", float_to_time_str(start_time), float_to_time_str(end_time))
 
     exam_time = exam_program.get_ders_suresi(class_name) / 60
     waiting_after_exam = exam_program.get_bekleme_suresi() / 60
 
-    print(f"🧩 '{class_name}' için sınav süresi: {exam_time} saat, bekleme: {waiting_after_exam} saat")
-
-    exams = exam_day["exams"]
+    logger.debug("🧩 '%s' için sınav süresi: %s saat, bekleme: %s saat", class_name, exam_time, waiting_after_exam)
+
+    exams = exam_day.blocks
+    occupancy = exam_day.occupancy
+    student_load = exam_day.student_load
+
+    # 🔹 Öğrenci başına günlük sınav sınırı: dersin öğrencilerinden biri bu gün
+    # sınıra ulaştıysa gün denenmez (tek bir vektörel max)
+    student_limit = exam_program.get_max_exams_per_student_per_day()
+    if student_load is not None and not students_fit(student_load, class_data.student_array, student_limit):
+        if metrics is not None:
+            metrics.count("student_limit_rejections")
+        logger.debug("❌ %s: öğrenci günlük sınav sınırı (%s) aşılıyor (%s).", class_name, student_limit, exam_day.date)
+        errors['is_error'] = True
+        errors['errors'].add(f"{class_name} için öğrencilerin günlük sınav sınırı ({student_limit}) aşılıyor ({exam_day.date}).")
+        return False
+
+    def record_students():
+        if student_load is not None:
+            add_students(student_load, class_data.student_array)
+
+    def reserve_rooms(start):
+        # 🔹 Derslik, sınav ve ardından gelen bekleme süresi boyunca dolu sayılır
+        return find_suitable_classroom(
+            room_selector,
+            student_count,
+            used_classrooms=used_classrooms,
+            occupancy=occupancy,
+            start=start,
+            end=start + exam_time + waiting_after_exam,
+            metrics=metrics
+        )
 
     # 🔹 Eğer gün boşsa yeni exam block oluştur
     if not exams:
-        new_exam_block = {
-            "end_time": start_time + exam_time + waiting_after_exam,
-            "classes": [{
-                "id": class_id,
-                "name": class_name,
-                "year": year,
-                "student_count": student_count,
-                "students": students,
-                "instructor": instructor,
-                "duration": exam_time,
-                "classrooms": [],
-                "start_time": start_time,
-                "end_time": start_time + exam_time
-            }]
-        }
-
-        classroom = find_suitable_classroom(all_classroom_combs, student_count, used_classrooms=used_classrooms)
+        classroom = reserve_rooms(start_time)
         if classroom is None:
-            print(f"❌ {class_name}: uygun sınıf bulunamadı (boş güne ekleme).")
+            logger.debug("❌ %s: uygun sınıf bulunamadı (boş güne ekleme).", class_name)
             errors['is_error'] = True
             errors['errors'].add(f"{class_name} için Uygun derslik bulunamadı (boş güne ekleme).Yetersiz Kapasite")
             return False
 
-        new_exam_block["classes"][0]["classrooms"] = classroom
-        exams.append(new_exam_block)
-        print(f"✅ '{class_name}' yeni güne yerleştirildi ({exam_day['date']})")
+        exams.append(ExamBlock(
+            start_time + exam_time + waiting_after_exam,
+            [Placement(class_data.index, classroom, start_time, start_time + exam_time, exam_time)]
+        ))
+        logger.debug("✅ '%s' yeni güne yerleştirildi (%s)", class_name, exam_day.date)
+        record_students()
         errors['is_error'] = False
         errors['errors'].clear()
         return True
 
     # 🔹 Sırayla yerleştirmeyi dene
     for exam in exams:
-        if exam["end_time"] + exam_time <= end_time:
-            classroom = find_suitable_classroom(all_classroom_combs, student_count, used_classrooms=used_classrooms)
+        if exam.end_time + exam_time <= end_time:
+            classroom = reserve_rooms(exam.end_time)
             errors['is_error'] = True
             errors['errors'].add(f"{class_name} için Uygun derslik bulunamadı (sırayla ekleme).Yetersiz Kapasite")
             if classroom is None:
                 continue
 
-            exam["classes"].append({
-                "id": class_id,
-                "name": class_name,
-                "year": year,
-                "student_count": student_count,
-                "students": students,
-                "instructor": instructor,
-                "duration": exam_time,
-                "classrooms": classroom,
-                "start_time": exam["end_time"],
-                "end_time": exam["end_time"] + exam_time
-            })
-
-            exam["end_time"] += exam_time + waiting_after_exam
-            print(f"✅ '{class_name}' sırayla yerleştirildi ({exam_day['date']})")
+            exam.placements.append(
+                Placement(class_data.index, classroom, exam.end_time, exam.end_time + exam_time, exam_time)
+            )
+
+            exam.end_time += exam_time + waiting_after_exam
+            logger.debug("✅ '%s' sırayla yerleştirildi (%s)", class_name, exam_day.date)
+            record_students()
             errors['is_error'] = False
             errors['errors'].clear()
             return True
 
-    # 🔹 Çakışma modunu dene
+    # 🔹 Çakışma modunu dene: bloktaki her sınav saatine paralel yerleştirme.
+    # Yalnızca zamanı örtüşen derslerle öğrenci çakışmasına bakılır; derslikler
+    # doluluk tablosundan o saat aralığı için sorgulanır.
     if has_exam_conflict:
-        print(f"⚙️ Çakışma modu aktif — '{class_name}' için paralel yerleştirme deneniyor.")
+        logger.debug("⚙️ Çakışma modu aktif — '%s' için paralel yerleştirme deneniyor.", class_name)
         for exam in exams:
-            has_conflict_with_any = False
-            for existing_class in exam["classes"]:
-                is_conflict, conflict_students = _students_conflict(existing_class, class_data)
-                if is_conflict:
-                    print(f"   ❌ '{class_name}' ile '{existing_class['name']}' arasında öğrenci çakışması var.")
-                    has_conflict_with_any = True
-                    errors['is_error'] = True
-                    errors['errors'].add(f"{class_name} ile {existing_class['name']} arasında öğrenci çakışması var.Çakışan öğrenciler: {', '.join(map(str, conflict_students))}")
-                    break
+            for slot_start in sorted({p.start_time for p in exam.placements}):
+                slot_end = slot_start + exam_time
+                if slot_end > end_time:
+                    continue
 
-            if not has_conflict_with_any:
-                not_suitable_classrooms = [
-                    r['classroom_name']
-                    for c in exam["classes"]
-                    for r in c.get('classrooms', [])
-                ]
-
-                classroom = find_suitable_classroom(
-                    all_classroom_combs,
-                    student_count,
-                    not_suitable_classrooms=not_suitable_classrooms,
-                    used_classrooms=used_classrooms
-                )
+                has_conflict_with_any = False
+                for placement in exam.placements:
+                    if placement.start_time >= slot_end or placement.end_time <= slot_start:
+                        continue
+                    if metrics is not None:
+                        metrics.count("conflict_checks")
+                    existing_class = model.courses[placement.course]
+                    if conflict_graph is not None and class_id in conflict_graph:
+                        is_conflict = conflict_graph.has_conflict(existing_class.id, class_id)
+                        conflict_students = conflict_graph.conflicting_students(existing_class.id, class_id) if is_conflict else []
+                    else:
+                        is_conflict, conflict_students = _students_conflict(model, existing_class, class_data)
+                    if is_conflict:
+                        logger.debug("   ❌ '%s' ile '%s' arasında öğrenci çakışması var.", class_name, existing_class.name)
+                        has_conflict_with_any = True
+                        errors['is_error'] = True
+                        errors['errors'].add(f"{class_name} ile {existing_class.name} arasında öğrenci çakışması var.Çakışan öğrenciler: {', '.join(map(str, conflict_students))}")
+                        break
+
+                if has_conflict_with_any:
+                    continue
+
+                classroom = reserve_rooms(slot_start)
                 if classroom is None:
-                    print(f"❌ {class_name}: uygun sınıf bulunamadı (paralel ekleme).")
+                    logger.debug("❌ %s: uygun sınıf bulunamadı (paralel ekleme).", class_name)
                     errors['is_error'] = True
                     errors['errors'].add(f"{class_name} için Uygun derslik bulunamadı (paralel ekleme).Kapasite Yetersiz")
                     continue
 
-                exam["classes"].append({
-                    "id": class_id,
-                    "name": class_name,
-                    "year": year,
-                    "student_count": student_count,
-                    "students": students,
-                    "instructor": instructor,
-                    "duration": exam_time,
-                    "classrooms": classroom,
-                    "start_time": exam["classes"][0]["start_time"],
-                    "end_time": exam["classes"][0]["start_time"] + exam_time
-                })
-                print(f"⚡ '{class_name}' paralel olarak '{exam['classes'][0]['name']}' ile aynı saatte ({exam_day['date']}) yerleştirildi.")
+                exam.placements.append(
+                    Placement(class_data.index, classroom, slot_start, slot_end, exam_time)
+                )
+                # Sıradaki ardışık sınav bu dersin bitişinden önce başlamasın
+                exam.end_time = max(exam.end_time, slot_end + waiting_after_exam)
+                logger.debug("⚡ '%s' paralel olarak %s saatinde (%s) yerleştirildi.", class_name, float_to_time_str(slot_start), exam_day.date)
+                record_students()
                 errors['is_error'] = False
                 errors['errors'].clear()
                 return True
 
-    print(f"⚠️ '{class_name}' için hiçbir slotta uygun yer bulunamadı.")
+    logger.debug("⚠️ '%s' için hiçbir slotta uygun yer bulunamadı.", class_name)
     errors['is_error'] = True
     errors['errors'].add(f"{class_name} için hiçbir slotta uygun yer bulunamadı.")
     return False
 
 def find_suitable_classroom(
-    all_classroom_combs,
+    room_selector: RoomSetSelector,
     student_count: int,
     not_suitable_classrooms: List = [],
-    used_classrooms: dict = {}
-) -> List[dict] | None:
-    suitable_combinations = PriorityQueue()
-    counter = 0
-
-    for combination in all_classroom_combs:
-        comb_room_names = [r['classroom_name'] for r in combination]
-        total_capacity = sum(r.get('capacity', 0) for r in combination)
-
-        # Uygun değilse atla
-        if total_capacity < student_count:
-            continue
-        if any(n in not_suitable_classrooms for n in comb_room_names):
-            continue
-
-        # 🔹 Günlük kullanım sayılarını hesapla
-        total_usage = sum(used_classrooms.get(name, 0) for name in comb_room_names)
-        
-        # 🔹 Hiç kullanılmamış mı kontrol et
-        is_unused = all(used_classrooms.get(name, 0) == 0 for name in comb_room_names)
-        
-        # 🔹 Öncelik: (hiç kullanılmamışsa 0, kullanılmışsa 1), toplam kullanım, kombinasyon boyutu, kapasite farkı
-        priority = (
-            0 if is_unused else 1,  # 🔹 Önce hiç kullanılmayanlar
-            total_usage,             # 🔹 Sonra en az kullanılanlar
-            len(combination),        # 🔹 Daha az sınıf içeren kombinasyonlar
-            total_capacity - student_count  # 🔹 Kapasite fazlası az olanlar
-        )
-
-        suitable_combinations.put((priority, counter, combination))
-        counter += 1
-
-    if suitable_combinations.empty():
-        print(f"⚠️ Öğrenci sayısı {student_count} için uygun sınıf kombinasyonu bulunamadı.")
+    used_classrooms: dict = {},
+    occupancy: RoomOccupancy | None = None,
+    start: float | None = None,
+    end: float | None = None,
+    metrics: SchedulerMetrics | None = None
+) -> tuple | None:
+    if metrics is not None:
+        metrics.count("room_set_searches")
+    # 🔹 Öncelik: önce hiç kullanılmamış derslikler, sonra en az kullanılanlar,
+    # daha az derslik içeren kombinasyonlar, kapasite fazlası az olanlar.
+    # occupancy verilirse [start, end) aralığında dolu derslikler elenir ve
+    # seçilenler o aralık için işaretlenir. Seçilen dersliklerin indeksleri döner.
+    unavailable = occupancy.busy_rooms(start, end) if occupancy is not None else None
+    best_combination = room_selector.select_indices(
+        student_count,
+        not_suitable_classrooms=not_suitable_classrooms,
+        used_classrooms=used_classrooms,
+        unavailable=unavailable
+    )
+
+    if best_combination is None:
+        logger.debug("⚠️ Öğrenci sayısı %d için uygun sınıf kombinasyonu bulunamadı.", student_count)
         return None
 
-    # 🔹 En uygun kombinasyonu seç
-    best_combination = suitable_combinations.get()[2]
-    clsroom_names = [r['classroom_name'] for r in best_combination]
+    clsroom_names = [room_selector.names[i] for i in best_combination]
     
-    # 🔹 Kullanım durumunu kontrol et
-    usage_counts = [used_classrooms.get(name, 0) for name in clsroom_names]
-    if all(count == 0 for count in usage_counts):
-        print(f"✅ {student_count} öğrenci için seçilen kombinasyon: {clsroom_names} (Hiç kullanılmamış sınıflar)")
-    else:
-        print(f"✅ {student_count} öğrenci için seçilen kombinasyon: {clsroom_names} (Kullanım: {usage_counts})")
-
-    # 🔹 Günlük kullanım sayısını artır
+    # 🔹 Kullanım durumunu kontrol et (yalnızca debug açıkken)
+    if logger.isEnabledFor(logging.DEBUG):
+        usage_counts = [used_classrooms.get(name, 0) for name in clsroom_names]
+        if all(count == 0 for count in usage_counts):
+            logger.debug("✅ %d öğrenci için seçilen kombinasyon: %s (Hiç kullanılmamış sınıflar)", student_count, clsroom_names)
+        else:
+            logger.debug("✅ %d öğrenci için seçilen kombinasyon: %s (Kullanım: %s)", student_count, clsroom_names, usage_counts)
+
+    # 🔹 Günlük kullanım sayısını artır ve zaman aralığını işaretle
     for r_name in clsroom_names:
         used_classrooms[r_name] = used_classrooms.get(r_name, 0) + 1
+    if occupancy is not None:
+        occupancy.reserve(best_combination, start, end)
 
     return best_combination
 
-def _students_conflict(class1: dict, class2: dict):
-    students1 = {s.get('student_num') for s in class1.get('students', []) if s.get('student_num')}
-    students2 = {s.get('student_num') for s in class2.get('students', []) if s.get('student_num')}
+def _students_conflict(model: ScheduleModel, class1: CourseExam, class2: CourseExam):
+    students1 = model.student_nums(class1)
+    students2 = model.student_nums(class2)
     
     conflict_students = students1.intersection(students2)
 
     return not students1.isdisjoint(students2), conflict_students
 
 
-
-def download_exam_schedule(exam_schedule: List[dict], filename: str):
-
-    rows = []
-    for day in exam_schedule:
-        date = day.get("date", "-")
-        exams = day.get("exams", [])
-        for exam in exams:
-            for cls in exam.get("classes", []):
-                instructor = cls.get("instructor", "N/A")
-
-                rows.append({
-                    "Tarih": date,
-                    "Sınav Saati": float_to_time_str(cls.get("start_time", "-")),
-                    "Ders Adı": cls.get("name", "-"),
-                    "Öğretim Elemanı": instructor,
-                    "Derslik": ", ".join([r.get("classroom_name", "-") for r in cls.get("classrooms", [])])
-                })
-
-    if not rows:
-        print("Sınav programında yazdırılacak veri bulunmuyor.")
+def download_exam_schedule(exam_schedule: List[dict], filename: str, department: str | None = None):
+    # 🔹 Satırlar yapıdan doğrudan çalışma kitabına akar (schedule_export)
+    if not any(exam.get("classes") for day in exam_schedule for exam in day.get("exams", [])):
+        logger.warning("Sınav programında yazdırılacak veri bulunmuyor.")
         return
 
-    df = pd.DataFrame(rows)
-
-    writer = pd.ExcelWriter(filename, engine='xlsxwriter')
-    sheet_name = 'Vize Sınav Programı'
-    
-    df.to_excel(writer, sheet_name=sheet_name, startrow=2, header=False, index=False)
-
-    workbook  = writer.book
-    worksheet = writer.sheets[sheet_name]
-
-    title_format = workbook.add_format({
-        'bold': True, 'font_size': 14, 'align': 'center', 'valign': 'vcenter',
-        'bg_color': '#F8CBAD', 'border': 1
-    })
-    header_format = workbook.add_format({
-        'bold': True, 'align': 'center', 'valign': 'vcenter',
-        'bg_color': '#F8CBAD', 'border': 1, 'text_wrap': True
-    })
-    cell_format = workbook.add_format({'border': 1, 'valign': 'vcenter'})
-    center_cell_format = workbook.add_format({'border': 1, 'align': 'center', 'valign': 'vcenter'})
-
-    num_cols = len(df.columns)
-    worksheet.merge_range(0, 0, 0, num_cols - 1, 'BİLGİSAYAR MÜHENDİSLİĞİ BÖLÜMÜ VİZE SINAV PROGRAMI', title_format)
-    worksheet.set_row(0, 30)  # Başlık satırının yüksekliği
-
-    header_data = [{"header": col} for col in df.columns]
-    worksheet.write_row(1, 0, df.columns, header_format)
-    worksheet.set_column('A:A', 15)  # Tarih
-    worksheet.set_column('B:B', 15)  # Sınav Saati
-    worksheet.set_column('C:C', 45)  # Ders Adı
-    worksheet.set_column('D:D', 35)  # Öğretim Elemanı
-    worksheet.set_column('E:E', 35)  # Derslik
-
-
-    date_groups = df.groupby((df['Tarih'] != df['Tarih'].shift()).cumsum())
-    start_row = 2  
-    for _, group in date_groups:
-        if len(group) > 1:
-            end_row = start_row + len(group) - 1
-            worksheet.merge_range(start_row, 0, end_row, 0, group['Tarih'].iloc[0], center_cell_format)
-        
-        worksheet.conditional_format(start_row, 0, start_row + len(group) - 1, num_cols - 1,
-                                     {'type': 'no_blanks', 'format': cell_format})
-        worksheet.conditional_format(start_row, 0, start_row + len(group) - 1, 0,
-                                     {'type': 'no_blanks', 'format': center_cell_format})
-        worksheet.conditional_format(start_row, 0, start_row + len(group) - 1, 1,
-                                     {'type': 'no_blanks', 'format': center_cell_format})
-
-        start_row += len(group)
-
-    writer.close()
-    print(f"Sınav programı '{filename}' dosyasına başarıyla kaydedildi.")
+    write_schedule_workbook(filename, schedule_sheets(exam_schedule, department))
+    logger.info("Sınav programı '%s' dosyasına başarıyla kaydedildi.", filename)
 
 
 def float_to_time_str(hour_float: float) -> str:
@@ -517,116 +740,51 @@ def float_to_time_str(hour_float: float) -> str:
     minute = int(round((hour_float - hour) * 60))
     return f"{hour:02d}:{minute:02d}"
 
-def print_plan(plan, room):
-    if not plan: return
-    max_col = max(key[1] for key in plan.keys())
-    max_row = room['desks_per_column']
-    
-    print(f"\n--- OTURMA PLANI (Yapı: {room['desk_structure']}'li - DÜZELTİLMİŞ) ---")
-    for r in range(max_row):
-        row_str = ""
-        for c in range(max_col + 1):
-            cell = plan.get((r, c))
-            if cell is None: row_str += "[  BOŞ  ] "
-            elif cell == 'AISLE': row_str += " |KORİDOR| "
-            else: row_str += f"[{str(cell):^7}] "
-        print(row_str)
-
-def create_seating_plan(exam_schedule: List[dict]) -> dict:
+def print_plan(grid: SeatingGrid):
+    if grid is None: return
+    labels = {SEAT: "[  BOŞ  ] ", AISLE_KIND: "[   -   ] ", CORRIDOR_KIND: " |KORİDOR| "}
+
+    print(f"\n--- OTURMA PLANI ({grid.room_name or grid.room_id}) ---")
+    for row in grid.rows():
+        print("".join(f"[{student:^7}] " if kind == STUDENT else labels[kind] for kind, student in row))
+
+def create_seating_plan(
+    exam_schedule: List[dict],
+    rng=random,
+    metrics: SchedulerMetrics | None = None,
+    encoding: str = "dense",
+    seed: int | None = None,
+    workers: int | None = None
+) -> dict:
+    # Her derslik için plan SeatingGrid.to_dict(encoding) yapısında saklanır (seating_grid).
+    # Her sınavın tohumu (seed, tarih, ders) üçlüsünden türetilir; seed verilmezse rng'den
+    # çekilir. Planlar toplu hâlde, yük büyükse süreç havuzunda üretilir (seating_batch).
+    base_seed = seed if seed is not None else rng.getrandbits(63)
+
+    targets = []
+    tasks = []
     for day in exam_schedule:
-        exams = day.get("exams", [])
-        for exam in exams:
-            classes = exam.get("classes", [])
-            for cls in classes:
-                classrooms_full_data = cls.get("classrooms", [])
-                classroom_names = [r.get("classroom_name", "-") for r in classrooms_full_data]
-
-                print(f'{cls.get("name", "-")} sınavı için {len(cls.get("students", []))} öğrenci, şu sınıflarda: {", ".join(classroom_names)}')
-
-                students = cls.get("students", []).copy()
-                random.shuffle(students)
-                cls['seating_plan'] = {}
-
-                student_chunks = seperate_students(students, classrooms_full_data)
-
-                for room_data, student_chunk in zip(classrooms_full_data, student_chunks):
-                    student_grid = adjust_seating_plan(room_data, student_chunk)
-
-                    room_name = room_data.get("classroom_id", "Bilinmeyen")
-                    print(f'Seating plan for {room_name}:')
-                    #print_plan(student_grid, room_data)
-                    cls['seating_plan'][room_name] = student_grid
+        for exam in day.get("exams", []):
+            for cls in exam.get("classes", []):
+                logger.debug(
+                    '%s sınavı için %d öğrenci, şu sınıflarda: %s', cls.get("name", "-"), len(cls.get("students", [])),
+                    ", ".join(r.get("classroom_name", "-") for r in cls.get("classrooms", []))
+                )
+                targets.append(cls)
+                tasks.append(seating_task(cls, day.get("date"), base_seed, encoding))
 
-                    print(f'{room_name} has {len(student_chunk)} students')
+    for cls, plans in zip(targets, seat_exams(tasks, workers=workers)):
+        cls['seating_plan'] = dict(plans)
+        if metrics is not None:
+            metrics.count("seating_plans", len(plans))
 
     return exam_schedule
 
 
-def seperate_students(students, classrooms):
-    for room in classrooms:
-        total_capacity = room.get('capacity', 0)
-
-        yield students[0:total_capacity]
-        students = students[total_capacity:]
-
-def adjust_seating_plan(room, students):
-    student_grid = {}
-    desk_structure = int(room['desk_structure'])     # Örn. 3 → Ö S Ö
-    num_rows = int(room['desks_per_column'])
-    num_blocks = int(room['desks_per_row'])
-
-    if desk_structure <= 0:
-        print("Sıra yapısı (desk_structure) pozitif bir sayı olmalıdır.")
-        return {}
-
-    # 🔹 Masa pattern'ını oluştur (örnek: 3 → Ö S Ö)
-    if desk_structure == 1:
-        pattern = ['Ö']
-    elif desk_structure == 2:
-        pattern = ['Ö', 'S']
-    elif desk_structure == 3:
-        pattern = ['Ö', 'S', 'Ö']
-    else:
-        pattern = ['Ö'] + ['S'] * (desk_structure - 2) + ['Ö']
-
-    grid_col_index = 0
-
-    for block in range(num_blocks):
-        # Her blokta pattern'i uygula
-        for symbol in pattern:
-            for r in range(num_rows):
-                if symbol == 'Ö':
-                    student_grid[(r, grid_col_index)] = {
-                        "type": "seat",
-                        "student_num": None
-                    }
-                else:
-                    student_grid[(r, grid_col_index)] = {
-                        "type": "empty"
-                    }
-            grid_col_index += 1
-
-        # Bloklar arası koridor
-        if block < num_blocks - 1:
-            for r in range(num_rows):
-                student_grid[(r, grid_col_index)] = {"type": "corridor"}
-            grid_col_index += 1
-
-    # 🔹 Öğrencileri sırayla yerleştir
-    student_iterator = iter(students)
-    for c in range(grid_col_index):
-        for r in range(num_rows):
-            cell = student_grid.get((r, c))
-            if cell["type"] != "seat":
-                continue
-            try:
-                student = next(student_iterator)
-                cell["student_num"] = student.get("student_num")
-            except StopIteration:
-                # Kalan koltukları boş yap
-                if cell["type"] == "seat":
-                    cell["type"] = "empty"
-                    del cell["student_num"]
-                return student_grid
-
-    return student_grid
+def adjust_seating_plan(room, students) -> SeatingGrid | None:
+    # 🔹 Öğrenciler sütun sütun yerleştirilir; düzen önbellekteki şablondan gelir
+    layout = seat_map(room)
+    if layout.template is None:
+        logger.warning("Sıra yapısı (desk_structure) pozitif bir sayı olmalıdır.")
+        return None
+    return build_seating_grid(room, [student.get("student_num") for student in students], layout.template, layout.seats)
@@ -0,0 +1,196 @@
+import logging
+import math
+import time
+from collections import Counter
+
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+from Backend.src.utils.exams.create_exam_program import FLEXIBLE_EXTRA, exam_dates
+from Backend.src.utils.exams.seat_maps import seat_capacity
+
+logger = logging.getLogger(__name__)
+
+ERROR = "error"
+WARNING = "warning"
+
+# Tanıda listelenecek en fazla ders adı
+MAX_LISTED_CLASSES = 20
+
+
+def _diagnostic(diagnostics: list, code: str, severity: str, message: str, **details):
+    diagnostics.append({"code": code, "severity": severity, "message": message, **details})
+
+
+def analyze_feasibility(
+    exam_program: ExamProgram,
+    class_dict: dict,
+    classrooms: list[dict],
+    max_per_day: int = 2
+) -> dict:
+    """
+    Yerleştirmeye başlamadan önce girdilerin olurluğunu ucuz alt sınırlarla
+    denetler (milisaniyeler mertebesinde):
+
+    - sınav günü sayısı ve günlük zaman aralığı,
+    - zaman aralığından uzun sınavlar,
+    - tüm dersliklerin toplam kapasitesini aşan dersler,
+    - gereken ve mevcut koltuk-saat,
+    - yıl başına ders sayısı ile gün × günlük sınır (esnek mod dahil; yalnızca uyarı),
+    - çakışmasız modda bir güne sığabilecek toplam sınav süresi,
+    - öğrenci başına günlük sınav sınırı verilmişse en yoğun öğrenci.
+
+    "error" seviyesindeki bir tanı, programın bu girdilerle tamamlanamayacağını
+    kesin olarak gösterir; "warning" yalnızca risklidir. Sonuç
+    {"feasible", "diagnostics", "bounds", "elapsed_ms"} sözlüğüdür.
+    """
+    started = time.perf_counter()
+    diagnostics = []
+
+    # 🔹 Günler ve zaman aralığı
+    try:
+        days = len(exam_dates(exam_program))
+    except (TypeError, ValueError) as e:
+        days = 0
+        _diagnostic(diagnostics, "INVALID_DATE_RANGE", ERROR, f"Sınav tarihleri okunamadı: {e}")
+    else:
+        if days == 0:
+            _diagnostic(diagnostics, "NO_EXAM_DAYS", ERROR, "Seçilen tarih aralığında sınav yapılabilecek gün yok.")
+
+    start_time = exam_program.get_start_time() or 0.0
+    end_time = exam_program.get_end_time() or 0.0
+    window = end_time - start_time
+    if window <= 0:
+        _diagnostic(diagnostics, "INVALID_TIME_WINDOW", ERROR, "Sınav bitiş saati başlangıç saatinden sonra olmalı.")
+    waiting = exam_program.get_bekleme_suresi() / 60
+
+    # 🔹 Programa girecek dersler (create_exam_schedule ile aynı süzme)
+    excluded = set(exam_program.get_exclude_classes() or [])
+    classes = []
+    skipped_years = []
+    for class_id, info in class_dict.items():
+        name = info.get("class_name", "")
+        if name in excluded:
+            continue
+        if info.get("year", 0) not in (1, 2, 3, 4):
+            skipped_years.append(name or str(class_id))
+            continue
+        classes.append((name, info.get("year"), len(info.get("students", [])), exam_program.get_ders_suresi(name) / 60))
+
+    if skipped_years:
+        _diagnostic(
+            diagnostics, "YEAR_OUT_OF_RANGE", WARNING,
+            f"{len(skipped_years)} dersin sınıf bilgisi 1-4 dışında; bu dersler programa alınmaz.",
+            classes=skipped_years[:MAX_LISTED_CLASSES]
+        )
+
+    # 🔹 Zaman aralığından uzun sınavlar
+    if window > 0:
+        too_long = [name for name, _, _, duration in classes if duration > window]
+        if too_long:
+            _diagnostic(
+                diagnostics, "EXAM_LONGER_THAN_WINDOW", ERROR,
+                f"{len(too_long)} dersin sınav süresi günlük sınav aralığından ({window:g} saat) uzun.",
+                classes=too_long[:MAX_LISTED_CLASSES]
+            )
+
+    # 🔹 Kapasite: derslik kümesi sınırsız olduğundan en büyük küme tüm dersliklerdir
+    capacities = [seat_capacity(r) for r in classrooms]
+    total_capacity = sum(capacities)
+    largest_class = max((count for _, _, count, _ in classes), default=0)
+    if total_capacity <= 0:
+        _diagnostic(diagnostics, "NO_CLASSROOMS", ERROR, "Sınav için kapasitesi olan derslik yok.")
+    else:
+        oversized = [name for name, _, count, _ in classes if count > total_capacity]
+        if oversized:
+            _diagnostic(
+                diagnostics, "CLASS_EXCEEDS_CAPACITY", ERROR,
+                f"{len(oversized)} dersin öğrenci sayısı tüm dersliklerin toplam kapasitesini ({total_capacity}) aşıyor.",
+                classes=oversized[:MAX_LISTED_CLASSES]
+            )
+
+    # 🔹 Koltuk-saat alt sınırı
+    seat_hours_needed = sum(count * duration for _, _, count, duration in classes)
+    seat_hours_available = total_capacity * max(window, 0) * days
+    if seat_hours_needed > seat_hours_available and total_capacity > 0 and days:
+        _diagnostic(
+            diagnostics, "SEAT_HOURS", ERROR,
+            f"Gereken koltuk-saat ({seat_hours_needed:.0f}) dönemdeki toplamı ({seat_hours_available:.0f}) aşıyor.",
+            needed=round(seat_hours_needed, 2), available=round(seat_hours_available, 2)
+        )
+
+    # 🔹 Yıl başına günlük sınır: esnek mod ilk denemede en az yüklü güne sınırsız
+    # yerleştirir, max_per_day + FLEXIBLE_EXTRA yalnızca yeniden denemelerde
+    # uygulanır; bu yüzden bu sınır kesin değildir ve hata değil uyarıdır
+    per_year = Counter(year for _, year, _, _ in classes)
+    year_bounds = {}
+    for year in sorted(per_year):
+        count = per_year[year]
+        normal = days * max_per_day
+        flexible = days * (max_per_day + FLEXIBLE_EXTRA)
+        year_bounds[year] = {"classes": count, "normal_capacity": normal, "flexible_capacity": flexible}
+        if count > flexible:
+            _diagnostic(
+                diagnostics, "YEAR_LIMIT", WARNING,
+                f"{year}. sınıfın {count} dersi var; {days} güne esnek modla {flexible} dersten fazlası "
+                f"yerleştirilirse günlerin yükü dengesiz olur.",
+                year=year, classes_count=count, capacity=flexible
+            )
+        elif count > normal:
+            _diagnostic(
+                diagnostics, "YEAR_NEEDS_FLEXIBLE", WARNING,
+                f"{year}. sınıfın {count} dersi günde {max_per_day} sınırıyla {days} güne sığmıyor; esnek mod gerekecek.",
+                year=year, classes_count=count, capacity=normal
+            )
+
+    # 🔹 Çakışmasız modda her gün tek bir ardışık sınav dizisidir
+    if not exam_program.get_exam_conflict() and window > 0 and days:
+        sequential_needed = sum(duration + waiting for _, _, _, duration in classes)
+        sequential_available = days * (window + waiting)
+        if sequential_needed > sequential_available:
+            _diagnostic(
+                diagnostics, "SEQUENTIAL_TIME", ERROR,
+                f"Çakışmasız modda sınavlar ardışık yapılır: gereken süre {sequential_needed:.1f} saat, "
+                f"dönemde {sequential_available:.1f} saat var. Çakışma modunu açın ya da tarihleri genişletin.",
+                needed=round(sequential_needed, 2), available=round(sequential_available, 2)
+            )
+
+    # 🔹 Öğrenci başına günlük sınav sınırı
+    student_limit = exam_program.get_max_exams_per_student_per_day()
+    busiest_student = 0
+    if student_limit and days:
+        names = {name for name, _, _, _ in classes}
+        exams_per_student = Counter(
+            student.get("student_num")
+            for info in class_dict.values() if info.get("class_name", "") in names
+            for student in info.get("students", [])
+        )
+        busiest_student = max(exams_per_student.values(), default=0)
+        days_needed = math.ceil(busiest_student / student_limit)
+        if days_needed > days:
+            overloaded = sum(1 for n in exams_per_student.values() if math.ceil(n / student_limit) > days)
+            _diagnostic(
+                diagnostics, "STUDENT_DAY_LIMIT", ERROR,
+                f"{overloaded} öğrencinin sınavları günde {student_limit} sınırıyla {days} güne sığmıyor "
+                f"(en yoğun öğrenci: {busiest_student} sınav).",
+                students=overloaded, busiest_student=busiest_student
+            )
+
+    feasible = not any(d["severity"] == ERROR for d in diagnostics)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info("Olurluk analizi: %s (%d tanı, %.1f ms)", "uygun" if feasible else "uygun değil", len(diagnostics), elapsed_ms)
+
+    return {
+        "feasible": feasible,
+        "diagnostics": diagnostics,
+        "bounds": {
+            "exam_days": days,
+            "time_window_hours": window,
+            "total_classes": len(classes),
+            "total_capacity": total_capacity,
+            "largest_class": largest_class,
+            "seat_hours_needed": round(seat_hours_needed, 2),
+            "seat_hours_available": round(seat_hours_available, 2),
+            "per_year": year_bounds,
+            "busiest_student_exams": busiest_student,
+        },
+        "elapsed_ms": round(elapsed_ms, 3),
+    }
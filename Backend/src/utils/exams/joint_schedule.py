@@ -0,0 +1,113 @@
+import logging
+from typing import Callable, Dict, List, Tuple
+
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+from Backend.src.utils.exams.create_exam_program import exam_schedule_steps
+from Backend.src.utils.exams.room_occupancy import RoomReservationTable
+
+logger = logging.getLogger(__name__)
+
+
+def shared_classroom_pool(classrooms_per_department: Dict[str, List[dict]]) -> List[dict]:
+    """
+    Bölümlerin derslik listelerini tek bir havuzda birleştirir. Aynı derslik
+    (classroom_id, yoksa classroom_name) bir kez alınır; sıra bölüm adına göre
+    sabittir, böylece derslik indeksleri her çalışmada aynıdır.
+    """
+    pool = []
+    seen = set()
+    for department in sorted(classrooms_per_department):
+        for classroom in classrooms_per_department[department]:
+            key = classroom.get("classroom_id", classroom.get("classroom_name"))
+            if key in seen:
+                continue
+            seen.add(key)
+            pool.append(classroom)
+    return pool
+
+
+def create_joint_exam_schedule(
+    departments: Dict[str, Tuple[ExamProgram, dict]],
+    classrooms: List[dict],
+    max_per_day: int = 2,
+    seed: int = 0,
+    seating: bool = True,
+    improve_iterations: int = 0,
+    improve_time_budget: float | None = None,
+    progress: Callable[[dict], None] | None = None
+) -> dict:
+    """
+    Birden fazla bölümün sınav programını ortak derslik havuzuyla birlikte oluşturur.
+
+    departments: bölüm adı -> (ExamProgram, class_dict)
+    classrooms: tüm bölümlerin kullanabileceği ortak derslik havuzu
+
+    Bölümler tek iş parçacığında, dönüşümlü ve belirlenimci bir sırayla
+    programlanır: her bölümün zamanlayıcısı adım adım (exam_schedule_steps)
+    ilerletilir ve bölümler bölüm adına göre sabit sırayla birer ders
+    yerleştirir (ya da yerleştiremez). Derslik-zaman rezervasyonları küresel
+    bir tabloda (RoomReservationTable) tutulduğundan hiçbir derslik aynı saatte
+    iki bölüme verilmez; dönüşümlü sıra da iyi dersliklerin bölümler arasında
+    paylaşılmasını sağlar. Yerleştirmeyi bitiren bölüm yerel aramasını ve
+    oturma planlarını kendi adımında tamamlar. Aynı girdiler her zaman aynı
+    programı verir. Her bölümün sonucu create_exam_schedule ile aynı yapıdadır.
+
+    Olaylar progress'e "department" alanıyla iletilir; geri çağrının fırlattığı
+    istisna (ör. iptal) tüm bölümleri durdurur ve create_joint_exam_schedule'dan yükselir.
+    """
+    if not departments:
+        raise ValueError("Ortak program için en az bir bölüm gerekli.")
+
+    names = sorted(departments)
+    day_start = min(program.get_start_time() or 0.0 for program, _ in departments.values())
+    table = RoomReservationTable(len(classrooms), day_start)
+
+    def department_progress(name: str):
+        if progress is None:
+            return None
+        return lambda event: progress({**event, "department": name})
+
+    steps = {}
+    for name in names:
+        exam_program, class_dict = departments[name]
+        steps[name] = exam_schedule_steps(
+            exam_program,
+            class_dict,
+            classrooms,
+            max_per_day=max_per_day,
+            seed=seed,
+            seating=seating,
+            improve_iterations=improve_iterations,
+            improve_time_budget=improve_time_budget,
+            progress=department_progress(name),
+            reservations=table.owner(name)
+        )
+
+    # 🔹 Her turda sıradaki bölüm bir ders ilerler; biten bölüm sıradan çıkar
+    results = {}
+    active = list(names)
+    try:
+        while active:
+            for name in list(active):
+                try:
+                    next(steps[name])
+                except StopIteration as stop:
+                    results[name] = stop.value
+                    active.remove(name)
+    finally:
+        for department_steps in steps.values():
+            department_steps.close()
+
+    statistics = {
+        "departments": names,
+        "shared_classrooms": len(classrooms),
+        "total_classes": sum(r["statistics"]["total_classes"] for r in results.values()),
+        "successful_classes": sum(r["statistics"]["successful_classes"] for r in results.values()),
+        "failed_classes": sum(r["statistics"]["failed_classes"] for r in results.values()),
+        "reservations": table.statistics(),
+    }
+    logger.info(
+        "Ortak program tamamlandı (%d bölüm, %d derslik). Başarılı: %d | Başarısız: %d",
+        len(names), len(classrooms), statistics["successful_classes"], statistics["failed_classes"]
+    )
+    return {"departments": results, "statistics": statistics}
@@ -0,0 +1,353 @@
+import logging
+import math
+import random
+import time
+from collections import Counter, defaultdict, deque
+from typing import List
+
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+from Backend.src.utils.exams.conflict_graph import StudentConflictGraph
+from Backend.src.utils.exams.create_exam_program import FLEXIBLE_EXTRA, insert_class_to_program
+from Backend.src.utils.exams.multi_start import DEFAULT_OBJECTIVE_WEIGHTS
+from Backend.src.utils.exams.room_selector import RoomSetSelector
+from Backend.src.utils.exams.schedule_model import CourseExam, ExamDay, Placement, ScheduleModel
+from Backend.src.utils.exams.scheduler_metrics import SchedulerMetrics
+
+logger = logging.getLogger(__name__)
+
+INITIAL_TEMPERATURE = 20.0
+COOLING_RATE = 0.995
+MIN_TEMPERATURE = 1e-3
+TABU_LENGTH = 7
+# Kaç iterasyonda bir başarısız dersler tekrar denenir
+RETRY_FAILED_EVERY = 50
+# Tabuda olmayan ders çekilirken en fazla deneme sayısı
+MAX_DRAWS = 32
+
+
+class _ScheduleState:
+    """
+    exam_schedule üzerinde amaç fonksiyonunu artımlı tutar.
+
+    Her gün için yük (sınav sayısı), yıl sayaçları ve kullanılan derslik sayısı
+    saklanır; bir hamle yalnızca dokunduğu günleri yeniden sayar ve toplamlar
+    farkla güncellenir.
+
+    usage: greedy yerleştirmenin günlük derslik kullanım sözlükleri (ortak
+    havuzda diğer bölümlerle paylaşılır). Hamleler bu sözlüklerde yalnızca
+    bu programın yerleşimlerinin payını çıkarıp ekler.
+    """
+
+    def __init__(self, model, exam_schedule, failed_classes, max_per_day, weights, usage):
+        self.model = model
+        self.days = exam_schedule
+        self.max_per_day = max_per_day
+        self.weights = weights
+        self.failed = {cls.id: cls for cls in failed_classes}
+        self.day_of = {}
+        self.loads = [0] * len(exam_schedule)
+        self.year_counts = [defaultdict(int) for _ in exam_schedule]
+        self.rooms = [0] * len(exam_schedule)
+        self.overflows = [0] * len(exam_schedule)
+        self.usage = usage
+
+        self.sum_load = 0
+        self.sum_sq = 0
+        self.total_rooms = 0
+        self.total_overflow = 0
+        for d in range(len(exam_schedule)):
+            self.refresh_day(d)
+
+    def placements_of(self, d) -> List[Placement]:
+        placements = [p for block in self.days[d].blocks for p in block.placements]
+        placements.sort(key=lambda p: p.start_time)
+        return placements
+
+    def classes_of(self, d) -> List[CourseExam]:
+        return [self.model.courses[p.course] for p in self.placements_of(d)]
+
+    def refresh_day(self, d):
+        self.sum_load -= self.loads[d]
+        self.sum_sq -= self.loads[d] ** 2
+        self.total_rooms -= self.rooms[d]
+        self.total_overflow -= self.overflows[d]
+
+        year_counts = defaultdict(int)
+        load = rooms = 0
+        for placement in self.placements_of(d):
+            cls = self.model.courses[placement.course]
+            load += 1
+            rooms += len(placement.rooms)
+            year_counts[cls.year] += 1
+            self.day_of[cls.id] = d
+        self.loads[d] = load
+        self.rooms[d] = rooms
+        self.year_counts[d] = year_counts
+        self.overflows[d] = sum(max(0, c - self.max_per_day) for c in year_counts.values())
+
+        self.sum_load += load
+        self.sum_sq += load ** 2
+        self.total_rooms += rooms
+        self.total_overflow += self.overflows[d]
+
+    def value(self) -> float:
+        n = len(self.days) or 1
+        mean = self.sum_load / n
+        variance = self.sum_sq / n - mean ** 2
+        w = self.weights
+        return (
+            w.get("failed_classes", 0) * len(self.failed)
+            + w.get("flexible_classes", 0) * self.total_overflow
+            + w.get("rooms_used", 0) * self.total_rooms
+            + w.get("day_load_variance", 0) * variance
+        )
+
+    def room_uses(self, d) -> Counter:
+        """Günün yerleşimlerinin derslik kullanım sayıları (greedy her yerleşimde bir artırır)."""
+        return Counter(self.model.rooms[room].name for p in self.placements_of(d) for room in p.rooms)
+
+    def release_usage(self, d):
+        usage = self.usage[d]
+        for name, count in self.room_uses(d).items():
+            usage[name] = usage.get(name, 0) - count
+
+    def snapshot(self, d):
+        day = self.days[d]
+        return (
+            d,
+            list(day.blocks),
+            [(block, block.end_time, list(block.placements)) for block in day.blocks],
+            day.occupancy.snapshot() if day.occupancy is not None else None,
+            day.student_load.copy() if day.student_load is not None else None,
+            self.room_uses(d),
+        )
+
+    def restore(self, snapshot):
+        d, blocks, saved, occupancy, student_load, room_uses = snapshot
+        self.release_usage(d)
+        usage = self.usage[d]
+        for name, count in room_uses.items():
+            usage[name] = usage.get(name, 0) + count
+        for block, end_time, placements in saved:
+            block.end_time = end_time
+            block.placements = placements
+        self.days[d].blocks = blocks
+        if occupancy is not None:
+            self.days[d].occupancy.restore(occupancy)
+        if student_load is not None:
+            # Satır paylaşılan öğrenci×gün sayacının görünümüdür; yerinde yazılır
+            self.days[d].student_load[:] = student_load
+        self.refresh_day(d)
+
+
+def improve_schedule(
+    exam_program: ExamProgram,
+    model: ScheduleModel,
+    exam_schedule: List[ExamDay],
+    failed_classes: List[CourseExam],
+    room_selector: RoomSetSelector,
+    conflict_graph: StudentConflictGraph | None = None,
+    error_per_class: dict | None = None,
+    used_classrooms_per_day: dict | None = None,
+    max_per_day: int = 2,
+    max_iterations: int = 1000,
+    time_budget: float | None = None,
+    weights: dict | None = None,
+    rng=random,
+    metrics: SchedulerMetrics | None = None
+) -> dict:
+    """
+    Greedy yerleştirme sonrası tavlama benzetimi (simulated annealing) ile
+    iyileştirme. Hamleler: bir dersi başka güne taşıma, iki dersi takas etme
+    ve bir günü o ders önce gelecek şekilde yeniden kurarak derslik kümesini
+    yeniden seçtirme. Kısa bir tabu listesi son taşınan dersleri bekletir.
+    Başarısız dersler başta ve belirli aralıklarla yeniden denenir.
+
+    Bir hamlenin maliyeti yalnızca dokunduğu günlerle orantılıdır: en iyi
+    duruma dönüş için tüm program kopyalanmaz, en iyi durumdan bu yana
+    değişen günlerin o anki görüntüleri bir geri alma kaydında tutulur.
+
+    exam_schedule, failed_classes ve used_classrooms_per_day (tarih -> derslik
+    kullanım sayıları; greedy yerleştirmeyle aynı sözlükler) yerinde
+    güncellenir; iyileşme raporu döner. used_classrooms_per_day verilmezse
+    sayaçlar programdaki yerleşimlerden kurulur.
+    """
+    weights = weights or DEFAULT_OBJECTIVE_WEIGHTS
+    if used_classrooms_per_day is None:
+        used_classrooms_per_day = {}
+    usage = [used_classrooms_per_day.setdefault(day.date, {}) for day in exam_schedule]
+    state = _ScheduleState(model, exam_schedule, failed_classes, max_per_day, weights, usage)
+    if not any(usage):
+        for d in range(len(exam_schedule)):
+            usage[d].update(state.room_uses(d))
+    started = time.perf_counter()
+    initial_value = state.value()
+    initial_failed = len(state.failed)
+    total_days = len(exam_schedule)
+
+    def insert(cls, d) -> bool:
+        return insert_class_to_program(
+            cls,
+            0,
+            exam_program,
+            exam_schedule[d],
+            room_selector,
+            model,
+            used_classrooms=state.usage[d],
+            errors={"is_error": False, "errors": set()},
+            conflict_graph=conflict_graph,
+            metrics=metrics
+        )
+
+    def year_allows(cls, d) -> bool:
+        return state.year_counts[d][cls.year] < max_per_day + FLEXIBLE_EXTRA
+
+    def rebuild(d, classes) -> bool:
+        state.release_usage(d)
+        exam_schedule[d].blocks = []
+        if exam_schedule[d].occupancy is not None:
+            exam_schedule[d].occupancy.clear()
+        if exam_schedule[d].student_load is not None:
+            exam_schedule[d].student_load[:] = 0
+        for cls in classes:
+            if not insert(cls, d):
+                return False
+        state.refresh_day(d)
+        return True
+
+    def retry_failed():
+        recovered = 0
+        for class_id, cls in list(state.failed.items()):
+            days = sorted(range(total_days), key=lambda d: (state.year_counts[d][cls.year], state.loads[d]))
+            for d in days:
+                if not year_allows(cls, d):
+                    continue
+                snap = state.snapshot(d)
+                if insert(cls, d):
+                    state.refresh_day(d)
+                    undo.setdefault(d, snap)
+                    del state.failed[class_id]
+                    pool.append(class_id)
+                    recovered += 1
+                    if error_per_class is not None and cls.name in error_per_class:
+                        error_per_class[cls.name]["is_error"] = False
+                        error_per_class[cls.name]["errors"].clear()
+                    break
+                state.restore(snap)
+        return recovered
+
+    def draw(accept=None):
+        """Havuzdan tabuda olmayan (ve accept'i sağlayan) rastgele bir ders; bulunamazsa None."""
+        for _ in range(MAX_DRAWS):
+            class_id = rng.choice(pool)
+            if class_id not in tabu and (accept is None or accept(class_id)):
+                return class_id
+        return None
+
+    # Yerleştirilmiş dersler; üyelik yalnızca başarısız bir ders kurtarılınca değişir
+    pool = list(state.day_of)
+    # En iyi durumdan bu yana değişen günlerin, en iyi durumdaki görüntüleri
+    undo = {}
+    tabu = deque(maxlen=TABU_LENGTH)
+    retry_failed()
+
+    def mark_best():
+        undo.clear()
+        return state.value(), dict(state.failed)
+
+    temperature = INITIAL_TEMPERATURE
+    iterations = accepted = 0
+    # Tavlama daha kötü durumları da kabul ettiğinden en iyi durum saklanır
+    best_value, best_failed = mark_best()
+    current = best_value
+
+    while iterations < max_iterations and total_days > 1:
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            break
+        iterations += 1
+        if iterations % RETRY_FAILED_EVERY == 0 and state.failed:
+            retry_failed()
+            current = state.value()
+            if current < best_value:
+                best_value, best_failed = mark_best()
+
+        if len(pool) <= len(tabu) and all(cid in tabu for cid in pool):
+            break
+        class_id = draw()
+        if class_id is None:
+            continue
+        d1 = state.day_of[class_id]
+        move = rng.random()
+
+        if move < 0.5:
+            # 🔹 Taşıma: dersi başka bir güne al
+            d2 = rng.randrange(total_days - 1)
+            d2 += d2 >= d1
+            touched = [d1, d2]
+            snaps = [state.snapshot(d) for d in touched]
+            cls = next(c for c in state.classes_of(d1) if c.id == class_id)
+            ok = year_allows(cls, d2) and rebuild(d1, [c for c in state.classes_of(d1) if c.id != class_id])
+            ok = ok and insert(cls, d2)
+        elif move < 0.8:
+            # 🔹 Takas: iki farklı gündeki dersleri yer değiştir
+            other_id = draw(lambda cid: state.day_of[cid] != d1)
+            if other_id is None:
+                continue
+            d2 = state.day_of[other_id]
+            touched = [d1, d2]
+            snaps = [state.snapshot(d) for d in touched]
+            day1, day2 = state.classes_of(d1), state.classes_of(d2)
+            cls1 = next(c for c in day1 if c.id == class_id)
+            cls2 = next(c for c in day2 if c.id == other_id)
+            ok = rebuild(d1, [c for c in day1 if c.id != class_id] + [cls2])
+            ok = ok and rebuild(d2, [c for c in day2 if c.id != other_id] + [cls1])
+            ok = ok and state.year_counts[d1][cls2.year] <= max_per_day + FLEXIBLE_EXTRA
+            ok = ok and state.year_counts[d2][cls1.year] <= max_per_day + FLEXIBLE_EXTRA
+        else:
+            # 🔹 Derslik kümesini yeniden seçtir: gün bu ders önce gelecek şekilde kurulur
+            touched = [d1]
+            snaps = [state.snapshot(d1)]
+            day = state.classes_of(d1)
+            ok = rebuild(d1, [c for c in day if c.id == class_id] + [c for c in day if c.id != class_id])
+
+        if ok:
+            for d in touched:
+                state.refresh_day(d)
+            new_value = state.value()
+            delta = new_value - current
+            if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                current = new_value
+                accepted += 1
+                tabu.append(class_id)
+                for snap in snaps:
+                    undo.setdefault(snap[0], snap)
+                if current < best_value:
+                    best_value, best_failed = mark_best()
+                temperature = max(MIN_TEMPERATURE, temperature * COOLING_RATE)
+                continue
+
+        for snap in reversed(snaps):
+            state.restore(snap)
+        temperature = max(MIN_TEMPERATURE, temperature * COOLING_RATE)
+
+    if state.value() > best_value:
+        for snap in undo.values():
+            state.restore(snap)
+        state.failed = best_failed
+
+    failed_classes[:] = list(state.failed.values())
+    final_value = state.value()
+    logger.info("Yerel arama: %d iterasyon, %d kabul, amaç %.2f -> %.2f", iterations, accepted, initial_value, final_value)
+    if metrics is not None:
+        metrics.count("local_search_iterations", iterations)
+        metrics.count("local_search_accepted", accepted)
+
+    return {
+        "initial_objective": initial_value,
+        "final_objective": final_value,
+        "improvement": initial_value - final_value,
+        "iterations": iterations,
+        "accepted_moves": accepted,
+        "recovered_classes": initial_failed - len(state.failed),
+        "elapsed": time.perf_counter() - started,
+    }
@@ -0,0 +1,185 @@
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List
+
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule
+from Backend.src.utils.exams.schedule_progress import ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+# Skor ne kadar düşükse program o kadar iyi
+DEFAULT_OBJECTIVE_WEIGHTS = {
+    "failed_classes": 1000.0,
+    "flexible_classes": 50.0,
+    "rooms_used": 1.0,
+    "day_load_variance": 10.0,
+}
+
+# İşçi süreçlere girdiler bir kez (initializer ile) gönderilir
+_WORKER_INPUTS = {}
+
+
+def schedule_objective(result: dict) -> dict:
+    exam_schedule = result.get("exam_schedule", [])
+    statistics = result.get("statistics", {})
+
+    day_loads = []
+    rooms_used = 0
+    for day in exam_schedule:
+        load = 0
+        for exam in day.get("exams", []):
+            for cls in exam.get("classes", []):
+                load += 1
+                rooms_used += len(cls.get("classrooms", []))
+        day_loads.append(load)
+
+    mean = sum(day_loads) / len(day_loads) if day_loads else 0
+    variance = sum((x - mean) ** 2 for x in day_loads) / len(day_loads) if day_loads else 0
+
+    return {
+        "failed_classes": len(result.get("failed_classes", [])),
+        "flexible_classes": statistics.get("flexible_classes", 0),
+        "rooms_used": rooms_used,
+        "day_load_variance": variance,
+    }
+
+
+def score_schedule(result: dict, weights: dict | None = None) -> float:
+    weights = weights or DEFAULT_OBJECTIVE_WEIGHTS
+    objective = schedule_objective(result)
+    return sum(weights.get(name, 0) * value for name, value in objective.items())
+
+
+def _init_worker(exam_program, class_dict, classrooms, max_per_day, strategy, weights, improvement):
+    _WORKER_INPUTS.update(
+        exam_program=exam_program,
+        class_dict=class_dict,
+        classrooms=classrooms,
+        max_per_day=max_per_day,
+        strategy=strategy,
+        weights=weights,
+        improvement=improvement,
+    )
+
+
+def _run_seed(seed: int) -> dict:
+    started = time.perf_counter()
+    result = create_exam_schedule(
+        _WORKER_INPUTS["exam_program"],
+        _WORKER_INPUTS["class_dict"],
+        _WORKER_INPUTS["classrooms"],
+        max_per_day=_WORKER_INPUTS["max_per_day"],
+        strategy=_WORKER_INPUTS["strategy"],
+        seed=seed,
+        seating=False,
+        **_WORKER_INPUTS["improvement"]
+    )
+    summary = schedule_objective(result)
+    summary["seed"] = seed
+    summary["score"] = score_schedule(result, _WORKER_INPUTS["weights"])
+    summary["elapsed"] = time.perf_counter() - started
+    return summary
+
+
+def create_exam_schedule_multi_start(
+    exam_program: ExamProgram,
+    class_dict: dict,
+    classrooms: List[dict],
+    max_per_day: int = 2,
+    n_runs: int | None = None,
+    n_jobs: int | None = None,
+    time_budget: float | None = None,
+    base_seed: int = 0,
+    weights: dict | None = None,
+    strategy: str | None = None,
+    improve_iterations: int = 0,
+    improve_time_budget: float | None = None,
+    progress: Callable[[dict], None] | None = None
+) -> dict:
+    """
+    Programı farklı tohumlarla birden çok kez (süreç havuzunda) oluşturur ve
+    en düşük skorlu olanı döndürür.
+
+    İşçiler yalnızca skor özetini döndürür; en iyi tohum ana süreçte oturma
+    planıyla birlikte yeniden çalıştırılır (aynı tohum aynı programı verir).
+    time_budget (saniye) dolduğunda yeni tohum başlatılmaz, çalışanlar beklenir.
+    Dönen sözlük create_exam_schedule ile aynı yapıdadır, ek olarak "runs"
+    anahtarında her tohumun özeti bulunur. İyileştirme ayarları her tohumda
+    (skor iyileştirilmiş programdan hesaplanır) ve yeniden çalıştırmada uygulanır.
+
+    progress'e her tohum bitince run_finished olayı, en iyi tohumun yeniden
+    çalıştırılmasında create_exam_schedule'ın olayları iletilir; geri çağrının
+    fırlattığı istisna (ör. iptal) başlamamış tohumları iptal eder ve yükselir.
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    n_runs = n_runs or n_jobs
+    weights = weights or DEFAULT_OBJECTIVE_WEIGHTS
+    improvement = {"improve_iterations": improve_iterations, "improve_time_budget": improve_time_budget}
+    seeds = [base_seed + i for i in range(n_runs)]
+    started = time.perf_counter()
+    reporter = ProgressReporter(progress)
+    reporter.total = n_runs
+    reporter.phase("multi_start", runs=n_runs)
+
+    def budget_left():
+        return time_budget is None or time.perf_counter() - started < time_budget
+
+    runs = []
+    if n_jobs == 1:
+        _init_worker(exam_program, class_dict, classrooms, max_per_day, strategy, weights, improvement)
+        for seed in seeds:
+            if runs and not budget_left():
+                break
+            runs.append(_run_seed(seed))
+            reporter.run_finished(runs[-1])
+    else:
+        # 🔹 spawn: iş parçacıklı sunucudan fork etmek kilitleri kopyalayabilir
+        pool = ProcessPoolExecutor(
+            max_workers=min(n_jobs, n_runs),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(exam_program, class_dict, classrooms, max_per_day, strategy, weights, improvement)
+        )
+        try:
+            pending_seeds = iter(seeds)
+            running = set()
+            for seed in pending_seeds:
+                running.add(pool.submit(_run_seed, seed))
+                if len(running) >= min(n_jobs, n_runs):
+                    break
+
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    runs.append(future.result())
+                    reporter.run_finished(runs[-1])
+                    if budget_left():
+                        seed = next(pending_seeds, None)
+                        if seed is not None:
+                            running.add(pool.submit(_run_seed, seed))
+        finally:
+            # 🔹 İptal/hata durumunda kuyruktaki tohumlar başlatılmaz
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    runs.sort(key=lambda run: (run["score"], run["seed"]))
+    best = runs[0]
+    logger.info("Çoklu başlangıç: %d çalıştırma, en iyi tohum %d (skor: %.2f)", len(runs), best['seed'], best['score'])
+
+    result = create_exam_schedule(
+        exam_program,
+        class_dict,
+        classrooms,
+        max_per_day=max_per_day,
+        strategy=strategy,
+        seed=best["seed"],
+        progress=progress,
+        **improvement
+    )
+    result["statistics"]["score"] = best["score"]
+    result["statistics"]["runs_completed"] = len(runs)
+    result["runs"] = runs
+    return result
@@ -0,0 +1,148 @@
+import math
+from typing import Iterable, List
+
+# Doluluk bu çözünürlükte tutulur (dakika)
+SLOT_MINUTES = 5
+
+
+class RoomOccupancy:
+    """
+    Bir sınav gününde dersliklerin zaman aralığı doluluğu.
+
+    Her derslik için gün başlangıcından itibaren 5 dakikalık dilimlerin bit
+    maskesi tutulur. "t1-t2 arası boş mu?" sorusu tek bir AND ile yanıtlanır;
+    böylece bir derslik, gün içinde önceki sınavı bittikten sonra yeniden
+    kullanılabilir. Derslikler RoomSetSelector'daki indeksleriyle anılır.
+
+    neighbours: aynı derslik havuzunu aynı tarihte kullanan diğer bölümlerin
+    dolulukları (RoomReservationTable). Sorgular onların rezervasyonlarını da
+    görür; reserve/release/clear/restore yalnızca bu bölümün kayıtlarını değiştirir.
+    """
+
+    __slots__ = ("day_start", "busy", "neighbours")
+
+    def __init__(self, n_rooms: int, day_start: float = 0.0):
+        self.day_start = day_start or 0.0
+        self.busy = [0] * n_rooms
+        self.neighbours = []
+
+    def _span(self, start: float, end: float) -> int:
+        first = math.floor(round((start - self.day_start) * 60, 6) / SLOT_MINUTES)
+        last = math.ceil(round((end - self.day_start) * 60, 6) / SLOT_MINUTES)
+        if last <= first:
+            return 0
+        return ((1 << (last - first)) - 1) << max(first, 0)
+
+    def _combined(self) -> List[int]:
+        if not self.neighbours:
+            return self.busy
+        combined = list(self.busy)
+        for other in self.neighbours:
+            for room, mask in enumerate(other.busy):
+                combined[room] |= mask
+        return combined
+
+    def is_free(self, room: int, start: float, end: float) -> bool:
+        span = self._span(start, end)
+        return not (self.busy[room] & span or any(other.busy[room] & span for other in self.neighbours))
+
+    def busy_rooms(self, start: float, end: float) -> set:
+        span = self._span(start, end)
+        return {room for room, mask in enumerate(self._combined()) if mask & span}
+
+    def reserve(self, rooms: Iterable[int], start: float, end: float):
+        span = self._span(start, end)
+        for room in rooms:
+            self.busy[room] |= span
+
+    def release(self, rooms: Iterable[int], start: float, end: float):
+        span = self._span(start, end)
+        for room in rooms:
+            self.busy[room] &= ~span
+
+    def clear(self):
+        self.busy = [0] * len(self.busy)
+
+    def copy(self) -> "RoomOccupancy":
+        other = RoomOccupancy.__new__(RoomOccupancy)
+        other.day_start = self.day_start
+        other.busy = list(self.busy)
+        other.neighbours = list(self.neighbours)
+        return other
+
+    def snapshot(self) -> List[int]:
+        return list(self.busy)
+
+    def restore(self, busy: List[int]):
+        self.busy = list(busy)
+
+
+class RoomReservationTable:
+    """
+    Ortak derslik havuzunu paylaşan bölümlerin küresel derslik-zaman
+    rezervasyon tablosu.
+
+    Her bölüm (owner) her tarih için kendi RoomOccupancy'sini alır; bu doluluk
+    aynı tarihteki diğer bölümlerin doluluklarına komşu olarak bağlıdır.
+    Böylece bir derslik iki bölüme aynı saatte verilemez, bir bölümün boş
+    kalan derslikleri ise diğerleri tarafından kullanılabilir. Günlük kullanım
+    sayaçları da tarih başına paylaşılır; derslik seçici yükü tüm bölümler
+    arasında dengeler. Tüm bölümler aynı derslik listesini (aynı indeksleri)
+    ve aynı gün başlangıcını kullanmalıdır.
+    """
+
+    def __init__(self, n_rooms: int, day_start: float = 0.0):
+        self.n_rooms = n_rooms
+        self.day_start = day_start or 0.0
+        self._occupancies = {}  # date -> {owner: RoomOccupancy}
+        self._usage = {}        # date -> {classroom_name: kullanım sayısı}
+
+    def occupancy(self, date: str, owner: str) -> RoomOccupancy:
+        owners = self._occupancies.setdefault(date, {})
+        occupancy = owners.get(owner)
+        if occupancy is None:
+            occupancy = RoomOccupancy(self.n_rooms, self.day_start)
+            for other in owners.values():
+                other.neighbours.append(occupancy)
+                occupancy.neighbours.append(other)
+            owners[owner] = occupancy
+        return occupancy
+
+    def usage(self, date: str) -> dict:
+        return self._usage.setdefault(date, {})
+
+    def owner(self, owner: str) -> "OwnerReservations":
+        return OwnerReservations(self, owner)
+
+    def statistics(self) -> dict:
+        """Tarih başına dolu derslik-dilim sayısı (tüm bölümler) ve bölüm payları."""
+        per_date = {}
+        per_owner = {}
+        for date, owners in sorted(self._occupancies.items()):
+            slots = 0
+            for owner, occupancy in owners.items():
+                used = sum(bin(mask).count("1") for mask in occupancy.busy)
+                per_owner[owner] = per_owner.get(owner, 0) + used
+                slots += used
+            per_date[date] = slots
+        return {
+            "slot_minutes": SLOT_MINUTES,
+            "room_slots_per_date": per_date,
+            "room_slots_per_owner": per_owner,
+        }
+
+
+class OwnerReservations:
+    """RoomReservationTable'ın tek bir bölüme bakan görünümü (create_exam_schedule için)."""
+
+    __slots__ = ("table", "name")
+
+    def __init__(self, table: RoomReservationTable, name: str):
+        self.table = table
+        self.name = name
+
+    def occupancy(self, date: str) -> RoomOccupancy:
+        return self.table.occupancy(date, self.name)
+
+    def usage(self, date: str) -> dict:
+        return self.table.usage(date)
@@ -0,0 +1,215 @@
+from collections import defaultdict
+from typing import List
+
+from Backend.src.utils.exams.seat_maps import seat_capacity
+
+
+class RoomSetSelector:
+    """
+    Sınav için derslik kümesi seçici.
+
+    Eski yöntem tüm derslik kombinasyonlarını (5'e kadar) önceden listeleyip
+    her yerleştirmede hepsini PriorityQueue'ya atıyordu. Burada aynı öncelik
+    sırası (önce hiç kullanılmamış derslikler, sonra en az günlük kullanım,
+    sonra en az derslik sayısı, sonra en az boş koltuk, eşitlikte derslik
+    listesindeki sıra) kapasiteye göre budanan bir arama ile bulunur:
+
+    1. Kapasiteyi karşılayan en düşük toplam kullanım (U*) küçük bir sırt
+       çantası DP'si ile bulunur.
+    2. U* kullanımla kapasiteyi karşılayan en az derslik sayısı (k*) bulunur.
+    3. k* derslikli, U* kullanımlı kümelerin ulaşabildiği kapasiteler bitset
+       DP'si ile çıkarılır; en az boş koltuklu olan ve derslik sırasında ilk
+       gelen küme geri izlenerek seçilir.
+
+    Kombinasyon listesi tutulmadığı için bellek sabit kalır ve 5 derslik
+    sınırı yoktur.
+    """
+
+    def __init__(self, classrooms: List[dict]):
+        self.classrooms = list(classrooms)
+        self.names = [r['classroom_name'] for r in self.classrooms]
+        # 🔹 Düzenden türetilen gerçek koltuk sayıları (seat_maps önbelleği)
+        self.capacities = [seat_capacity(r) for r in self.classrooms]
+        self.total_capacity = sum(self.capacities)
+
+    def __len__(self):
+        return len(self.classrooms)
+
+    def select(
+        self,
+        student_count: int,
+        not_suitable_classrooms: List = (),
+        used_classrooms: dict = None,
+        unavailable: set = None
+    ) -> List[dict] | None:
+        chosen = self.select_indices(student_count, not_suitable_classrooms, used_classrooms, unavailable)
+        if chosen is None:
+            return None
+        return [self.classrooms[i] for i in chosen]
+
+    def select_indices(
+        self,
+        student_count: int,
+        not_suitable_classrooms: List = (),
+        used_classrooms: dict = None,
+        unavailable: set = None
+    ) -> tuple | None:
+        """unavailable: o saatte dolu dersliklerin indeksleri (RoomOccupancy.busy_rooms)."""
+        used_classrooms = used_classrooms or {}
+        excluded = set(not_suitable_classrooms)
+        unavailable = unavailable or ()
+
+        # 🔹 Aday derslikler (orijinal sıra korunur)
+        candidates = [
+            (i, self.capacities[i], used_classrooms.get(self.names[i], 0))
+            for i in range(len(self.classrooms))
+            if i not in unavailable and self.names[i] not in excluded and self.capacities[i] > 0
+        ]
+        student_count = max(int(student_count), 1)
+        if sum(c for _, c, _ in candidates) < student_count:
+            return None
+
+        best_usage = self._min_usage(candidates, student_count)
+        if best_usage is None:
+            return None
+
+        size, incumbent = self._min_size(candidates, student_count, best_usage)
+        if size is None:
+            return None
+
+        return self._best_set(candidates, student_count, best_usage, size, incumbent)
+
+    def _min_usage(self, candidates, student_count):
+        zero_capacity = sum(c for _, c, u in candidates if u == 0)
+        if zero_capacity >= student_count:
+            return 0
+
+        used = [(c, u) for _, c, u in candidates if u > 0]
+        need = student_count - zero_capacity
+        limit = max(1, min(u for _, u in used))
+        max_limit = sum(u for _, u in used)
+
+        # 🔹 best[b]: toplam kullanımı tam b olan kümelerin en büyük kapasitesi
+        while True:
+            best = [-1] * (limit + 1)
+            best[0] = 0
+            for capacity, usage in used:
+                for b in range(limit, usage - 1, -1):
+                    if best[b - usage] >= 0 and best[b - usage] + capacity > best[b]:
+                        best[b] = best[b - usage] + capacity
+            for b in range(limit + 1):
+                if best[b] >= need:
+                    return b
+            if limit >= max_limit:
+                return None
+            limit = min(limit * 2, max_limit)
+
+    def _min_size(self, candidates, student_count, best_usage):
+        zero_rooms = sorted(
+            ((c, i) for i, c, u in candidates if u == 0),
+            key=lambda item: -item[0]
+        )
+        zero_prefix = [0]
+        for capacity, _ in zero_rooms:
+            zero_prefix.append(zero_prefix[-1] + capacity)
+
+        # 🔹 Kullanılmış dersliklerden (maliyet, adet) -> (en büyük kapasite, derslikler)
+        states = {(0, 0): (0, ())}
+        if best_usage > 0:
+            # Her kullanım seviyesinden en fazla best_usage // u derslik seçilebilir;
+            # en büyük kapasiteliler dışındakiler sonucu değiştirmez
+            by_usage = defaultdict(list)
+            for i, capacity, usage in candidates:
+                if 0 < usage <= best_usage:
+                    by_usage[usage].append((capacity, i))
+            used_rooms = []
+            for usage, rooms in by_usage.items():
+                rooms.sort(key=lambda item: (-item[0], item[1]))
+                used_rooms.extend((i, capacity, usage) for capacity, i in rooms[:best_usage // usage])
+
+            for i, capacity, usage in used_rooms:
+                for (cost, count), (total, rooms) in list(states.items()):
+                    key = (cost + usage, count + 1)
+                    if key[0] > best_usage:
+                        continue
+                    value = total + capacity
+                    if key not in states or states[key][0] < value:
+                        states[key] = (value, rooms + (i,))
+
+        best_size, best_rooms = None, None
+        for (cost, count), (total, rooms) in states.items():
+            if cost != best_usage:
+                continue
+            need = student_count - total
+            zero_count = _first_prefix_at_least(zero_prefix, need)
+            if zero_count is None:
+                continue
+            size = count + zero_count
+            if best_size is None or size < best_size:
+                best_size = size
+                best_rooms = rooms + tuple(i for _, i in zero_rooms[:zero_count])
+
+        if best_rooms is None:
+            return None, None
+        return best_size, tuple(sorted(best_rooms))
+
+    def _best_set(self, candidates, student_count, best_usage, size, incumbent):
+        rooms = [(i, c, u) for i, c, u in candidates if u <= best_usage]
+        n = len(rooms)
+
+        # Aranan kapasite, elde olan geçerli kümenin kapasitesinden büyük olamaz
+        limit = sum(self.capacities[i] for i in incumbent)
+        mask = (1 << (limit + 1)) - 1
+
+        # 🔹 table[r][x]: r derslik, toplam kullanım x ile ulaşılabilen kapasiteler (bitset).
+        # Sondan başa doldurulur; suffix[k] yalnızca k. ve sonraki derslikleri kullanır.
+        table = [[0] * (best_usage + 1) for _ in range(size + 1)]
+        table[0][0] = 1
+        suffix = [None] * (n + 1)
+        suffix[n] = [row[:] for row in table]
+        for k in range(n - 1, -1, -1):
+            _, c, u = rooms[k]
+            for r in range(min(size, n - k), 0, -1):
+                previous, row = table[r - 1], table[r]
+                for x in range(best_usage, u - 1, -1):
+                    reachable = previous[x - u]
+                    if reachable:
+                        row[x] |= (reachable << c) & mask
+            suffix[k] = [row[:] for row in table]
+
+        reachable = suffix[0][size][best_usage] >> student_count
+        if not reachable:
+            return incumbent
+        target = student_count + (reachable & -reachable).bit_length() - 1
+
+        # 🔹 Derslik sırasına göre ilk uygun küme: her derslik, kalanı hâlâ
+        # tamamlanabiliyorsa seçilir
+        chosen = []
+        remaining, usage_left, capacity_left = size, best_usage, target
+        for k in range(n):
+            if remaining == 0:
+                break
+            i, c, u = rooms[k]
+            if u > usage_left or c > capacity_left:
+                continue
+            if (suffix[k + 1][remaining - 1][usage_left - u] >> (capacity_left - c)) & 1:
+                chosen.append(i)
+                remaining -= 1
+                usage_left -= u
+                capacity_left -= c
+        return tuple(chosen)
+
+
+def _first_prefix_at_least(prefix: List[int], need: int) -> int | None:
+    if need <= 0:
+        return 0
+    lo, hi = 0, len(prefix) - 1
+    if prefix[hi] < need:
+        return None
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if prefix[mid] >= need:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
@@ -0,0 +1,245 @@
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+from typing import List
+
+from Backend.src.utils.exams.ExanProgramClass import ExamProgram
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule
+from Backend.src.utils.exams.multi_start import create_exam_schedule_multi_start
+
+logger = logging.getLogger(__name__)
+
+# Zamanlayıcının çıktısını değiştiren bir değişiklikte artırılır; eski kayıtlar geçersiz olur
+CACHE_VERSION = 5
+
+# Önbellek yalnızca sunucu kullanıcısının okuyup yazabildiği (0700) bir dizinde tutulur
+DEFAULT_CACHE_DIR = os.getenv("EXAM_SCHEDULE_CACHE_DIR") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "exam_schedule"
+)
+DEFAULT_MAX_BYTES = int(float(os.getenv("EXAM_SCHEDULE_CACHE_MAX_MB", "256")) * 2 ** 20)
+
+
+def _digest(data) -> str:
+    # Ders ve derslik sırası sonucu etkilediğinden listeler/sözlük sırası korunur;
+    # yalnızca iç sözlüklerin anahtarları sıralanır
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def class_dict_fingerprint(class_dict: dict) -> str:
+    return _digest([[str(class_id), info] for class_id, info in class_dict.items()])
+
+
+def classrooms_fingerprint(classrooms: List[dict]) -> str:
+    return _digest(list(classrooms))
+
+
+def schedule_cache_key(
+    exam_program: ExamProgram,
+    class_dict: dict,
+    classrooms: List[dict],
+    seed: int,
+    **options
+) -> str:
+    return _digest({
+        "version": CACHE_VERSION,
+        "exam_program": exam_program.fingerprint(),
+        "classes": class_dict_fingerprint(class_dict),
+        "classrooms": classrooms_fingerprint(classrooms),
+        "seed": seed,
+        "options": options,
+    })
+
+
+def _encode(data):
+    """JSON'a sığmayan set, tuple ve metin olmayan anahtarlı sözlükleri etiketler."""
+    if isinstance(data, dict):
+        if all(isinstance(k, str) for k in data):
+            return {k: _encode(v) for k, v in data.items()}
+        return {"__items__": [[_encode(k), _encode(v)] for k, v in data.items()]}
+    if isinstance(data, list):
+        return [_encode(v) for v in data]
+    if isinstance(data, tuple):
+        return {"__tuple__": [_encode(v) for v in data]}
+    if isinstance(data, (set, frozenset)):
+        return {"__set__": [_encode(v) for v in data]}
+    return data
+
+
+def _decode(data: dict):
+    if "__items__" in data:
+        return {_hashable(k): v for k, v in data["__items__"]}
+    if "__tuple__" in data:
+        return tuple(data["__tuple__"])
+    if "__set__" in data:
+        return {_hashable(v) for v in data["__set__"]}
+    return data
+
+
+def _hashable(value):
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
+
+
+def dumps_result(result: dict) -> bytes:
+    return json.dumps(_encode(result), ensure_ascii=False).encode("utf-8")
+
+
+def loads_result(data: bytes) -> dict:
+    return json.loads(data.decode("utf-8"), object_hook=_decode)
+
+
+def _private_directory(directory: str) -> bool:
+    """
+    Dizini 0700 ile oluşturur; başka bir kullanıcıya aitse ya da başkaları
+    yazabiliyorsa False döner. Kendi dizinimizin fazla açık izinleri daraltılır.
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if hasattr(os, "getuid"):
+        if info.st_uid != os.getuid():
+            return False
+        if stat.S_IMODE(info.st_mode) & 0o077:
+            os.chmod(directory, 0o700)
+    return True
+
+
+class ScheduleCache:
+    """
+    Program sonuçları için içerik adresli disk önbelleği.
+
+    Her sonuç anahtarının adıyla ayrı bir JSON dosyasında tutulur; set, tuple
+    ve metin olmayan sözlük anahtarları etiketlenip okunurken geri kurulur,
+    böylece okunan sonuç yazılanla birebir aynıdır. Dizin sunucu kullanıcısına
+    ait değilse önbellek devre dışı kalır. Toplam boyut max_bytes'ı aşınca en
+    uzun süredir kullanılmayan kayıtlar silinir.
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.enabled = _private_directory(self.directory)
+        if not self.enabled:
+            logger.warning("Önbellek dizini güvenli değil (sahibi başka kullanıcı), önbellek kapalı: %s", self.directory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = loads_result(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Önbellek kaydı okunamadı, siliniyor: %s (%s)", path, e)
+            self._remove(path)
+            return None
+        # 🔹 Son kullanım zamanı eviction sırası için güncellenir
+        os.utime(path)
+        return result
+
+    def put(self, key: str, result: dict):
+        if not self.enabled:
+            return
+        data = dumps_result(result)
+        if len(data) > self.max_bytes:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        if not self.enabled:
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith((".json", ".tmp")):
+                self._remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def create_exam_schedule_cached(
+    exam_program: ExamProgram,
+    class_dict: dict,
+    classrooms: List[dict],
+    seed: int = 0,
+    cache: ScheduleCache | None = None,
+    progress=None,
+    **options
+) -> dict:
+    """
+    create_exam_schedule'ın önbellekli hâli. Aynı program ayarları, ders/öğrenci
+    ve derslik girdileri, tohum ve seçeneklerle yapılan istek diskteki sonucu
+    döndürür; girdilerden biri değişirse anahtar da değişir.
+    statistics['cache_hit'] sonucun önbellekten gelip gelmediğini gösterir.
+    progress sonucu etkilemediğinden anahtara katılmaz. Programda çoklu
+    başlangıç açıksa (multi_start_runs > 1) create_exam_schedule_multi_start
+    çalışır; ayar ExamProgram.fingerprint'e dahil olduğundan iki mod ayrı
+    anahtarlarda tutulur.
+    """
+    cache = cache or ScheduleCache()
+    key = schedule_cache_key(exam_program, class_dict, classrooms, seed, **options)
+
+    result = cache.get(key)
+    if result is not None:
+        logger.info("Sınav programı önbellekten alındı (%s)", key[:12])
+        result["statistics"]["cache_hit"] = True
+        return result
+
+    if (exam_program.get_multi_start_runs() or 1) > 1:
+        result = create_exam_schedule_multi_start(
+            exam_program,
+            class_dict,
+            classrooms,
+            n_runs=exam_program.get_multi_start_runs(),
+            time_budget=exam_program.get_multi_start_time_budget(),
+            base_seed=seed,
+            progress=progress,
+            **options
+        )
+    else:
+        result = create_exam_schedule(exam_program, class_dict, classrooms, seed=seed, progress=progress, **options)
+    cache.put(key, result)
+    result["statistics"]["cache_hit"] = False
+    return result
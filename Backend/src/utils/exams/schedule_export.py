@@ -0,0 +1,169 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import groupby
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+
+import xlsxwriter
+
+logger = logging.getLogger(__name__)
+
+# (sütun başlığı, genişlik)
+COLUMNS = [
+    ("Tarih", 15),
+    ("Sınav Saati", 15),
+    ("Ders Adı", 45),
+    ("Öğretim Elemanı", 35),
+    ("Derslik", 35),
+]
+
+# Tarih, Sınav Saati, Ders Adı, Öğretim Elemanı, Derslik
+ExportRow = Tuple[str, str, str, str, str]
+
+# Excel sayfa adı sınırları
+MAX_SHEET_NAME = 31
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+@dataclass
+class ScheduleSheet:
+    """Çalışma kitabındaki bir sayfa; rows yalnızca bir kez, sırayla tüketilir."""
+    name: str
+    title: str
+    rows: Iterable[ExportRow]
+
+
+def tr_upper(text: str) -> str:
+    """Türkçe büyük harf (i → İ, ı → I)."""
+    return text.replace("i", "İ").replace("ı", "I").upper()
+
+
+def sheet_title(department: str | None, exam_type: str | None) -> str:
+    parts = []
+    if department:
+        parts.append(f"{tr_upper(department)} BÖLÜMÜ")
+    if exam_type:
+        parts.append(tr_upper(exam_type))
+    parts.append("SINAV PROGRAMI")
+    return " ".join(parts)
+
+
+def format_time(value) -> str:
+    """Saat: 9.5 → "09:30"; veritabanından gelen TIME (timedelta) ve "09:30:00" da kabul edilir."""
+    if isinstance(value, timedelta):
+        minutes = int(value.total_seconds() // 60)
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+    if isinstance(value, (int, float)):
+        hour = int(value)
+        minute = int(round((value - hour) * 60))
+        return f"{hour:02d}:{minute:02d}"
+    if isinstance(value, str) and value.count(":") == 2:
+        return value.rsplit(":", 1)[0].zfill(5)
+    return str(value) if value is not None else "-"
+
+
+def schedule_rows(exam_schedule: List[dict]) -> Iterator[ExportRow]:
+    """create_exam_schedule yapısındaki sınavları sırayla satır satır üretir."""
+    for day in exam_schedule:
+        day_date = day.get("date", "-")
+        for exam in day.get("exams", []):
+            for cls in exam.get("classes", []):
+                yield (
+                    day_date.isoformat() if isinstance(day_date, date) else str(day_date),
+                    format_time(cls.get("start_time", "-")),
+                    cls.get("name", "-"),
+                    cls.get("instructor", "N/A"),
+                    ", ".join(r.get("classroom_name", "-") for r in cls.get("classrooms", []))
+                )
+
+
+def schedule_sheets(exam_schedule: List[dict], department: str | None = None) -> Iterator[ScheduleSheet]:
+    """Bir bölümün programı; ardışık günler sınav türüne göre ayrı sayfalara bölünür."""
+    for exam_type, days in groupby(exam_schedule, key=lambda day: day.get("exam_type") or "Vize"):
+        name = f"{department} {exam_type}" if department else f"{exam_type} Sınav Programı"
+        yield ScheduleSheet(name, sheet_title(department, exam_type), schedule_rows(list(days)))
+
+
+def _sheet_name(name: str, used: set) -> str:
+    base = _INVALID_SHEET_CHARS.sub(" ", name).strip(" '")[:MAX_SHEET_NAME] or "Sayfa"
+    candidate, n = base, 1
+    while candidate.lower() in used:
+        n += 1
+        suffix = f" ({n})"
+        candidate = base[:MAX_SHEET_NAME - len(suffix)] + suffix
+    used.add(candidate.lower())
+    return candidate
+
+
+def write_schedule_workbook(target: str | BinaryIO, sheets: Iterable[ScheduleSheet], tmpdir: str | None = None) -> dict:
+    """
+    Sayfaları xlsxwriter'ın constant_memory kipinde yazar: her satır yazıldıktan
+    sonra diske aktarılır, böylece bellek kullanımı satır sayısından bağımsızdır.
+    Biçimler hücre başına verilir (koşullu biçim yok). Yazılmış satırlar
+    birleştirilemediğinden aynı tarihli satırların tarih sütunu tek bir
+    çerçeveli bant olarak çizilir: iç yatay çizgiler çizilmez, tarih grubun
+    ortadaki satırına yazılır.
+
+    target bir dosya yolu ya da yazılabilir ikili dosya olabilir. Sayfa başına
+    satır sayısı döner.
+    """
+    options = {"constant_memory": True}
+    if tmpdir:
+        options["tmpdir"] = tmpdir
+    workbook = xlsxwriter.Workbook(target, options)
+
+    title_format = workbook.add_format({
+        'bold': True, 'font_size': 14, 'align': 'center', 'valign': 'vcenter',
+        'bg_color': '#F8CBAD', 'border': 1
+    })
+    header_format = workbook.add_format({
+        'bold': True, 'align': 'center', 'valign': 'vcenter',
+        'bg_color': '#F8CBAD', 'border': 1, 'text_wrap': True
+    })
+    cell_format = workbook.add_format({'border': 1, 'valign': 'vcenter'})
+    center_cell_format = workbook.add_format({'border': 1, 'align': 'center', 'valign': 'vcenter'})
+    # Tarih bandı: (grubun ilk satırı mı, son satırı mı) → biçim
+    date_formats = {
+        (first, last): workbook.add_format({
+            'align': 'center', 'valign': 'vcenter', 'left': 1, 'right': 1,
+            'top': 1 if first else 0, 'bottom': 1 if last else 0
+        })
+        for first in (True, False) for last in (True, False)
+    }
+    # Saat ortalı, diğerleri sola yaslı
+    row_formats = [None, center_cell_format] + [cell_format] * (len(COLUMNS) - 2)
+    last_col = len(COLUMNS) - 1
+
+    written = {}
+    used_names = set()
+    try:
+        for sheet in sheets:
+            worksheet = workbook.add_worksheet(_sheet_name(sheet.name, used_names))
+            for col, (_, width) in enumerate(COLUMNS):
+                worksheet.set_column(col, col, width)
+            worksheet.merge_range(0, 0, 0, last_col, sheet.title, title_format)
+            worksheet.set_row(0, 30)  # Başlık satırının yüksekliği
+            worksheet.write_row(1, 0, [header for header, _ in COLUMNS], header_format)
+
+            row = 2
+            # 🔹 Bellekte en fazla bir günün satırları tutulur
+            for day_date, group in groupby(sheet.rows, key=lambda values: values[0]):
+                group = list(group)
+                middle = (len(group) - 1) // 2
+                for i, values in enumerate(group):
+                    date_format = date_formats[(i == 0, i == len(group) - 1)]
+                    if i == middle:
+                        worksheet.write_string(row, 0, day_date, date_format)
+                    else:
+                        worksheet.write_blank(row, 0, None, date_format)
+                    for col in range(1, len(values)):
+                        worksheet.write_string(row, col, values[col] or "", row_formats[col])
+                    row += 1
+
+            written[worksheet.get_name()] = row - 2
+    finally:
+        workbook.close()
+
+    logger.info("Sınav programı dışa aktarıldı: %d sayfa, %d satır", len(written), sum(written.values()))
+    return written
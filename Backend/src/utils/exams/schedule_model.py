@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field
+from typing import Any, List
+
+import numpy as np
+
+from Backend.src.utils.exams.room_occupancy import RoomOccupancy
+from Backend.src.utils.exams.seat_maps import seat_capacity
+
+
+@dataclass(slots=True)
+class Room:
+    index: int
+    name: str
+    capacity: int
+
+
+@dataclass(slots=True)
+class CourseExam:
+    """
+    Programa yerleştirilecek ders. Öğrenciler ScheduleModel.students
+    dizisindeki indeksleriyle tutulur; öğrenci sözlükleri kopyalanmaz.
+    student_array aynı indekslerin öğrenci×gün sayacında kullanılan hâlidir.
+    """
+    index: int
+    id: Any
+    name: str
+    year: int
+    instructor: str
+    student_count: int
+    students: tuple
+    student_array: np.ndarray | None = None
+
+
+@dataclass(slots=True)
+class Placement:
+    """Bir dersin bir bloktaki yeri; ders ve derslikler indeks olarak tutulur."""
+    course: int
+    rooms: tuple
+    start_time: float
+    end_time: float
+    duration: float
+
+
+@dataclass(slots=True)
+class ExamBlock:
+    end_time: float
+    placements: List[Placement] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ExamDay:
+    date: str
+    exam_type: str
+    blocks: List[ExamBlock] = field(default_factory=list)
+    occupancy: RoomOccupancy | None = None
+    # Öğrenci×gün sayacında bu günün satırı (student_load.attach_student_load)
+    student_load: np.ndarray | None = None
+
+
+class ScheduleModel:
+    """
+    Zamanlayıcının paylaşılan dizileri: öğrenciler, derslikler ve dersler.
+
+    Zamanlayıcı içeride yalnızca bu kayıtlarla ve indekslerle çalışır;
+    bugünkü JSON sözlük yapısına dönüşüm yalnızca sınırda (to_dicts,
+    course_to_dict) yapılır.
+    """
+
+    def __init__(self, classrooms: List[dict]):
+        self.room_data = list(classrooms)
+        self.rooms = [
+            Room(i, r['classroom_name'], seat_capacity(r))
+            for i, r in enumerate(self.room_data)
+        ]
+        self.students = []
+        self.student_index = {}
+        self.courses = []
+
+    def add_course(self, class_id, info: dict, year: int) -> CourseExam:
+        indices = []
+        for student in info.get('students', []):
+            student_num = student.get('student_num')
+            index = self.student_index.get(student_num) if student_num else None
+            if index is None:
+                index = len(self.students)
+                self.students.append(student)
+                if student_num:
+                    self.student_index[student_num] = index
+            indices.append(index)
+
+        course = CourseExam(
+            index=len(self.courses),
+            id=class_id,
+            name=info.get('class_name', ''),
+            year=year,
+            instructor=info.get('instructor', 'N/A'),
+            student_count=len(indices),
+            students=tuple(indices),
+            student_array=np.asarray(indices, dtype=np.intp)
+        )
+        self.courses.append(course)
+        return course
+
+    def student_nums(self, course: CourseExam) -> set:
+        return {
+            self.students[i].get('student_num')
+            for i in course.students
+            if self.students[i].get('student_num')
+        }
+
+    def room_dicts(self, rooms) -> List[dict]:
+        return [self.room_data[i] for i in rooms]
+
+    def course_to_dict(self, course: CourseExam) -> dict:
+        return {
+            'id': course.id,
+            'name': course.name,
+            'year': course.year,
+            'instructor': course.instructor,
+            'students': [self.students[i] for i in course.students],
+            'student_count': course.student_count
+        }
+
+    def placement_to_dict(self, placement: Placement) -> dict:
+        course = self.courses[placement.course]
+        return {
+            "id": course.id,
+            "name": course.name,
+            "year": course.year,
+            "student_count": course.student_count,
+            "students": [self.students[i] for i in course.students],
+            "instructor": course.instructor,
+            "duration": placement.duration,
+            "classrooms": self.room_dicts(placement.rooms),
+            "start_time": placement.start_time,
+            "end_time": placement.end_time
+        }
+
+    def to_dicts(self, days: List[ExamDay]) -> List[dict]:
+        return [
+            {
+                "date": day.date,
+                "exam_type": day.exam_type,
+                "exams": [
+                    {
+                        "end_time": block.end_time,
+                        "classes": [self.placement_to_dict(p) for p in block.placements]
+                    }
+                    for block in day.blocks
+                ]
+            }
+            for day in days
+        ]
@@ -0,0 +1,57 @@
+from typing import Callable
+
+# 🔹 Olay türleri
+PHASE = "phase"                  # phase: multi_start | placement | improvement | seating | finished
+DAY_CHOSEN = "day_chosen"        # class_id, class_name, date, flexible
+FLEXIBLE_MODE = "flexible_mode"  # year (her yıl için ilk kez esnek moda geçildiğinde)
+CLASS_PLACED = "class_placed"    # class_id, class_name, date, flexible
+CLASS_FAILED = "class_failed"    # class_id, class_name
+RUN_FINISHED = "run_finished"    # seed, score (çoklu başlangıçta her tohum bitince)
+
+
+class ProgressReporter:
+    """
+    Zamanlayıcının ilerleme olaylarını geri çağrıya iletir.
+
+    Her olay bir sözlüktür: {"type", "processed", "total", ...}. processed,
+    yerleştirilen ya da başarısız olan ders sayısıdır. Geri çağrı yoksa hiçbir
+    şey yapılmaz; geri çağrının fırlattığı istisna (ör. iptal) zamanlayıcıyı
+    durdurur.
+    """
+
+    __slots__ = ("callback", "processed", "total", "flexible_years")
+
+    def __init__(self, callback: Callable[[dict], None] | None = None):
+        self.callback = callback
+        self.processed = 0
+        self.total = 0
+        self.flexible_years = set()
+
+    def emit(self, event_type: str, **data):
+        if self.callback is None:
+            return
+        self.callback({"type": event_type, "processed": self.processed, "total": self.total, **data})
+
+    def phase(self, name: str, **data):
+        self.emit(PHASE, phase=name, **data)
+
+    def day_chosen(self, course, date: str, flexible: bool = False):
+        self.emit(DAY_CHOSEN, class_id=course.id, class_name=course.name, date=date, flexible=flexible)
+
+    def flexible_mode(self, year: int):
+        if year in self.flexible_years:
+            return
+        self.flexible_years.add(year)
+        self.emit(FLEXIBLE_MODE, year=year)
+
+    def placed(self, course, date: str, flexible: bool = False):
+        self.processed += 1
+        self.emit(CLASS_PLACED, class_id=course.id, class_name=course.name, date=date, flexible=flexible)
+
+    def failed(self, course):
+        self.processed += 1
+        self.emit(CLASS_FAILED, class_id=course.id, class_name=course.name)
+
+    def run_finished(self, summary: dict):
+        self.processed += 1
+        self.emit(RUN_FINISHED, seed=summary["seed"], score=summary["score"])
@@ -0,0 +1,34 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class SchedulerMetrics:
+    """
+    Bir program oluşturma çalıştırmasının sayaçları ve aşama süreleri.
+
+    Sayaçlar: placements_tried, room_set_searches, conflict_checks,
+    seating_plans ... Süreler (saniye): day_generation, placement,
+    improvement, seating. Sonuç statistics["metrics"] altında döner.
+    """
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.timings = defaultdict(float)
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - started
+
+    def to_dict(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "timings": {name: round(seconds, 6) for name, seconds in self.timings.items()},
+        }
@@ -0,0 +1,137 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from Backend.src.utils.exams.seating_grid import EMPTY_SEAT, GRID_DTYPE, seat_template
+
+logger = logging.getLogger(__name__)
+
+# (desk_structure, desks_per_row, desks_per_column)
+LayoutKey = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class SeatMap:
+    """
+    Bir dersliğin düzeninden türetilen, değişmez oturma şablonu: boş ızgara
+    (template), yerleştirme sırasındaki koltuk koordinatları (seats, n × 2,
+    sütun sütun önden arkaya) ve düzendeki gerçek koltuk sayısı.
+    """
+    layout: LayoutKey
+    template: np.ndarray | None
+    seats: np.ndarray
+
+    @property
+    def seat_count(self) -> int:
+        return len(self.seats)
+
+
+def layout_key(room: dict) -> LayoutKey | None:
+    """Düzen alanları eksik ya da sayı değilse None."""
+    try:
+        return int(room['desk_structure']), int(room['desks_per_row']), int(room['desks_per_column'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def build_seat_map(room: dict) -> SeatMap:
+    layout = layout_key(room)
+    template = seat_template(room) if layout is not None else None
+    if template is None:
+        seats = np.empty((0, 2), dtype=GRID_DTYPE)
+    else:
+        # 🔹 Sütun öncelikli sıra: devrik matriste satır sırası
+        cols, rows = np.nonzero(template.T == EMPTY_SEAT)
+        seats = np.stack([rows, cols], axis=1).astype(GRID_DTYPE)
+        template.setflags(write=False)
+    seats.setflags(write=False)
+    return SeatMap(layout, template, seats)
+
+
+class SeatMapCache:
+    """
+    Derslik kimliğine göre SeatMap önbelleği. Kayıt, düzen alanları değişmişse
+    geçersiz sayılır ve yeniden üretilir; böylece veritabanından okunan
+    derslikler de önbellekle her zaman tutarlıdır.
+    """
+
+    def __init__(self):
+        self._maps: Dict[str, SeatMap] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(room: dict):
+        return room.get('classroom_id', room.get('classroom_name'))
+
+    def get(self, room: dict) -> SeatMap:
+        key = self._key(room)
+        layout = layout_key(room)
+        with self._lock:
+            cached = self._maps.get(key)
+            if cached is not None and cached.layout == layout:
+                self.hits += 1
+                return cached
+            self.misses += 1
+        return self.store(room)
+
+    def store(self, room: dict) -> SeatMap:
+        seat_map = build_seat_map(room)
+        with self._lock:
+            self._maps[self._key(room)] = seat_map
+        return seat_map
+
+    def invalidate(self, classroom_ids: Iterable[str]):
+        with self._lock:
+            for classroom_id in classroom_ids:
+                self._maps.pop(classroom_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._maps.clear()
+            self.hits = self.misses = 0
+
+    def statistics(self) -> dict:
+        with self._lock:
+            return {"classrooms": len(self._maps), "hits": self.hits, "misses": self.misses}
+
+
+_cache = SeatMapCache()
+
+
+def seat_map(room: dict) -> SeatMap:
+    return _cache.get(room)
+
+
+def seat_capacity(room: dict) -> int:
+    """
+    Dersliğe oturtulabilecek öğrenci sayısı: düzen biliniyorsa düzendeki koltuk
+    sayısı, değilse kayıtlı kapasite.
+    """
+    if layout_key(room) is None:
+        return int(room.get('capacity', 0) or 0)
+    return seat_map(room).seat_count
+
+
+def cache_classroom(classroom: dict) -> SeatMap:
+    """Derslik eklenirken/güncellenirken şablonu önceden hesaplar."""
+    seat_map = _cache.store(classroom)
+    capacity = int(classroom.get('capacity', 0) or 0)
+    if seat_map.layout is not None and capacity != seat_map.seat_count:
+        logger.warning(
+            "%s dersliğinin kayıtlı kapasitesi (%d) düzendeki koltuk sayısından (%d) farklı; koltuk sayısı kullanılacak.",
+            classroom.get('classroom_id'), capacity, seat_map.seat_count
+        )
+    return seat_map
+
+
+def invalidate_classrooms(classroom_ids: Iterable[str]):
+    _cache.invalidate(classroom_ids)
+
+
+def seat_map_statistics() -> dict:
+    return _cache.statistics()
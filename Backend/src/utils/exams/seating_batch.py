@@ -0,0 +1,95 @@
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from Backend.src.utils.exams.seat_maps import seat_capacity, seat_map
+from Backend.src.utils.exams.seating_grid import build_seating_grid
+
+logger = logging.getLogger(__name__)
+
+# Süreç havuzundaki işçi sayısı (0: çekirdek sayısı)
+SEATING_WORKERS = int(os.getenv("SEATING_WORKERS", "0")) or os.cpu_count() or 1
+# Bundan az öğrenci oturtulacaksa havuz açılmaz; süreç başlatma maliyeti kazancı aşar
+PARALLEL_MIN_STUDENTS = int(os.getenv("SEATING_PARALLEL_MIN_STUDENTS", "1000000"))
+# İşçi başına ortalama parça sayısı; parçalar büyüdükçe IPC azalır, yük dengesi bozulur
+CHUNKS_PER_WORKER = 4
+
+# (öğrenci numaraları, derslikler, tohum, kodlama)
+SeatingTask = Tuple[List[str], List[dict], int, str]
+
+
+def exam_seed(base_seed: int, date: str, class_id) -> int:
+    """Sınavın tohumu; işlem sırasından ve paralellikten bağımsız, tekrarlanabilir."""
+    digest = hashlib.sha256(f"{base_seed}|{date}|{class_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def room_slices(n_students: int, capacities: Sequence[int]) -> List[slice]:
+    """Öğrencileri derslik kapasitelerine göre ardışık dilimlere böler (kopyasız)."""
+    ends = np.minimum(np.cumsum(np.asarray(capacities, dtype=np.int64)), n_students).tolist()
+    starts = [0] + ends[:-1]
+    return [slice(start, end) for start, end in zip(starts, ends)]
+
+
+def seating_task(cls: dict, date: str, base_seed: int, encoding: str = "dense") -> SeatingTask:
+    # 🔹 İşçiye yalnızca numaralar ve derslik düzeni gider (öğrenci sözlükleri değil)
+    rooms = [
+        {
+            "classroom_id": room.get("classroom_id", "Bilinmeyen"),
+            "classroom_name": room.get("classroom_name"),
+            "capacity": room.get("capacity", 0),
+            "seats": seat_capacity(room),
+            "desk_structure": room.get("desk_structure"),
+            "desks_per_row": room.get("desks_per_row"),
+            "desks_per_column": room.get("desks_per_column"),
+        }
+        for room in cls.get("classrooms", [])
+    ]
+    student_nums = [student.get("student_num") for student in cls.get("students", [])]
+    return student_nums, rooms, exam_seed(base_seed, date, cls.get("id")), encoding
+
+
+def seat_exam(task: SeatingTask) -> List[Tuple[str, dict]]:
+    """
+    Bir sınavın oturma planları: öğrenciler sınavın tohumuyla karıştırılır,
+    karışık sıra dersliklerin koltuk sayılarına göre dilimlenir ve her dilim
+    dersliğin önbellekteki şablonuna (seat_maps) yerleştirilir. (derslik, plan) çiftleri döner.
+    """
+    student_nums, rooms, seed, encoding = task
+    order = np.random.default_rng(seed).permutation(len(student_nums))
+    nums = np.array(student_nums, dtype=object)
+
+    plans = []
+    for room, part in zip(rooms, room_slices(len(order), [room["seats"] for room in rooms])):
+        layout = seat_map(room)
+        if layout.template is None:
+            logger.warning("Sıra yapısı (desk_structure) pozitif bir sayı olmalıdır.")
+            plans.append((room["classroom_id"], {}))
+            continue
+        grid = build_seating_grid(room, nums[order[part]].tolist(), layout.template, layout.seats)
+        plans.append((room["classroom_id"], grid.to_dict(encoding)))
+    return plans
+
+
+def seat_exams(tasks: List[SeatingTask], workers: int | None = None) -> List[List[Tuple[str, dict]]]:
+    """
+    Tüm sınavların oturma planlarını üretir. Yük büyükse görevler parçalar
+    hâlinde bir süreç havuzuna dağıtılır; sonuçlar görev sırasıyla döner ve
+    her sınavın tohumu kendisine ait olduğundan seri çalışmayla aynıdır.
+    """
+    workers = workers or SEATING_WORKERS
+    n_students = sum(len(task[0]) for task in tasks)
+    if workers <= 1 or len(tasks) < 2 or n_students < PARALLEL_MIN_STUDENTS:
+        return [seat_exam(task) for task in tasks]
+
+    workers = min(workers, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * CHUNKS_PER_WORKER))
+    logger.info("Oturma planları %d süreçte hazırlanıyor (%d sınav, %d öğrenci)", workers, len(tasks), n_students)
+    # 🔹 spawn: iş parçacıklı sunucudan fork etmek kilitleri kopyalayabilir
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(seat_exam, tasks, chunksize=chunksize))
@@ -0,0 +1,211 @@
+import base64
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+# 🔹 Hücre kodları: >= 0 değerler students listesindeki öğrenci indeksidir
+EMPTY_SEAT = -1   # öğrenci oturmayan koltuk
+AISLE = -2        # sıra içindeki boş bırakılan yer (ör. 3'lü sırada ortadaki "S")
+CORRIDOR = -3     # bloklar arası koridor
+
+# rows() ile dönen hücre türleri
+STUDENT = "student"
+SEAT = "seat"
+AISLE_KIND = "aisle"
+CORRIDOR_KIND = "corridor"
+
+_KINDS = {EMPTY_SEAT: SEAT, AISLE: AISLE_KIND, CORRIDOR: CORRIDOR_KIND}
+
+GRID_DTYPE = np.int32
+GRID_ENCODINGS = ("dense", "base64")
+
+
+def desk_pattern(desk_structure: int) -> List[int]:
+    """Bir sıradaki yerler: 1 → Ö, 2 → Ö S, 3 → Ö S Ö, n → Ö S…S Ö (Ö koltuk, S boş)."""
+    if desk_structure == 1:
+        return [EMPTY_SEAT]
+    if desk_structure == 2:
+        return [EMPTY_SEAT, AISLE]
+    return [EMPTY_SEAT] + [AISLE] * (desk_structure - 2) + [EMPTY_SEAT]
+
+
+def seat_template(room: dict) -> np.ndarray | None:
+    """
+    Dersliğin boş oturma düzeni (desks_per_column × sütun): her blok sıra
+    düzenini izler, bloklar arasına koridor sütunu girer. desk_structure
+    pozitif değilse None döner.
+    """
+    desk_structure = int(room['desk_structure'])
+    num_rows = int(room['desks_per_column'])
+    num_blocks = int(room['desks_per_row'])
+    if desk_structure <= 0:
+        return None
+
+    pattern = desk_pattern(desk_structure)
+    columns = []
+    for block in range(num_blocks):
+        columns.extend(pattern)
+        if block < num_blocks - 1:
+            columns.append(CORRIDOR)
+    return np.repeat(np.array(columns, dtype=GRID_DTYPE)[None, :], num_rows, axis=0)
+
+
+@dataclass
+class SeatingGrid:
+    """
+    Bir dersliğin oturma planı: hücreleri öğrenci indeksi ya da yer kodu olan
+    int32 matris ve hücrelerin gösterdiği öğrenci numaraları.
+    """
+    room_id: str | None
+    cells: np.ndarray
+    students: List[str] = field(default_factory=list)
+    room_name: str | None = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def seated(self) -> int:
+        return len(self.students)
+
+    @classmethod
+    def from_seats(cls, room_id, seats: Iterable[Tuple[int, int, str]], room_name: str | None = None) -> "SeatingGrid":
+        """(satır, sütun, öğrenci no) üçlülerinden plan; düzen bilinmediğinden diğer hücreler boş koltuktur."""
+        seats = list(seats)
+        rows = max((r for r, _, _ in seats), default=-1) + 1
+        cols = max((c for _, c, _ in seats), default=-1) + 1
+        cells = np.full((rows, cols), EMPTY_SEAT, dtype=GRID_DTYPE)
+        students = []
+        for r, c, student_num in seats:
+            cells[r, c] = len(students)
+            students.append(student_num)
+        return cls(room_id, cells, students, room_name)
+
+    def student_at(self, row: int, col: int) -> str | None:
+        code = int(self.cells[row, col])
+        return self.students[code] if code >= 0 else None
+
+    def iter_seats(self) -> Iterator[Tuple[int, int, str]]:
+        """Dolu koltuklar: (satır, sütun, öğrenci no); veritabanı ve öğrenci listeleri için."""
+        rows, cols = np.nonzero(self.cells >= 0)
+        codes = self.cells[rows, cols]
+        for r, c, code in zip(rows.tolist(), cols.tolist(), codes.tolist()):
+            yield r, c, self.students[code]
+
+    def rows(self) -> List[List[Tuple[str, str | None]]]:
+        """Satır satır (tür, öğrenci no) hücreleri; Qt ızgarası ve PDF tablosu için."""
+        students = self.students
+        return [
+            [(STUDENT, students[code]) if code >= 0 else (_KINDS.get(code, SEAT), None) for code in row]
+            for row in self.cells.tolist()
+        ]
+
+    def corridor_columns(self) -> List[int]:
+        if self.cells.size == 0:
+            return []
+        return np.flatnonzero((self.cells == CORRIDOR).all(axis=0)).tolist()
+
+    def to_dict(self, encoding: str = "dense") -> dict:
+        """
+        JSON'a uygun yapı. "dense": hücreler iç içe liste; "base64": hücreler
+        küçük-endian int32 bayt dizisi olarak (büyük dersliklerde daha kısa).
+        """
+        data = {
+            "room_id": self.room_id,
+            "room_name": self.room_name,
+            "shape": list(self.cells.shape),
+            "encoding": encoding,
+            "students": list(self.students),
+        }
+        if encoding == "dense":
+            data["cells"] = self.cells.tolist()
+        elif encoding == "base64":
+            data["data"] = base64.b64encode(self.cells.astype("<i4").tobytes()).decode("ascii")
+        else:
+            raise ValueError(f"Bilinmeyen oturma planı kodlaması: {encoding}")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SeatingGrid":
+        shape = tuple(data.get("shape") or (0, 0))
+        if data.get("encoding") == "base64":
+            cells = np.frombuffer(base64.b64decode(data["data"]), dtype="<i4").astype(GRID_DTYPE).reshape(shape)
+        else:
+            cells = np.array(data.get("cells") or [], dtype=GRID_DTYPE).reshape(shape)
+        return cls(data.get("room_id"), cells, list(data.get("students", [])), data.get("room_name"))
+
+
+def build_seating_grid(
+    room: dict,
+    student_nums: List[str],
+    template: np.ndarray | None = None,
+    seats: np.ndarray | None = None
+) -> SeatingGrid | None:
+    """
+    Öğrencileri sütun sütun (her sütunda önden arkaya) koltuklara yerleştirir.
+    Koltuktan fazla öğrenci varsa fazlası oturtulmaz. Düzen geçersizse None.
+
+    template ve seats (seat_maps.SeatMap) verilirse yerleştirme tek bir dizi
+    atamasıdır; verilmezse düzenden yeniden hesaplanır.
+    """
+    template = seat_template(room) if template is None else template
+    if template is None:
+        return None
+
+    cells = template.copy()
+    if seats is None:
+        # Sütun öncelikli sıra için devrik üzerinde çalışılır
+        cols, rows = np.nonzero(template.T == EMPTY_SEAT)
+    else:
+        rows, cols = seats[:, 0], seats[:, 1]
+    n = min(len(student_nums), len(rows))
+    cells[rows[:n], cols[:n]] = np.arange(n, dtype=GRID_DTYPE)
+    return SeatingGrid(
+        room.get("classroom_id"),
+        cells,
+        list(student_nums[:n]),
+        room.get("classroom_name")
+    )
+
+
+def seating_grid(data, room_id=None) -> SeatingGrid | None:
+    """
+    Seating plan verisini SeatingGrid'e çevirir. Yeni yapıyı (to_dict) ve
+    eski "r,c" / (r, c) anahtarlı hücre sözlüklerini kabul eder; boş veri için None.
+    """
+    if isinstance(data, SeatingGrid):
+        return data
+    if not data:
+        return None
+    if "shape" in data and "students" in data:
+        return SeatingGrid.from_dict(data)
+
+    # 🔹 Eski yapı: {"r,c": {"type": ..., "student_num": ...}}
+    cells = {}
+    for key, cell in data.items():
+        if isinstance(key, str) and "," in key:
+            r, c = map(int, key.split(","))
+        elif isinstance(key, tuple):
+            r, c = key
+        else:
+            continue
+        cells[(r, c)] = cell if isinstance(cell, dict) else {}
+
+    grid = SeatingGrid.from_seats(
+        room_id,
+        [(r, c, cell["student_num"]) for (r, c), cell in cells.items() if cell.get("student_num")]
+    )
+    rows = max((r for r, _ in cells), default=-1) + 1
+    cols = max((c for _, c in cells), default=-1) + 1
+    if (rows, cols) != grid.shape:
+        grown = np.full((rows, cols), EMPTY_SEAT, dtype=GRID_DTYPE)
+        grown[:grid.shape[0], :grid.shape[1]] = grid.cells
+        grid.cells = grown
+    for (r, c), cell in cells.items():
+        if cell.get("type") == "corridor":
+            grid.cells[r, c] = CORRIDOR
+        elif cell.get("type") == "empty":
+            grid.cells[r, c] = AISLE
+    return grid
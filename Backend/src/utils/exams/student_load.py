@@ -0,0 +1,51 @@
+from typing import List
+
+import numpy as np
+
+# Bir öğrencinin bir gündeki sınav sayısı; int16 fakülte ölçeğinde bile küçük kalır
+LOAD_DTYPE = np.int16
+
+
+def attach_student_load(n_students: int, days: List) -> np.ndarray:
+    """
+    Öğrenci×gün sınav sayacını (days × students) oluşturur ve her ExamDay'e
+    kendi satırını (aynı belleğe bakan görünüm) bağlar. Bir dersin
+    yerleştirilmesi satırda tek bir vektörel toplama, uygunluk kontrolü ise
+    dersin öğrenci dilimi üzerinde tek bir max işlemidir.
+    """
+    counts = np.zeros((len(days), n_students), dtype=LOAD_DTYPE)
+    for d, day in enumerate(days):
+        day.student_load = counts[d]
+    return counts
+
+
+def students_fit(row: np.ndarray, students: np.ndarray, limit: int | None) -> bool:
+    if not limit or students.size == 0:
+        return True
+    return int(row[students].max()) < limit
+
+
+def add_students(row: np.ndarray, students: np.ndarray):
+    # Aynı öğrenci listede iki kez geçse bile bir kez sayılır
+    row[students] += 1
+
+
+def student_load_statistics(counts: np.ndarray, limit: int | None = None) -> dict:
+    """
+    Öğrenci yükü özeti:
+    - max_daily_exams: en yoğun gününde k sınavı olan öğrenci sayısı
+    - student_days: k sınavın olduğu (öğrenci, gün) çifti sayısı (k >= 1)
+    - over_limit: sınırı aşan öğrenci sayısı (sınır verildiyse)
+    """
+    if counts.size == 0:
+        return {"limit": limit, "max_daily_exams": {}, "student_days": {}, "over_limit": 0}
+
+    busiest = counts.max(axis=0)
+    max_daily = np.bincount(busiest)
+    student_days = np.bincount(counts.ravel())
+    return {
+        "limit": limit,
+        "max_daily_exams": {k: int(n) for k, n in enumerate(max_daily) if n},
+        "student_days": {k: int(n) for k, n in enumerate(student_days) if n and k},
+        "over_limit": int((busiest > limit).sum()) if limit else 0,
+    }
@@ -1,28 +1,15 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame,
-    QPushButton, QMessageBox, QGridLayout
+    QPushButton, QGridLayout
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from Frontend.src.Admin.ExamProgramPages.get_exam_schedule_worker import get_schedules as ExamScheduleWorker
 from Backend.src.utils.exams.create_exam_program import float_to_time_str, download_exam_schedule
+from Backend.src.utils.exams.seating_grid import STUDENT, seating_grid
 
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import cm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-
-FONT_NAME = '../../../../dejavu-sans.book.ttf'
-FONT_NAME_BOLD = '../../../../DejaVuSans-Bold.ttf'
-
-try:
-    pdfmetrics.registerFont(TTFont(FONT_NAME, 'DejaVuSans.ttf'))
-    pdfmetrics.registerFont(TTFont(FONT_NAME_BOLD, 'DejaVuSans-Bold.ttf'))
-except Exception as e:
-    print(f"--- FONT YÜKLENEMEDİ UYARISI ---\n{e}")
+from Frontend.src.Admin.ExamProgramPages.seating_pdf import seating_pdf_job
+from Frontend.src.Admin.ExamProgramPages.seating_pdf_panel import SeatingPdfPanel
 
 
 class CreatedExamProgramPage(QWidget):
@@ -50,6 +37,10 @@ class CreatedExamProgramPage(QWidget):
         self.scroll_layout = QVBoxLayout(self.scroll_content)
         self.scroll_area.setWidget(self.scroll_content)
         self.main_layout.addWidget(self.scroll_area)
+
+        # 🔹 Oturma planı PDF'leri arka planda hazırlanır
+        self.pdf_panel = SeatingPdfPanel(self)
+        self.main_layout.addWidget(self.pdf_panel)
         
         self.load_exam_programs()
 
@@ -68,6 +59,7 @@ class CreatedExamProgramPage(QWidget):
             widget = self.scroll_layout.itemAt(i).widget()
             if widget:
                 widget.deleteLater()
+        self.pdf_panel.set_jobs([])
 
         if result.get("status") != "success":
             msg = result.get("message", "Veri alınamadı.")
@@ -149,6 +141,7 @@ class CreatedExamProgramPage(QWidget):
                     """)
                     exam_layout.addWidget(pdf_button)
 
+                    self.pdf_panel.add_job(seating_pdf_job(cname, seating_plan, date=str(date)))
                     pdf_button.clicked.connect(
                         lambda checked, exam_name=cname, plan_data=seating_plan:
                             self.create_seating_plan_pdf(f"{exam_name}_oturma_plani.pdf", exam_name, plan_data)
@@ -173,8 +166,9 @@ class CreatedExamProgramPage(QWidget):
                 container_layout = QVBoxLayout(container)
                 container_layout.setSpacing(15)
 
-                for room_name, student_grid in plan_data.items():
-                    if not student_grid:
+                for room_name, grid_data in plan_data.items():
+                    student_grid = seating_grid(grid_data, room_name)
+                    if student_grid is None:
                         continue
 
                     room_frame = QFrame()
@@ -190,24 +184,14 @@ class CreatedExamProgramPage(QWidget):
                     grid_layout = QGridLayout(grid_widget)
                     grid_layout.setSpacing(5)
 
-                    # seating_plan dict -> {"3001": {"1,1": {"student_num":...}}}
-                    parsed_grid = {}
-                    for key, val in student_grid.items():
-                        if isinstance(key, str) and "," in key:
-                            r, c = map(int, key.split(","))
-                            parsed_grid[(r, c)] = val
-
-                    max_row = max((r for r, _ in parsed_grid.keys()), default=-1)
-                    max_col = max((c for _, c in parsed_grid.keys()), default=-1)
-
-                    for r in range(max_row + 1):
-                        for c in range(max_col + 1):
-                            cell = parsed_grid.get((r, c))
+                    # seating_plan -> {"3001": SeatingGrid.to_dict()}
+                    for r, row in enumerate(student_grid.rows()):
+                        for c, (kind, student_no) in enumerate(row):
                             label = QLabel()
                             label.setAlignment(Qt.AlignCenter)
                             label.setFixedSize(45, 28)  
                             
-                            if not cell:
+                            if kind != STUDENT:
                                 label.setText("BOŞ")
                                 label.setStyleSheet("""
                                     color: #777;
@@ -217,8 +201,7 @@ class CreatedExamProgramPage(QWidget):
                                     border-radius: 3px;
                                 """)
                             else:
-                                student_no = str(cell.get("student_num", "???"))
-                                label.setText(student_no)
+                                label.setText(str(student_no))
                                 label.setStyleSheet("""
                                     color: white;
                                     font-size: 9px;
@@ -237,75 +220,6 @@ class CreatedExamProgramPage(QWidget):
 
     # -------------------------- PDF EXPORT --------------------------
     def create_seating_plan_pdf(self, filename: str, exam_name: str, plan_data: dict):
-        doc = SimpleDocTemplate(filename, pagesize=landscape(A4),
-                                leftMargin=1.5 * cm, rightMargin=1.5 * cm,
-                                topMargin=1.5 * cm, bottomMargin=1.5 * cm)
-
-        story = []
-        styles = {
-            'MainTitle': ParagraphStyle(name='MainTitle', fontName=FONT_NAME_BOLD, fontSize=16, alignment=1, spaceAfter=10),
-            'RoomTitle': ParagraphStyle(name='RoomTitle', fontName=FONT_NAME_BOLD, fontSize=12, spaceAfter=6, spaceBefore=10),
-            'CellName': ParagraphStyle(name='CellName', fontName=FONT_NAME, fontSize=8, alignment=1, leading=10),
-            'CellID': ParagraphStyle(name='CellID', fontName=FONT_NAME, fontSize=7, alignment=1, leading=8),
-            'CellEmpty': ParagraphStyle(name='CellEmpty', fontName=FONT_NAME, fontSize=8, alignment=1, textColor=colors.grey, leading=10)
-        }
-
-        story.append(Paragraph(f"Sınav Oturma Planı: {exam_name}", styles['MainTitle']))
-        story.append(Spacer(1, 0.5 * cm))
-
-        first_room = True
-        for room_name, student_grid in plan_data.items():
-            if not first_room:
-                story.append(PageBreak())
-            first_room = False
-
-            story.append(Paragraph(f"Derslik: {room_name}", styles['RoomTitle']))
-            if not student_grid:
-                story.append(Paragraph("Bu derslik için oturma planı verisi yok.", styles['CellEmpty']))
-                continue
-
-            parsed_grid = {}
-            for key, val in student_grid.items():
-                if isinstance(key, str) and "," in key:
-                    r, c = map(int, key.split(","))
-                    parsed_grid[(r, c)] = val
-
-            max_row = max((r for r, _ in parsed_grid.keys()), default=-1)
-            max_col = max((c for _, c in parsed_grid.keys()), default=-1)
-
-            table_data = []
-            for r in range(max_row + 1):
-                row_data = []
-                for c in range(max_col + 1):
-                    cell = parsed_grid.get((r, c))
-                    if cell:
-                        num = cell.get("student_num", "???")
-                        cell_elem = [
-                            Paragraph(f"({num})", styles['CellID'])
-                        ]
-                    else:
-                        cell_elem = Paragraph("(BOŞ)", styles['CellEmpty'])
-                    row_data.append(cell_elem)
-                table_data.append(row_data)
-
-            page_width, _ = landscape(A4)
-            usable_width = page_width - (doc.leftMargin + doc.rightMargin)
-            num_cols = max_col + 1
-            col_width = usable_width / num_cols
-            col_widths = [col_width] * num_cols
-            row_heights = [1.5 * cm] * (max_row + 1)
-
-            t = Table(table_data, colWidths=col_widths, rowHeights=row_heights)
-            t.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('BOX', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ]))
-            story.append(t)
-
-        try:
-            doc.build(story)
-            QMessageBox.information(self, "PDF Oluşturuldu", f"✅ PDF başarıyla oluşturuldu:\n{filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"❌ PDF oluşturulamadı:\n{e}")
+        job = seating_pdf_job(exam_name, plan_data)
+        job["filename"] = filename
+        self.pdf_panel.render([job])
@@ -0,0 +1,151 @@
+# schedule_job_worker.py
+
+import json
+import time
+from PyQt5.QtCore import QThread, pyqtSignal
+import requests
+
+API_BASE = "http://127.0.0.1:8000/admin"
+API_BASE_COR = "http://127.0.0.1:8000/department_coordinator"
+
+FINISHED_STATUSES = ("done", "failed", "cancelled")
+
+PHASE_LABELS = {
+    "queued": "Sırada bekliyor",
+    "loading": "Dersler ve derslikler okunuyor",
+    "placement": "Dersler yerleştiriliyor",
+    "improvement": "Program iyileştiriliyor",
+    "seating": "Oturma planları hazırlanıyor",
+    "finished": "Tamamlandı",
+}
+
+def describe_progress(job: dict) -> str:
+    """İlerleme mesajından arayüzde gösterilecek tek satırlık durum metni."""
+    text = PHASE_LABELS.get(job.get("phase"), job.get("phase", ""))
+    if job.get("total"):
+        text += f": {job.get('placed', 0)}/{job['total']} ders"
+    events = job.get("events") or []
+    last = next((e for e in reversed(events) if e.get("class_name")), None)
+    if last:
+        text += f" | {last['class_name']}"
+        if last.get("date"):
+            text += f" → {last['date']}"
+        if last.get("type") == "class_failed":
+            text += " (yerleştirilemedi)"
+    return text
+
+def describe_feasibility(feasibility: dict | None) -> str:
+    """Olurluk analizindeki tanıları satır satır metne çevirir (önce hatalar)."""
+    if not feasibility:
+        return ""
+    diagnostics = sorted(feasibility.get("diagnostics", []), key=lambda d: d.get("severity") != "error")
+    return "\n".join(
+        f"{'❌' if d.get('severity') == 'error' else '⚠️'} {d.get('message', '')}" for d in diagnostics
+    )
+
+class ScheduleJobWorker(QThread):
+    """
+    Sunucuda sınav programı işini başlatır ve ilerlemesini olay akışından
+    (Server-Sent Events) izler; akış açılamazsa durumu aralıklarla sorgular.
+    """
+    progress = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, payload: dict, userinfo: dict, role=None, poll_interval: float = 0.5):
+        super().__init__()
+        self.payload = payload
+        self.userinfo = userinfo
+        self.role = role
+        self.poll_interval = poll_interval
+        self.job_id = None
+        self.feasibility = None
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        headers = {
+            "Authorization": f"Bearer {self.userinfo['token']}"
+        }
+        base = API_BASE_COR if self.role else API_BASE
+        try:
+            resp = requests.post(f"{base}/start_exam_schedule_job", json=self.payload, headers=headers, timeout=30)
+            result = resp.json()
+            if result.get("status") != "success":
+                detail = result.get("message", resp.text)
+                if result.get("feasibility"):
+                    detail += "\n\n" + describe_feasibility(result["feasibility"])
+                self.finished.emit({"status": "error", "detail": detail, "feasibility": result.get("feasibility")})
+                return
+            self.job_id = result["job"]["job_id"]
+            self.feasibility = result.get("feasibility")
+
+            job = self._follow_events(base, headers) or self._poll(base, headers, result["job"])
+            if job is None:
+                return
+
+            if job["status"] != "done":
+                self.finished.emit({"status": job["status"], "detail": job.get("error") or "İş iptal edildi.", "job": job})
+                return
+
+            resp = requests.get(f"{base}/exam_schedule_job/{self.job_id}/result", headers=headers, timeout=60)
+            result = resp.json()
+            if result.get("status") != "success":
+                self.finished.emit({"status": "error", "detail": result.get("message", resp.text)})
+                return
+            self.finished.emit({
+                "status": "success", "job": result["job"], "results": result["result"], "feasibility": self.feasibility
+            })
+        except Exception as e:
+            self.finished.emit({"status": "error", "detail": str(e)})
+
+    def _send_cancel(self, base, headers):
+        requests.post(f"{base}/exam_schedule_job/{self.job_id}/cancel", headers=headers, timeout=30)
+
+    def _follow_events(self, base, headers):
+        url = f"{base}/exam_schedule_job/{self.job_id}/events"
+        try:
+            resp = requests.get(url, headers=headers, stream=True, timeout=(10, 60))
+            if resp.headers.get("content-type", "").split(";")[0] != "text/event-stream":
+                return None
+        except requests.RequestException:
+            return None
+
+        cancel_sent = False
+        event_name = None
+        try:
+            with resp:
+                for line in resp.iter_lines(decode_unicode=True):
+                    if self._cancel_requested and not cancel_sent:
+                        self._send_cancel(base, headers)
+                        cancel_sent = True
+                    if not line or line.startswith(":"):
+                        continue
+                    if line.startswith("event:"):
+                        event_name = line[len("event:"):].strip()
+                    elif line.startswith("data:"):
+                        job = json.loads(line[len("data:"):])
+                        self.progress.emit(job)
+                        if event_name == "end":
+                            return job
+        except requests.RequestException:
+            pass
+        # 🔹 Akış iş bitmeden koptu; durum sorgulamayla devam edilir
+        return None
+
+    def _poll(self, base, headers, job):
+        cancel_sent = False
+        while job.get("status") not in FINISHED_STATUSES:
+            time.sleep(self.poll_interval)
+            if self._cancel_requested and not cancel_sent:
+                self._send_cancel(base, headers)
+                cancel_sent = True
+            resp = requests.get(f"{base}/exam_schedule_job/{self.job_id}", headers=headers, timeout=30)
+            result = resp.json()
+            if result.get("status") != "success":
+                self.finished.emit({"status": "error", "detail": result.get("message", resp.text)})
+                return None
+            job = result["job"]
+            self.progress.emit(job)
+        return job
@@ -0,0 +1,326 @@
+# seating_pdf.py
+
+import os
+import re
+import threading
+from typing import Callable, Dict, List
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Flowable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from Backend.src.utils.exams.seating_grid import AISLE_KIND, CORRIDOR_KIND, SEAT, STUDENT, seating_grid
+
+FONT_NAME = '../../../../dejavu-sans.book.ttf'
+FONT_NAME_BOLD = '../../../../DejaVuSans-Bold.ttf'
+
+PAGE_SIZE = landscape(A4)
+MARGIN = 1.5 * cm
+USABLE_WIDTH = PAGE_SIZE[0] - 2 * MARGIN
+
+# Ayrıntılı planda hücre türlerinin arka planları
+CELL_BACKGROUNDS = {
+    CORRIDOR_KIND: colors.HexColor("#222222"),
+    STUDENT: colors.HexColor("#006d11"),   # Dolu sıra
+    SEAT: colors.HexColor("#666666"),      # Boş sıra
+    AISLE_KIND: colors.HexColor("#333333"),  # Boş alan
+}
+
+_fonts_lock = threading.Lock()
+_fonts_registered = None
+_styles = None
+_flyweights = None
+
+
+class SeatingPdfCancelled(Exception):
+    pass
+
+
+class CellText(Flowable):
+    """
+    Hücrede ortalanmış birkaç satır yazı. Paragraph'ın biçim ayrıştırma ve
+    satır kırma adımları olmadan doğrudan tuvale çizilir; oturma planındaki
+    binlerce hücre için ucuzdur. lines: (metin, yazı tipi, boyut, renk).
+    """
+
+    def __init__(self, lines: tuple, leading: float = 10):
+        super().__init__()
+        self.lines = lines
+        self.leading = leading
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = self.leading * len(self.lines)
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        y = self.height - self.leading + 2
+        for text, font, size, color in self.lines:
+            canvas.setFont(font, size)
+            canvas.setFillColor(color)
+            canvas.drawCentredString(self.width / 2, y, text)
+            y -= self.leading
+
+
+def register_fonts() -> bool:
+    """Yazı tiplerini süreç başına bir kez kaydeder; başarısızsa uyarı basılır."""
+    global _fonts_registered
+    with _fonts_lock:
+        if _fonts_registered is None:
+            try:
+                pdfmetrics.registerFont(TTFont(FONT_NAME, 'DejaVuSans.ttf'))
+                pdfmetrics.registerFont(TTFont(FONT_NAME_BOLD, 'DejaVuSans-Bold.ttf'))
+                _fonts_registered = True
+            except Exception as e:
+                print(f"--- FONT YÜKLENEMEDİ UYARISI ---\n{e}")
+                _fonts_registered = False
+        return _fonts_registered
+
+
+def pdf_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraf stilleri bir kez oluşturulur ve tüm belgelerde paylaşılır."""
+    global _styles
+    if _styles is None:
+        font = FONT_NAME if register_fonts() else 'Helvetica'
+        font_bold = FONT_NAME_BOLD if _fonts_registered else 'Helvetica-Bold'
+        _styles = {
+            'MainTitle': ParagraphStyle(name='MainTitle', fontName=font_bold, fontSize=16, alignment=1, spaceAfter=10),
+            'RoomTitle': ParagraphStyle(name='RoomTitle', fontName=font_bold, fontSize=12, spaceAfter=6, spaceBefore=10),
+            'CellName': ParagraphStyle(name='CellName', fontName=font, fontSize=8, alignment=1, leading=10),
+            'CellID': ParagraphStyle(
+                name='CellID', fontName=font, fontSize=8, alignment=1, leading=10, textColor=colors.white
+            ),
+            'CellEmpty': ParagraphStyle(
+                name='CellEmpty', fontName=font, fontSize=8, alignment=1, textColor=colors.grey, leading=10
+            ),
+            'CellCorridor': ParagraphStyle(
+                name='CellCorridor', fontName=font, fontSize=8, alignment=1, textColor=colors.lightgrey, leading=10
+            ),
+            'ListHeaderFont': font_bold,
+            'ListFont': font,
+        }
+    return _styles
+
+
+def _cell_line(text: str, style: ParagraphStyle, font: str | None = None) -> tuple:
+    return text, font or style.fontName, style.fontSize, style.textColor
+
+
+def cell_flyweights() -> Dict[str, CellText]:
+    """
+    Tekrarlanan hücreler (boş koltuk, koridor) için paylaşılan hücre nesneleri.
+    Tablo her hücreyi çizmeden hemen önce yeniden sardığından aynı nesne
+    birden çok hücrede güvenle kullanılabilir.
+    """
+    global _flyweights
+    if _flyweights is None:
+        styles = pdf_styles()
+        _flyweights = {
+            "empty": CellText((_cell_line("(BOŞ)", styles['CellEmpty']),)),
+            "corridor": CellText((_cell_line("(KORİDOR)", styles['CellCorridor']),)),
+            "corridor_plain": CellText((_cell_line("(KORİDOR)", styles['CellEmpty']),)),
+        }
+    return _flyweights
+
+
+def short_name(name_surname: str) -> str:
+    # İsmi kısalt (sığması için)
+    if len(name_surname) > 20:
+        parts = name_surname.split(' ')
+        if len(parts) > 1:
+            return f"{parts[0]} {parts[-1][0]}."
+        return name_surname[:18] + "..."
+    return name_surname
+
+
+def pdf_filename(exam_name: str, date: str | None = None) -> str:
+    name = f"{date}_{exam_name}" if date else exam_name
+    return re.sub(r'[\\/:*?"<>|]+', "_", name).strip() + "_oturma_plani.pdf"
+
+
+def seating_pdf_job(exam_name: str, plan_data: dict, students: dict | None = None, date: str | None = None) -> dict:
+    """
+    Bir sınavın PDF işi. students (öğrenci no → ad soyad) verilirse ayrıntılı
+    plan (isimler, renkler, öğrenci listesi), verilmezse yalnızca numaralar çizilir.
+    """
+    return {
+        "exam_name": exam_name,
+        "plan_data": plan_data,
+        "students": students,
+        "date": date,
+        "filename": pdf_filename(exam_name, date),
+    }
+
+
+def _background_runs(grid_rows) -> list:
+    """Satırdaki aynı türden ardışık hücreler tek BACKGROUND komutuyla boyanır."""
+    commands = []
+    for r, row in enumerate(grid_rows):
+        start = 0
+        for c in range(1, len(row) + 1):
+            if c == len(row) or row[c][0] != row[start][0]:
+                color = CELL_BACKGROUNDS.get(row[start][0], CELL_BACKGROUNDS[AISLE_KIND])
+                commands.append(('BACKGROUND', (start, r), (c - 1, r), color))
+                start = c
+    return commands
+
+
+def _room_story(room_name: str, grid_data, students: dict | None) -> list:
+    styles = pdf_styles()
+    flyweights = cell_flyweights()
+    story = [Paragraph(f"Derslik: {room_name}", styles['RoomTitle'])]
+
+    student_grid = seating_grid(grid_data, room_name)
+    if student_grid is None or not student_grid.cells.size:
+        story.append(Paragraph("Bu derslik için oturma planı verisi bulunmuyor.", styles['CellEmpty']))
+        return story
+
+    detailed = students is not None
+    num_rows, num_cols = student_grid.shape
+    grid_rows = student_grid.rows()
+
+    table_data = []
+    for row in grid_rows:
+        row_data = []
+        for kind, num in row:
+            if kind == STUDENT:
+                if detailed:
+                    name = short_name(students.get(num, "Bilinmiyor"))
+                    row_data.append(CellText((
+                        _cell_line(str(num), styles['CellID'], styles['ListHeaderFont']),
+                        _cell_line(name, styles['CellID'])
+                    )))
+                else:
+                    row_data.append(CellText((_cell_line(str(num), styles['CellName']),)))
+            elif kind == CORRIDOR_KIND or (kind == AISLE_KIND and not detailed):
+                row_data.append(flyweights["corridor"] if detailed else flyweights["corridor_plain"])
+            else:
+                row_data.append(flyweights["empty"])
+        table_data.append(row_data)
+
+    col_widths = [USABLE_WIDTH / num_cols] * num_cols
+    table = Table(table_data, colWidths=col_widths, rowHeights=[(1.4 if detailed else 1.5) * cm] * num_rows)
+    if detailed:
+        table_style_data = [
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ]
+        table_style_data.extend(_background_runs(grid_rows))
+        # 🔹 Blok sınırlarını kalın çizgiyle göster (koridor öncesi)
+        for c in student_grid.corridor_columns():
+            if c > 0:
+                table_style_data.append(('LINEAFTER', (c - 1, 0), (c - 1, num_rows - 1), 1.5, colors.black))
+    else:
+        table_style_data = [
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BOX', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ]
+    table.setStyle(TableStyle(table_style_data))
+    story.append(table)
+
+    if not detailed:
+        return story
+
+    # 🔹 Öğrenci listesi tablosu
+    story.append(Spacer(1, 0.7 * cm))
+    student_list_rows = sorted(
+        ([num, students.get(num, "Bilinmiyor"), str(r + 1), str(c + 1)] for r, c, num in student_grid.iter_seats()),
+        key=lambda x: x[0]
+    )
+    if not student_list_rows:
+        story.append(Paragraph("Bu derslikte sınava giren öğrenci bulunmamaktadır.", styles['CellEmpty']))
+        return story
+
+    list_table = Table(
+        [["Öğrenci No", "Ad Soyad", "Satır", "Sütun"]] + student_list_rows,
+        colWidths=[USABLE_WIDTH * 0.25, USABLE_WIDTH * 0.45, USABLE_WIDTH * 0.15, USABLE_WIDTH * 0.15]
+    )
+    list_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('FONTNAME', (0, 0), (-1, 0), styles['ListHeaderFont']),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 1), (-1, -1), styles['ListFont']),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ALIGN', (0, 1), (1, -1), 'LEFT'),
+        ('ALIGN', (2, 1), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ]))
+    story.append(list_table)
+    return story
+
+
+def exam_story(job: dict) -> list:
+    """Bir sınavın sayfaları: başlık ve her derslik ayrı sayfada."""
+    styles = pdf_styles()
+    story = [
+        Paragraph(f"Sınav Oturma Planı: {job['exam_name']}", styles['MainTitle']),
+        Spacer(1, 0.5 * cm),
+    ]
+    for i, (room_name, grid_data) in enumerate((job.get("plan_data") or {}).items()):
+        if i:
+            story.append(PageBreak())
+        story.extend(_room_story(room_name, grid_data, job.get("students")))
+    return story
+
+
+def _document(filename: str) -> SimpleDocTemplate:
+    return SimpleDocTemplate(
+        filename, pagesize=PAGE_SIZE,
+        leftMargin=MARGIN, rightMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN
+    )
+
+
+def render_exam_pdf(job: dict, directory: str = ".") -> str:
+    """Tek sınavın PDF'i; işçi süreçlerinde de çalışır. Dosya yolu döner."""
+    path = os.path.join(directory, job["filename"])
+    _document(path).build(exam_story(job))
+    return path
+
+
+class _ProgressMark(Flowable):
+    """Yer kaplamayan işaret: çizildiğinde sınavın sayfaları bitmiş demektir."""
+
+    def __init__(self, callback: Callable[[int], None], index: int):
+        super().__init__()
+        self.callback = callback
+        self.index = index
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.callback(self.index)
+
+
+def render_combined_pdf(jobs: List[dict], path: str, progress: Callable[[int], None] | None = None) -> str:
+    """
+    Tüm sınavları tek belgede, her sınav yeni sayfadan başlayacak şekilde
+    çizer. progress sınav çizimi bittikçe (tamamlanan sınav sayısıyla)
+    çağrılır; SeatingPdfCancelled fırlatırsa yarım dosya silinir.
+    """
+    story = []
+    for index, job in enumerate(jobs):
+        if index:
+            story.append(PageBreak())
+        story.extend(exam_story(job))
+        if progress is not None:
+            story.append(_ProgressMark(lambda i: progress(i + 1), index))
+    try:
+        _document(path).build(story)
+    except SeatingPdfCancelled:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return path
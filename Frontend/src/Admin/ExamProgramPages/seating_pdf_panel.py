@@ -0,0 +1,118 @@
+# seating_pdf_panel.py
+
+from PyQt5.QtWidgets import QFileDialog, QHBoxLayout, QLabel, QMessageBox, QProgressBar, QPushButton, QVBoxLayout, QWidget
+
+from Frontend.src.Admin.ExamProgramPages.seating_pdf_worker import SeatingPdfWorker
+
+
+class SeatingPdfPanel(QWidget):
+    """
+    Oturma planı PDF'lerini arka planda üreten kontrol çubuğu: tüm sınavlar
+    tek PDF ya da ayrı PDF'ler olarak indirilir, ilerleme ve iptal gösterilir.
+    Sayfalar tek sınav düğmeleri için de render() çağırır.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []
+        self.worker = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        button_layout = QHBoxLayout()
+
+        button_style = """
+            QPushButton { background-color: #2d71b8; border: none; border-radius: 5px; padding: 8px; font-size: 12px; color: white; }
+            QPushButton:hover { background-color: #3a82c9; }
+            QPushButton:disabled { background-color: #555; color: #999; }
+        """
+        self.combined_btn = QPushButton("📄 Tüm Oturma Planları (Tek PDF)")
+        self.combined_btn.setStyleSheet(button_style)
+        self.combined_btn.clicked.connect(self.download_combined)
+        self.separate_btn = QPushButton("📁 Tüm Oturma Planları (Ayrı PDF'ler)")
+        self.separate_btn.setStyleSheet(button_style)
+        self.separate_btn.clicked.connect(self.download_separate)
+        self.cancel_btn = QPushButton("✖ İptal")
+        self.cancel_btn.setVisible(False)
+        self.cancel_btn.clicked.connect(self.cancel)
+        button_layout.addWidget(self.combined_btn)
+        button_layout.addWidget(self.separate_btn)
+        button_layout.addWidget(self.cancel_btn)
+        layout.addLayout(button_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #ccc; font-size: 12px;")
+        self.status_label.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+
+    def set_jobs(self, jobs: list):
+        self.jobs = list(jobs)
+
+    def add_job(self, job: dict):
+        self.jobs.append(job)
+
+    def download_combined(self):
+        if not self.jobs:
+            QMessageBox.warning(self, "Uyarı", "İndirilecek bir oturma planı bulunmuyor.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "PDF Kaydet", "oturma_planlari.pdf", "PDF (*.pdf)")
+        if path:
+            self.render(self.jobs, combined_path=path)
+
+    def download_separate(self):
+        if not self.jobs:
+            QMessageBox.warning(self, "Uyarı", "İndirilecek bir oturma planı bulunmuyor.")
+            return
+        directory = QFileDialog.getExistingDirectory(self, "PDF'lerin Kaydedileceği Klasör")
+        if directory:
+            self.render(self.jobs, directory=directory)
+
+    def render(self, jobs: list, directory: str = ".", combined_path: str | None = None):
+        if self.worker is not None and self.worker.isRunning():
+            QMessageBox.warning(self, "Uyarı", "PDF oluşturma işlemi devam ediyor.")
+            return
+
+        self._set_running(True, len(jobs))
+        self.worker = SeatingPdfWorker(jobs, directory=directory, combined_path=combined_path)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.finished.connect(self.on_finished)
+        self.worker.start()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("İptal ediliyor...")
+
+    def update_progress(self, done: int, total: int):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"PDF hazırlanıyor: {done}/{total} sınav")
+
+    def on_finished(self, result: dict):
+        self._set_running(False)
+        status = result.get("status")
+        if status == "success":
+            files = result.get("files", [])
+            shown = files[0] if len(files) == 1 else f"{len(files)} dosya"
+            QMessageBox.information(self, "PDF Oluşturuldu", f"✅ PDF başarıyla oluşturuldu:\n{shown}")
+        elif status == "cancelled":
+            self.status_label.setVisible(True)
+            self.status_label.setText("PDF oluşturma iptal edildi.")
+        else:
+            QMessageBox.critical(self, "Hata", f"❌ PDF oluşturulamadı:\n{result.get('detail', '')}")
+
+    def _set_running(self, running: bool, total: int = 0):
+        self.combined_btn.setEnabled(not running)
+        self.separate_btn.setEnabled(not running)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setVisible(running)
+        self.progress_bar.setVisible(running)
+        self.status_label.setVisible(running)
+        if running:
+            self.progress_bar.setRange(0, total)
+            self.progress_bar.setValue(0)
+            self.status_label.setText(f"PDF hazırlanıyor: 0/{total} sınav")
@@ -0,0 +1,84 @@
+# seating_pdf_worker.py
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from Frontend.src.Admin.ExamProgramPages.seating_pdf import (
+    SeatingPdfCancelled, register_fonts, render_combined_pdf, render_exam_pdf
+)
+
+# Ayrı dosyalarda süreç havuzundaki işçi sayısı (0: çekirdek sayısı)
+PDF_WORKERS = int(os.getenv("SEATING_PDF_WORKERS", "0")) or os.cpu_count() or 1
+# Bundan az sınav için süreç açılmaz; başlatma maliyeti kazancı aşar
+PARALLEL_MIN_EXAMS = 4
+
+
+class SeatingPdfWorker(QThread):
+    """
+    Oturma planı PDF'lerini arayüz iş parçacığının dışında üretir.
+
+    combined_path verilirse tüm sınavlar tek belgeye, verilmezse her sınav
+    directory altında ayrı bir dosyaya yazılır; ayrı dosyalar yeterince
+    çoksa bir süreç havuzunda paralel çizilir. Her sınav bittiğinde progress
+    (biten, toplam) yayılır; cancel() sonrası yeni sınav başlatılmaz.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, jobs: list, directory: str = ".", combined_path: str | None = None, workers: int | None = None):
+        super().__init__()
+        self.jobs = list(jobs)
+        self.directory = directory
+        self.combined_path = combined_path
+        self.workers = workers or PDF_WORKERS
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def _check_cancel(self, done: int):
+        self.progress.emit(done, len(self.jobs))
+        if self._cancel_requested:
+            raise SeatingPdfCancelled()
+
+    def run(self):
+        register_fonts()
+        try:
+            if self.combined_path:
+                render_combined_pdf(self.jobs, self.combined_path, progress=self._check_cancel)
+                files = [self.combined_path]
+            elif self.workers > 1 and len(self.jobs) >= PARALLEL_MIN_EXAMS:
+                files = self._render_parallel()
+            else:
+                files = []
+                for done, job in enumerate(self.jobs, start=1):
+                    files.append(render_exam_pdf(job, self.directory))
+                    self._check_cancel(done)
+        except SeatingPdfCancelled:
+            self.finished.emit({"status": "cancelled", "files": []})
+            return
+        except Exception as e:
+            self.finished.emit({"status": "error", "detail": str(e)})
+            return
+
+        self.finished.emit({"status": "success", "files": files})
+
+    def _render_parallel(self) -> list:
+        files = []
+        # 🔹 spawn: Qt uygulamasından fork etmek güvenli değil; yazı tipleri işçi başına bir kez kaydedilir
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(self.jobs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=register_fonts
+        )
+        try:
+            futures = [executor.submit(render_exam_pdf, job, self.directory) for job in self.jobs]
+            for done, future in enumerate(as_completed(futures), start=1):
+                files.append(future.result())
+                self._check_cancel(done)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return files
@@ -4,29 +4,13 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QRectF
 from PyQt5.QtGui import QFont, QColor, QPen
 from Backend.src.utils.exams.create_exam_program import float_to_time_str, download_exam_schedule
+from Backend.src.utils.exams.seating_grid import AISLE_KIND, CORRIDOR_KIND, SEAT, STUDENT, seating_grid
 from PyQt5.QtPrintSupport import QPrinter
 from PyQt5.QtGui import QPainter
 import datetime
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
-from reportlab.lib.units import cm 
-
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.styles import ParagraphStyle 
 from Frontend.src.Admin.ExamProgramPages.get_exam_schedule_worker import get_schedules as ExamScheduleWorker
-
-FONT_NAME = '../../../../dejavu-sans.book.ttf'
-FONT_NAME_BOLD = '../../../../DejaVuSans-Bold.ttf'
-
-try:
-    pdfmetrics.registerFont(TTFont(FONT_NAME, 'DejaVuSans.ttf'))
-    pdfmetrics.registerFont(TTFont(FONT_NAME_BOLD, 'DejaVuSans-Bold.ttf'))
-except Exception as e:
-    print(f"--- FONT YÜKLENEMEDİ UYARISI ---")
-    print(f"Hata: {e}")
+from Frontend.src.Admin.ExamProgramPages.seating_pdf import seating_pdf_job
+from Frontend.src.Admin.ExamProgramPages.seating_pdf_panel import SeatingPdfPanel
 
 class CreatedExamProgramPage(QWidget):
     def __init__(self, user_info: dict, parent=None):
@@ -56,6 +40,10 @@ class CreatedExamProgramPage(QWidget):
         self.scroll_layout = QVBoxLayout(self.scroll_content)
         self.scroll_area.setWidget(self.scroll_content)
         self.main_layout.addWidget(self.scroll_area)
+
+        # 🔹 Oturma planı PDF'leri arka planda hazırlanır
+        self.pdf_panel = SeatingPdfPanel(self)
+        self.main_layout.addWidget(self.pdf_panel)
         self.get_excel_btn = None
         self.pdf_button = None
 
@@ -63,6 +51,7 @@ class CreatedExamProgramPage(QWidget):
         self.exam_schedule = result_data.get("exam_schedule", [])
         failed_classes = result_data.get("failed_classes", [])
         stats = result_data.get("statistics", {})
+        self.pdf_panel.set_jobs([])
 
         for i in reversed(range(self.scroll_layout.count())):
             widget = self.scroll_layout.itemAt(i).widget()
@@ -149,6 +138,7 @@ class CreatedExamProgramPage(QWidget):
                             name_surname = students.get("name") + " " + str(students.get("surname"))
                             students_and_names[student_num] = name_surname
                         
+                        self.pdf_panel.add_job(seating_pdf_job(cname, seating_plan_data, students_and_names, date=day.get("date")))
                         download_pdf_button.clicked.connect(
                             lambda checked, exam_name=cname, studentsnames=students_and_names, plan_data=seating_plan_data: 
                             self.create_seating_plan_pdf(
@@ -228,8 +218,9 @@ class CreatedExamProgramPage(QWidget):
             container_layout.setContentsMargins(15, 15, 15, 15)
 
         # 🔹 Her oda için ayrı grid çiz
-        for room_name, student_grid in plan_data.items():
-            if not student_grid:
+        for room_name, grid_data in plan_data.items():
+            student_grid = seating_grid(grid_data, room_name)
+            if student_grid is None:
                 continue
 
             # Oda çerçevesi
@@ -255,18 +246,13 @@ class CreatedExamProgramPage(QWidget):
             grid_layout = QGridLayout(grid_widget)
             grid_layout.setSpacing(6)
 
-            max_row = max((r for r, _ in student_grid.keys()), default=-1)
-            max_col = max((c for _, c in student_grid.keys()), default=-1)
-
-            for r in range(max_row + 1):
-                for c in range(max_col + 1):
-                    cell = student_grid.get((r, c), {"type": "empty"})
-                    ctype = cell.get("type")
+            for r, row in enumerate(student_grid.rows()):
+                for c, (kind, student_no) in enumerate(row):
                     label = QLabel()
                     label.setAlignment(Qt.AlignCenter)
                     label.setFixedSize(65, 45)
 
-                    if ctype == "corridor":
+                    if kind == CORRIDOR_KIND:
                         label.setText("KORİDOR")
                         label.setStyleSheet("""
                             QLabel {
@@ -277,9 +263,8 @@ class CreatedExamProgramPage(QWidget):
                                 border-radius: 5px;
                             }
                         """)
-                    elif ctype == "seat" and cell.get("student_num") is not None:
-                        student_no = str(cell["student_num"])
-                        label.setText(student_no)
+                    elif kind == STUDENT:
+                        label.setText(str(student_no))
                         label.setStyleSheet("""
                             QLabel {
                                 color: white;
@@ -290,7 +275,7 @@ class CreatedExamProgramPage(QWidget):
                                 box-shadow: 0 2px 4px rgba(0,0,0,0.3);
                             }
                         """)
-                    elif ctype == "seat":
+                    elif kind == SEAT:
                         label.setText("BOŞ")
                         label.setStyleSheet("""
                             QLabel {
@@ -301,7 +286,7 @@ class CreatedExamProgramPage(QWidget):
                                 border-radius: 6px;
                             }
                         """)
-                    else:  # empty
+                    else:  # aisle
                         label.setText("")
                         label.setStyleSheet("background-color: transparent;")
 
@@ -322,211 +307,22 @@ class CreatedExamProgramPage(QWidget):
             return
         filename = "sinav_programi.xlsx"
         try:
-            download_exam_schedule(exam_schedule=self.exam_schedule, filename=filename)
+            download_exam_schedule(exam_schedule=self.exam_schedule, filename=filename, department=self.user_info.get("department"))
             QMessageBox.information(self, "Başarılı", f"Sınav programı '{filename}' olarak başarıyla kaydedildi.")
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Dosya kaydedilirken bir hata oluştu:\n{e}")
                         
     def create_seating_plan_pdf(self, filename: str, exam_name: str, plan_data: dict, students: dict):
-        # PDF dökümanını yatay (landscape) A4 olarak ayarla
-        doc = SimpleDocTemplate(filename, pagesize=landscape(A4),
-                                leftMargin=1.5 * cm, rightMargin=1.5 * cm,
-                                topMargin=1.5 * cm, bottomMargin=1.5 * cm)
-
-        story = []
-
-        # Paragraf stilleri
-        styles = {
-            'MainTitle': ParagraphStyle(
-                name='MainTitle', fontName=FONT_NAME_BOLD, fontSize=16, alignment=1, spaceAfter=10
-            ),
-            'RoomTitle': ParagraphStyle(
-                name='RoomTitle', fontName=FONT_NAME_BOLD, fontSize=12, spaceAfter=6, spaceBefore=10
-            ),
-            'CellID': ParagraphStyle(
-                name='CellID', fontName=FONT_NAME, fontSize=8, alignment=1, leading=10,
-                textColor=colors.white # Koltuk içindeki yazı rengini beyaz yaptım
-            ),
-            'CellEmpty': ParagraphStyle(
-                name='CellEmpty', fontName=FONT_NAME, fontSize=8, alignment=1,
-                textColor=colors.grey, leading=10
-            ),
-            'CellCorridor': ParagraphStyle(
-                name='CellCorridor', fontName=FONT_NAME, fontSize=8, alignment=1,
-                textColor=colors.lightgrey, leading=10 # Koridor yazısını açık gri yaptım
-            ),
-        }
-
-        # Ana başlık
-        story.append(Paragraph(f"Sınav Oturma Planı: {exam_name}", styles['MainTitle']))
-        story.append(Spacer(1, 0.5 * cm))
-
-        first_room = True
-        for room_name, student_grid in plan_data.items():
-            if not first_room:
-                story.append(PageBreak())
-            first_room = False
-
-            story.append(Paragraph(f"Derslik: {room_name}", styles['RoomTitle']))
-
-            if not student_grid:
-                story.append(Paragraph("Bu derslik için oturma planı verisi bulunmuyor.", styles['CellEmpty']))
-                continue
-
-            # Boyutlar
-            max_row = max((key[0] for key in student_grid.keys()), default=-1)
-            max_col = max((key[1] for key in student_grid.keys()), default=-1)
-
-            table_data = []
-            for r in range(max_row + 1):
-                row_data = []
-                for c in range(max_col + 1):
-                    cell = student_grid.get((r, c), {"type": "empty"})
-                    ctype = cell.get("type")
-
-                    # Hücre tipi
-                    if ctype == "corridor":
-                        cell_elem = Paragraph("(KORİDOR)", styles['CellCorridor'])
-                    elif ctype == "empty":
-                        cell_elem = Paragraph("(BOŞ)", styles['CellEmpty'])
-                    elif ctype == "seat" and cell.get("student_num") is not None:
-                        num = cell.get("student_num", "???")
-                        name_surname = students.get(num, "Bilinmiyor")
-                        # İsmi kısalt (opsiyonel, sığması için)
-                        if len(name_surname) > 20:
-                            parts = name_surname.split(' ')
-                            if len(parts) > 1:
-                                name_surname = f"{parts[0]} {parts[-1][0]}."
-                            else:
-                                name_surname = name_surname[:18] + "..."
-                        
-                        cell_elem = Paragraph(f"<b>{num}</b><br/>{name_surname}", styles['CellID'])
-                    elif ctype == "seat":
-                        cell_elem = Paragraph("(BOŞ)", styles['CellEmpty'])
-                    else:
-                        cell_elem = Paragraph("", styles['CellEmpty'])
-
-                    row_data.append(cell_elem)
-                table_data.append(row_data)
-
-            if not table_data:
-                continue
+        job = seating_pdf_job(exam_name, plan_data, students)
+        job["filename"] = filename
+        self.pdf_panel.render([job])
 
-            # PDF tablo ayarları
-            page_width, _ = landscape(A4)
-            usable_width = page_width - (doc.leftMargin + doc.rightMargin)
-            num_cols = max_col + 1
-            col_width = usable_width / num_cols
-
-            col_widths = [col_width] * num_cols
-            row_heights = [1.4 * cm] * (max_row + 1)
-
-            # Tablo oluştur
-            t = Table(table_data, colWidths=col_widths, rowHeights=row_heights)
-
-            # Stil — blok ve koridor vurgusu
-            table_style_data = [
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
-            ]
-
-            # 🔹 Arka plan renkleri
-            for r in range(max_row + 1):
-                for c in range(max_col + 1):
-                    cell = student_grid.get((r, c), {"type": "empty"})
-                    ctype = cell.get("type")
-                    
-                    if ctype == "corridor":
-                        table_style_data.append(('BACKGROUND', (c, r), (c, r), colors.HexColor("#222222")))
-                    elif ctype == "seat" and cell.get("student_num"):
-                        table_style_data.append(('BACKGROUND', (c, r), (c, r), colors.HexColor("#006d11"))) # Dolu sıra
-                    elif ctype == "seat":
-                        table_style_data.append(('BACKGROUND', (c, r), (c, r), colors.HexColor("#666666"))) # Boş sıra
-                    else: # empty
-                        table_style_data.append(('BACKGROUND', (c, r), (c, r), colors.HexColor("#333333"))) # Boş alan
-
-            # 🔹 Blok sınırlarını kalın çizgiyle göster (koridor öncesi)
-            for c in range(max_col):
-                col_types = [student_grid.get((0, c), {}).get("type"), student_grid.get((0, c+1), {}).get("type")]
-                if col_types[1] == "corridor" and col_types[0] != "corridor":
-                    table_style_data.append(('LINEAFTER', (c, 0), (c, max_row), 1.5, colors.black))
-
-            t.setStyle(TableStyle(table_style_data))
-            story.append(t)
-
-            # -----------------------------------------------------------
-            # YENİ EKLENEN BÖLÜM: Öğrenci Listesi Tablosu
-            # -----------------------------------------------------------
-            
-            story.append(Spacer(1, 0.7 * cm)) # Oturma planı ile liste arasına boşluk
-
-            student_list_rows = []
-            # O sınıftaki tüm öğrencileri topla
-            for (r, c), cell in student_grid.items():
-                if cell.get("type") == "seat" and cell.get("student_num"):
-                    num = cell.get("student_num")
-                    name = students.get(num, "Bilinmiyor")
-                    # Satır ve Sütun için 1-bazlı indeksleme
-                    student_list_rows.append([num, name, str(r + 1), str(c + 1)])
-
-            if not student_list_rows:
-                story.append(Paragraph("Bu derslikte sınava giren öğrenci bulunmamaktadır.", styles['CellEmpty']))
-                continue # Bir sonraki odaya geç
-
-            # Listeyi öğrenci numarasına göre sırala
-            student_list_rows.sort(key=lambda x: x[0])
-
-            # Başlık satırını ekle
-            list_data = [["Öğrenci No", "Ad Soyad", "Satır", "Sütun"]]
-            list_data.extend(student_list_rows)
-
-            # Liste tablosu için sütun genişlikleri
-            list_col_widths = [
-                usable_width * 0.25,  # Numara
-                usable_width * 0.45,  # Ad Soyad
-                usable_width * 0.15,  # Satır
-                usable_width * 0.15   # Sütun
-            ]
-
-            list_table = Table(list_data, colWidths=list_col_widths)
-
-            # Liste tablosunun stili
-            list_table_style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#E0E0E0")), # Başlık satırı arka planı
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                ('FONTNAME', (0, 0), (-1, 0), FONT_NAME_BOLD),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 1), (-1, -1), FONT_NAME),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ALIGN', (0, 1), (1, -1), 'LEFT'),   # No ve Ad/Soyad sola hizalı
-                ('ALIGN', (2, 1), (-1, -1), 'CENTER'), # Satır/Sütun ortalı
-                ('TOPPADDING', (0, 0), (-1, -1), 4),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ])
-            
-            list_table.setStyle(list_table_style)
-            story.append(list_table)
-            # -----------------------------------------------------------
-            # YENİ BÖLÜM SONU
-            # -----------------------------------------------------------
-
-        # PDF dosyasını oluştur
-        try:
-            doc.build(story)
-            print(f"✅ PDF başarıyla oluşturuldu: {filename}")
-        except Exception as e:
-            print(f"❌ PDF oluşturulurken hata oluştu: {e}")
-
-
-            
     def on_exam_schedule_loaded(self, result: dict):
         for i in reversed(range(self.scroll_layout.count())):
             widget = self.scroll_layout.itemAt(i).widget()
             if widget:
                 widget.deleteLater()
+        self.pdf_panel.set_jobs([])
 
         if result.get("status") != "success":
             msg = result.get("message", "Veri alınamadı.")
@@ -608,6 +404,7 @@ class CreatedExamProgramPage(QWidget):
                     """)
                     exam_layout.addWidget(pdf_button)
 
+                    self.pdf_panel.add_job(seating_pdf_job(cname, seating_plan, date=str(date)))
                     pdf_button.clicked.connect(
                         lambda checked, exam_name=cname, plan_data=seating_plan:
                             self.create_seating_plan_pdf_ver2(f"{exam_name}_oturma_plani.pdf", exam_name, plan_data)
@@ -632,8 +429,9 @@ class CreatedExamProgramPage(QWidget):
                 container_layout = QVBoxLayout(container)
                 container_layout.setSpacing(15)
 
-                for room_name, student_grid in plan_data.items():
-                    if not student_grid:
+                for room_name, grid_data in plan_data.items():
+                    student_grid = seating_grid(grid_data, room_name)
+                    if student_grid is None:
                         continue
 
                     room_frame = QFrame()
@@ -649,27 +447,16 @@ class CreatedExamProgramPage(QWidget):
                     grid_layout = QGridLayout(grid_widget)
                     grid_layout.setSpacing(5)
 
-                    # seating_plan dict -> {"3001": {"1,1": {"student_num":...}}}
-                    parsed_grid = {}
-                    for key, val in student_grid.items():
-                        if isinstance(key, str) and "," in key:
-                            r, c = map(int, key.split(","))
-                            parsed_grid[(r, c)] = val
-
-                    max_row = max((r for r, _ in parsed_grid.keys()), default=-1)
-                    max_col = max((c for _, c in parsed_grid.keys()), default=-1)
-
-                    for r in range(max_row + 1):
-                        for c in range(max_col + 1):
-                            cell = parsed_grid.get((r, c))
+                    # seating_plan -> {"3001": SeatingGrid.to_dict()}
+                    for r, row in enumerate(student_grid.rows()):
+                        for c, (kind, student_no) in enumerate(row):
                             label = QLabel()
                             label.setAlignment(Qt.AlignCenter)
                             label.setFixedSize(60, 40)
-                            if isinstance(cell, dict):
-                                student_no = str(cell.get("student_num", "???"))
-                                label.setText(student_no)
+                            if kind == STUDENT:
+                                label.setText(str(student_no))
                                 label.setStyleSheet("color: white; font-weight: bold; background-color: #005a03; border: 1px solid #1b851f; border-radius: 4px;")
-                            elif cell in ("KORİDOR", "AISLE"):
+                            elif kind in (CORRIDOR_KIND, AISLE_KIND):
                                 label.setText("Koridor")
                                 label.setStyleSheet("color: #666; font-size: 9px; background-color: #282828; border-radius: 3px;")
                             else:
@@ -685,76 +472,6 @@ class CreatedExamProgramPage(QWidget):
 
     # -------------------------- PDF EXPORT --------------------------
     def create_seating_plan_pdf_ver2(self, filename: str, exam_name: str, plan_data: dict):
-        doc = SimpleDocTemplate(filename, pagesize=landscape(A4),
-                                leftMargin=1.5 * cm, rightMargin=1.5 * cm,
-                                topMargin=1.5 * cm, bottomMargin=1.5 * cm)
-
-        story = []
-        styles = {
-            'MainTitle': ParagraphStyle(name='MainTitle', fontName=FONT_NAME_BOLD, fontSize=16, alignment=1, spaceAfter=10),
-            'RoomTitle': ParagraphStyle(name='RoomTitle', fontName=FONT_NAME_BOLD, fontSize=12, spaceAfter=6, spaceBefore=10),
-            'CellName': ParagraphStyle(name='CellName', fontName=FONT_NAME, fontSize=8, alignment=1, leading=10),
-            'CellID': ParagraphStyle(name='CellID', fontName=FONT_NAME, fontSize=7, alignment=1, leading=8),
-            'CellEmpty': ParagraphStyle(name='CellEmpty', fontName=FONT_NAME, fontSize=8, alignment=1, textColor=colors.grey, leading=10)
-        }
-
-        story.append(Paragraph(f"Sınav Oturma Planı: {exam_name}", styles['MainTitle']))
-        story.append(Spacer(1, 0.5 * cm))
-
-        first_room = True
-        for room_name, student_grid in plan_data.items():
-            if not first_room:
-                story.append(PageBreak())
-            first_room = False
-
-            story.append(Paragraph(f"Derslik: {room_name}", styles['RoomTitle']))
-            if not student_grid:
-                story.append(Paragraph("Bu derslik için oturma planı verisi yok.", styles['CellEmpty']))
-                continue
-
-            parsed_grid = {}
-            for key, val in student_grid.items():
-                if isinstance(key, str) and "," in key:
-                    r, c = map(int, key.split(","))
-                    parsed_grid[(r, c)] = val
-
-            max_row = max((r for r, _ in parsed_grid.keys()), default=-1)
-            max_col = max((c for _, c in parsed_grid.keys()), default=-1)
-
-            table_data = []
-            for r in range(max_row + 1):
-                row_data = []
-                for c in range(max_col + 1):
-                    cell = parsed_grid.get((r, c))
-                    if isinstance(cell, dict):
-                        num = cell.get("student_num", "???")
-                        cell_elem = [Paragraph(f"{num}", styles['CellName'])]
-                    elif cell in ("KORİDOR", "AISLE"):
-                        cell_elem = Paragraph("(KORİDOR)", styles['CellEmpty'])
-                    else:
-                        cell_elem = Paragraph("(BOŞ)", styles['CellEmpty'])
-
-                    row_data.append(cell_elem)
-                table_data.append(row_data)
-
-            page_width, _ = landscape(A4)
-            usable_width = page_width - (doc.leftMargin + doc.rightMargin)
-            num_cols = max_col + 1
-            col_width = usable_width / num_cols
-            col_widths = [col_width] * num_cols
-            row_heights = [1.5 * cm] * (max_row + 1)
-
-            t = Table(table_data, colWidths=col_widths, rowHeights=row_heights)
-            t.setStyle(TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('BOX', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ]))
-            story.append(t)
-
-        try:
-            doc.build(story)
-            QMessageBox.information(self, "PDF Oluşturuldu", f"✅ PDF başarıyla oluşturuldu:\n{filename}")
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"❌ PDF oluşturulamadı:\n{e}")
+        job = seating_pdf_job(exam_name, plan_data)
+        job["filename"] = filename
+        self.pdf_panel.render([job])
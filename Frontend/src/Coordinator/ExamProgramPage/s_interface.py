@@ -1,17 +1,15 @@
-from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
     QDateEdit, QComboBox, QSpinBox, QPushButton,
-    QScrollArea, QFrame, QMessageBox, QApplication,
+    QScrollArea, QFrame, QMessageBox, QApplication, QProgressBar,
     QTimeEdit, QDoubleSpinBox, QLineEdit, QDialog, QTextEdit, QDialogButtonBox
 )
 from PyQt5.QtCore import Qt, QDate, pyqtSignal
 from PyQt5.QtGui import QFont
 from Frontend.src.Coordinator.ExamProgramPage.exam_program_worker import GetClasses
 from Backend.src.utils.exams.ExanProgramClass import ExamProgram
-from Backend.src.utils.exams.create_exam_program import create_exam_schedule
-from Frontend.src.Coordinator.Classroom.classroomReqs import ClassroomRequests
 from Frontend.src.Admin.ExamProgramPages.insert_exam_schedule_worker import InsertExamScheduleWorker
+from Frontend.src.Admin.ExamProgramPages.schedule_job_worker import ScheduleJobWorker, describe_progress
 
 class ExamProgramPage(QWidget):
     program_created = pyqtSignal(dict)
@@ -37,9 +35,9 @@ class ExamProgramPage(QWidget):
         self.start_time_value = 9.0
         self.end_time_value = 17.0
         
-        self.classes_and_their_students = None
-        self.classrooms_data = None
         self.exam_program = None
+        # Aynı girdilerle tekrar oluşturmada sonuç önbellekten gelir
+        self.schedule_seed = 0
         
         self.init_ui()
 
@@ -73,6 +71,18 @@ class ExamProgramPage(QWidget):
         
         
 
+        # 🔹 Sunucudaki program oluşturma işinin canlı ilerlemesi
+        self.schedule_status_label = QLabel("")
+        self.schedule_status_label.setAlignment(Qt.AlignCenter)
+        self.schedule_status_label.setVisible(False)
+        self.schedule_progress_bar = QProgressBar()
+        self.schedule_progress_bar.setVisible(False)
+        self.cancel_job_btn = QPushButton("✖ İptal")
+        self.cancel_job_btn.setVisible(False)
+        self.cancel_job_btn.clicked.connect(self.cancel_schedule_job)
+        main_layout.addWidget(self.schedule_status_label)
+        main_layout.addWidget(self.schedule_progress_bar)
+
         # Butonlar
         button_layout = QHBoxLayout()
         self.back_btn = QPushButton("⬅ Geri")
@@ -92,6 +102,7 @@ class ExamProgramPage(QWidget):
         button_layout.addStretch()
         button_layout.addWidget(self.next_btn)
         button_layout.addWidget(self.finish_btn)
+        button_layout.addWidget(self.cancel_job_btn)
         main_layout.addLayout(button_layout)
 
         # İlk adım
@@ -539,83 +550,60 @@ class ExamProgramPage(QWidget):
 
             self.exam_program.set_bekleme_suresi(self.saved_bekleme)
 
-            self.get_class_and_student_worker = GetClasses("classes_with_years", self.user_info)
-            self.get_class_and_student_worker.finished.connect(self.handle_classes_and_students)
-            self.get_class_and_student_worker.start()
+            payload = self.exam_program.to_request_dict()
+            payload["seed"] = self.schedule_seed
+
+            # 🔹 Program sunucuda arka plan işi olarak oluşturulur; arayüz donmaz
+            self.schedule_job_worker = ScheduleJobWorker(payload, self.user_info, role=True)
+            self.schedule_job_worker.progress.connect(self.update_schedule_progress)
+            self.schedule_job_worker.finished.connect(self.handle_schedule_job)
+            self.active_threads.append(self.schedule_job_worker)
+            self.set_schedule_running(True)
+            self.schedule_job_worker.start()
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"❌ Program oluşturulurken hata oluştu:\n{str(e)}")
 
 
-    def handle_classes_and_students(self, response):
-            try:
-                if response.get("status") != "success":
-                    QMessageBox.critical(
-                        self, "Hata",
-                        f"❌ Sınıf ve öğrenci bilgileri alınamadı:\n{response.get('detail', 'Bilinmeyen hata')}"
-                    )
-                    return
-
-                self.classes_and_their_students = response.get("classes", {})
-
-                self.get_classroom_worker = ClassroomRequests("exam_classrooms", user_info=self.user_info)
-                self.get_classroom_worker.finished.connect(self.handle_classroom_response)
-                self.get_classroom_worker.start()
-
-            finally:
-                if hasattr(self, "get_class_and_student_worker"):
-                    self.get_class_and_student_worker.quit()
-                    self.get_class_and_student_worker.wait()
-
-    def handle_classroom_response(self, response):
+    def set_schedule_running(self, running: bool):
+        self.finish_btn.setEnabled(not running)
+        self.back_btn.setEnabled(not running)
+        self.cancel_job_btn.setEnabled(True)
+        self.cancel_job_btn.setVisible(running)
+        self.schedule_progress_bar.setVisible(running)
+        self.schedule_status_label.setVisible(running)
+        if running:
+            # Toplam ders sayısı gelene kadar belirsiz ilerleme gösterilir
+            self.schedule_progress_bar.setRange(0, 0)
+            self.schedule_status_label.setText("Sınav programı işi başlatılıyor...")
+
+    def update_schedule_progress(self, job):
+        total = job.get("total") or 0
+        if total:
+            self.schedule_progress_bar.setRange(0, total)
+            self.schedule_progress_bar.setValue(job.get("placed", 0))
+        self.schedule_status_label.setText(describe_progress(job))
+
+    def cancel_schedule_job(self):
+        if hasattr(self, "schedule_job_worker"):
+            self.schedule_job_worker.cancel()
+            self.cancel_job_btn.setEnabled(False)
+            self.schedule_status_label.setText("İptal ediliyor...")
+
+    def handle_schedule_job(self, response):
+        self.set_schedule_running(False)
         try:
+            if response.get("status") == "cancelled":
+                QMessageBox.information(self, "Bilgi", "Sınav programı oluşturma iptal edildi.")
+                return
             if response.get("status") != "success":
-                QMessageBox.warning(
-                    self, "Uyarı",
-                    f"⚠️ Sınıf bilgileri alınamadı:\n{response.get('detail', 'Bilinmeyen hata')}\n\n"
-                    "Program varsayılan odalarla oluşturulacak."
+                QMessageBox.critical(
+                    self, "Hata",
+                    f"❌ Sınav programı oluşturulamadı:\n{response.get('detail', 'Bilinmeyen hata')}"
                 )
-                raise Exception("Classroom verileri alınamadı")
-            
-            else:
-                self.classrooms_data = response.get("classrooms", [])
+                return
 
-            self.create_exam_program()
-
-        finally:
-            if hasattr(self, "get_classroom_worker"):
-                self.get_classroom_worker.quit()
-                self.get_classroom_worker.wait()
-                
-    def make_json_safe(self, data):
-        if isinstance(data, dict):
-            new_dict = {}
-            for k, v in data.items():
-                if isinstance(k, tuple):
-                    k = f"{k[0]},{k[1]}"
-                new_dict[str(k)] = self.make_json_safe(v)
-            return new_dict
-        elif isinstance(data, list):
-            return [self.make_json_safe(i) for i in data]
-        elif isinstance(data, (datetime,)):
-            return data.isoformat()
-        else:
-            return data        
-        
-    def create_exam_program(self):
-        try:
-            if not self.exam_program:
-                raise ValueError("ExamProgram nesnesi oluşturulmamış")
-            if not self.classes_and_their_students:
-                raise ValueError("Sınıf ve öğrenci verileri alınamadı")
-            if not self.classrooms_data:
-                raise ValueError("Classroom verileri alınamadı")
-            
-            self.results = create_exam_schedule(
-                exam_program=self.exam_program,
-                class_dict=self.classes_and_their_students,
-                classrooms=self.classrooms_data,
-            )
+            self.results = response.get("results", {})
             stats = self.results.get("statistics", {})
             failed_classes = self.results.get("failed_classes", [])
             failed_classes = [cls_name['name'] for cls_name in failed_classes]
@@ -628,9 +616,10 @@ class ExamProgramPage(QWidget):
                 error_per_class_cleaned = f"\n\nSınav programı oluşurken Oluşan sorunlar:\n{error_per_class_cleaned}"
             
             self.show_scrollable_message(stats, failed_classes, error_per_class_cleaned)
-            exam_schedule = self.make_json_safe(self.results['exam_schedule'])
             if len(failed_classes) == 0:
-                self.insert_exam_schedule_worker = InsertExamScheduleWorker("insert_exam_schedule_to_db", exam_schedule, self.user_info, role=True)
+                # 🔹 Sonuç sunucuda olduğundan yalnızca kaydetme isteği gönderilir
+                job_id = response["job"]["job_id"]
+                self.insert_exam_schedule_worker = InsertExamScheduleWorker(f"exam_schedule_job/{job_id}/persist", None, self.user_info, role=True)
                 self.insert_exam_schedule_worker.finished.connect(self.handle_insert_exam_schedule)
                 self.active_threads.append(self.insert_exam_schedule_worker)  
                 self.insert_exam_schedule_worker.start()
@@ -646,6 +635,13 @@ class ExamProgramPage(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"❌ Beklenmeyen hata:\n{str(e)}")
 
+        finally:
+            if hasattr(self, "schedule_job_worker"):
+                self.schedule_job_worker.quit()
+                self.schedule_job_worker.wait()
+                if self.schedule_job_worker in self.active_threads:
+                    self.active_threads.remove(self.schedule_job_worker)
+
                 
 
     def show_scrollable_message(self, stats, failed_classes, error_per_class_cleaned):
@@ -0,0 +1,51 @@
+import random
+
+from Backend.src.utils.exams.conflict_graph import StudentConflictGraph
+
+
+def _class_dict(rng: random.Random, n_classes: int, n_students: int) -> dict:
+    class_dict = {}
+    for c in range(n_classes):
+        students = [{"student_num": str(s)} for s in rng.sample(range(n_students), rng.randint(0, n_students // 2))]
+        # 🔹 Tekrarlanan ve numarasız kayıtlar yok sayılmalı
+        students += students[:2] + [{"student_num": None}, {}]
+        class_dict[f"C{c:02d}"] = {"students": students}
+    return class_dict
+
+
+def _student_sets(class_dict: dict) -> dict:
+    return {
+        class_id: {s["student_num"] for s in info["students"] if s.get("student_num")}
+        for class_id, info in class_dict.items()
+    }
+
+
+def test_edges_and_degrees_match_set_intersections():
+    rng = random.Random(3)
+    for _ in range(20):
+        class_dict = _class_dict(rng, rng.randint(1, 15), rng.randint(1, 40))
+        graph = StudentConflictGraph(class_dict)
+        sets = _student_sets(class_dict)
+
+        for a in sets:
+            expected = {b: len(sets[a] & sets[b]) for b in sets if b != a and sets[a] & sets[b]}
+            assert graph.neighbours(a) == expected
+            assert graph.degree(a) == len(expected)
+            assert graph.sizes[a] == len(sets[a])
+            for b in sets:
+                if b == a:
+                    continue
+                assert graph.has_conflict(a, b) == (b in expected)
+                assert graph.conflict_count(a, b) == expected.get(b, 0)
+                assert sorted(graph.conflicting_students(a, b)) == sorted(sets[a] & sets[b])
+            others = [b for b in sets if b != a]
+            assert graph.first_conflict(a, others) == next((b for b in others if b in expected), None)
+
+
+def test_unknown_class_has_no_edges():
+    graph = StudentConflictGraph({"A": {"students": [{"student_num": "1"}]}})
+
+    assert "B" not in graph
+    assert graph.degree("B") == 0
+    assert not graph.has_conflict("A", "B")
+    assert graph.conflicting_students("A", "B") == []
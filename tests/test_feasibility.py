@@ -0,0 +1,46 @@
+from Backend.src.utils.exams.benchmark_fixtures import make_exam_program, synthetic_fixture
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule
+from Backend.src.utils.exams.feasibility import ERROR, analyze_feasibility
+
+
+def _verdicts(exam_program, class_dict, classrooms):
+    report = analyze_feasibility(exam_program, class_dict, classrooms)
+    result = create_exam_schedule(exam_program, class_dict, classrooms, seed=0, seating=False)
+    return report, result["statistics"]
+
+
+def test_year_limit_is_not_an_error_when_the_scheduler_exceeds_it():
+    # 40 birinci sınıf dersi, 2 gün: esnek sınır 2 * (2 + 3) = 10 ders
+    class_dict, classrooms = synthetic_fixture(n_students=200, n_courses=40, n_rooms=20)
+    for info in class_dict.values():
+        info["year"] = 1
+    exam_program = make_exam_program("2025-11-03", "2025-11-04")
+
+    report, statistics = _verdicts(exam_program, class_dict, classrooms)
+
+    year_limit = next(d for d in report["diagnostics"] if d["code"] == "YEAR_LIMIT")
+    assert statistics["successful_classes"] > year_limit["capacity"]
+    assert year_limit["severity"] != ERROR
+    assert report["feasible"]
+
+
+def test_error_diagnostic_means_the_scheduler_cannot_place_everything():
+    class_dict, classrooms = synthetic_fixture(n_students=200, n_courses=8, n_rooms=20)
+    exam_program = make_exam_program("2025-11-03", "2025-11-04")
+    exam_program.set_start_end_time(9.0, 10.0)
+
+    report, statistics = _verdicts(exam_program, class_dict, classrooms)
+
+    assert any(d["code"] == "EXAM_LONGER_THAN_WINDOW" for d in report["diagnostics"])
+    assert not report["feasible"]
+    assert statistics["failed_classes"] > 0
+
+
+def test_feasible_inputs_are_scheduled_completely():
+    class_dict, classrooms = synthetic_fixture(n_students=200, n_courses=12, n_rooms=20)
+    exam_program = make_exam_program()
+
+    report, statistics = _verdicts(exam_program, class_dict, classrooms)
+
+    assert report["feasible"]
+    assert statistics["failed_classes"] == 0
@@ -0,0 +1,41 @@
+import pytest
+
+from Backend.src.DataBase.src.utils.insert_exam_schedule import _schedule_ids
+
+
+class _ScheduleCursor:
+    """exam_schedules tablosunu bellekte taklit eden en küçük imleç."""
+
+    def __init__(self, rows: dict):
+        self.rows = dict(rows)  # tarih -> (id, sınav türü)
+        self.result = []
+
+    def executemany(self, sql, params):
+        for day_date, exam_type in params:
+            self.rows.setdefault(day_date, (len(self.rows) + 1, exam_type))
+
+    def execute(self, sql, params):
+        self.result = [(self.rows[d][0], d, self.rows[d][1]) for d in params if d in self.rows]
+
+    def fetchall(self):
+        return self.result
+
+
+def test_schedule_ids_reuse_existing_day_with_same_exam_type():
+    cursor = _ScheduleCursor({"2025-11-03": (7, "Vize")})
+    days = {"2025-11-03": ("2025-11-03", "Vize"), "2025-11-04": ("2025-11-04", "Vize")}
+
+    assert _schedule_ids(cursor, days) == {"2025-11-03": 7, "2025-11-04": 2}
+
+
+def test_schedule_ids_reject_conflicting_exam_type():
+    cursor = _ScheduleCursor({"2025-11-03": (7, "Vize")})
+
+    with pytest.raises(ValueError, match="2025-11-03"):
+        _schedule_ids(cursor, {"2025-11-03": ("2025-11-03", "Final")})
+
+
+def test_schedule_ids_unspecified_exam_type_joins_existing_day():
+    cursor = _ScheduleCursor({"2025-11-03": (7, "Vize")})
+
+    assert _schedule_ids(cursor, {"2025-11-03": ("2025-11-03", "N/A")}) == {"2025-11-03": 7}
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from Backend.src.DataBase.src.utils.insert_students import class_edges, student_rows
+
+
+def _students() -> pd.DataFrame:
+    return pd.DataFrame([
+        {"student_num": "101", "name": "Ada", "surname": "A", "grade": 1, "department": "BM", "classes": ["BM101", "BM102"]},
+        {"student_num": "102", "name": "Can", "surname": "B", "grade": "x", "department": "BM", "classes": "BM101"},
+        {"student_num": "abc", "name": "Ece", "surname": "C", "grade": 2, "department": "BM", "classes": "BM101"},
+        {"student_num": "103", "name": None, "surname": "D", "grade": 3, "department": "BM", "classes": "BM103"},
+        {"student_num": "104", "name": "Deniz", "surname": "E", "grade": 2, "department": "BM", "classes": "BM101, BM103,,"},
+        {"student_num": "101", "name": "Ada", "surname": "A", "grade": 2, "department": "BM", "classes": None},
+    ])
+
+
+def test_student_rows_drops_invalid_rows_and_keeps_last_duplicate():
+    valid, errors = student_rows(_students())
+
+    assert valid["student_num"].tolist() == [104, 101]
+    assert valid.loc[valid["student_num"] == 101, "grade"].item() == 2
+    assert [(e["student"], e["error"]) for e in errors] == [
+        (102, "Missing or invalid field(s): grade"),
+        (None, "Missing or invalid field(s): student_num"),
+        (103, "Missing or invalid field(s): name"),
+    ]
+
+
+def test_class_edges_explodes_lists_and_comma_separated_text():
+    students = pd.DataFrame({
+        "student_num": [1, 2, 3, 4],
+        "classes": [["BM101", "BM102"], "BM101, BM103,,", None, ["BM101", "BM101"]],
+    })
+
+    edges = class_edges(students)
+
+    assert sorted(edges.itertuples(index=False, name=None)) == [
+        (1, "BM101"), (1, "BM102"), (2, "BM101"), (2, "BM103"), (4, "BM101"),
+    ]
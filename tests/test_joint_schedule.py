@@ -0,0 +1,46 @@
+from itertools import combinations
+
+from Backend.src.utils.exams.benchmark_fixtures import make_exam_program, synthetic_fixture
+from Backend.src.utils.exams.joint_schedule import create_joint_exam_schedule
+
+
+def _departments(strategy: str) -> dict:
+    a, rooms = synthetic_fixture(200, 20, 8, seed=1)
+    b, _ = synthetic_fixture(150, 16, 1, seed=2)
+    b = {class_id.replace("SYN", "B"): data for class_id, data in b.items()}
+    return {name: (make_exam_program(strategy=strategy), classes) for name, classes in (("A", a), ("B", b))}, rooms
+
+
+def _bookings(result: dict) -> list:
+    bookings = []
+    for name, department in result["departments"].items():
+        for day in department["exam_schedule"]:
+            for exam in day["exams"]:
+                for cls in exam["classes"]:
+                    for room in cls["classrooms"]:
+                        bookings.append((day["date"], room["classroom_id"], cls["start_time"], cls["end_time"], name))
+    return bookings
+
+
+def _schedules(result: dict) -> dict:
+    return {name: department["exam_schedule"] for name, department in result["departments"].items()}
+
+
+def test_joint_schedule_is_deterministic():
+    for strategy in ("greedy", "dsatur"):
+        departments, rooms = _departments(strategy)
+        first = create_joint_exam_schedule(departments, rooms, seed=5, seating=False)
+        second = create_joint_exam_schedule(departments, rooms, seed=5, seating=False)
+
+        assert _schedules(first) == _schedules(second)
+
+
+def test_joint_schedule_never_double_books_a_room():
+    departments, rooms = _departments("greedy")
+    result = create_joint_exam_schedule(departments, rooms, seed=5, seating=False)
+    bookings = _bookings(result)
+
+    assert {name for *_, name in bookings} == {"A", "B"}
+    for first, second in combinations(bookings, 2):
+        if first[:2] == second[:2]:
+            assert first[3] <= second[2] or second[3] <= first[2]
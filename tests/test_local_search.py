@@ -0,0 +1,68 @@
+from collections import Counter
+
+from Backend.src.utils.exams.benchmark_fixtures import make_exam_program, synthetic_fixture
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule
+from Backend.src.utils.exams.multi_start import schedule_objective, score_schedule
+
+
+def _classes(result):
+    return [cls for day in result["exam_schedule"] for exam in day["exams"] for cls in exam["classes"]]
+
+
+def _improved(seed=1, iterations=400):
+    class_dict, classrooms = synthetic_fixture(n_students=800, n_courses=60, n_rooms=60, seed=4)
+    result = create_exam_schedule(
+        make_exam_program(), class_dict, classrooms, seed=seed, seating=False, improve_iterations=iterations
+    )
+    return class_dict, result
+
+
+def test_every_class_is_placed_once_or_failed():
+    class_dict, result = _improved()
+
+    names = Counter(cls["name"] for cls in _classes(result))
+    names.update(cls["name"] for cls in result["failed_classes"])
+
+    assert names == Counter(info["class_name"] for info in class_dict.values())
+
+
+def test_rooms_are_not_double_booked():
+    _, result = _improved()
+
+    for day in result["exam_schedule"]:
+        classes = [cls for exam in day["exams"] for cls in exam["classes"]]
+        for i, first in enumerate(classes):
+            for second in classes[i + 1:]:
+                overlap = first["start_time"] < second["end_time"] and second["start_time"] < first["end_time"]
+                shared = {r["classroom_id"] for r in first["classrooms"]} & {r["classroom_id"] for r in second["classrooms"]}
+                assert not (overlap and shared), (day["date"], first["name"], second["name"], shared)
+
+
+def test_improvement_never_worsens_the_greedy_schedule():
+    _, greedy = _improved(iterations=0)
+    _, improved = _improved()
+
+    assert schedule_objective(improved)["failed_classes"] <= schedule_objective(greedy)["failed_classes"]
+    assert improved["statistics"]["local_search"]["final_objective"] <= improved["statistics"]["local_search"]["initial_objective"]
+    assert score_schedule(improved) <= score_schedule(greedy)
+
+
+def test_room_usage_counters_follow_the_moves(monkeypatch):
+    from Backend.src.utils.exams import local_search
+
+    improve_schedule = local_search.improve_schedule
+    checked = []
+
+    def checking_improve(exam_program, model, exam_schedule, *args, **kwargs):
+        report = improve_schedule(exam_program, model, exam_schedule, *args, **kwargs)
+        usage = kwargs["used_classrooms_per_day"]
+        for day in exam_schedule:
+            placed = Counter(model.rooms[room].name for b in day.blocks for p in b.placements for room in p.rooms)
+            assert Counter({name: n for name, n in usage[day.date].items() if n}) == placed, day.date
+        checked.append(report["accepted_moves"])
+        return report
+
+    monkeypatch.setattr(local_search, "improve_schedule", checking_improve)
+    _improved(iterations=1000)
+
+    assert checked and checked[0] > 0
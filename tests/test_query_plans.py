@@ -0,0 +1,19 @@
+import pytest
+
+from Backend.src.DataBase.src.Database_connection import get_database
+from Backend.src.DataBase.src.query_plans import check_query_plans
+
+
+@pytest.fixture(scope="module")
+def database():
+    try:
+        with get_database() as db:
+            db.ping(reconnect=False)
+    except Exception as e:
+        pytest.skip(f"MySQL erişilemiyor: {e}")
+
+
+def test_queries_do_not_scan_full_tables(database):
+    failures = check_query_plans()
+
+    assert not failures, "\n".join(f"{plan.name}: {', '.join(plan.full_scans)}\n{plan.sql}" for plan in failures)
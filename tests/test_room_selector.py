@@ -0,0 +1,53 @@
+import random
+from itertools import combinations
+
+from Backend.src.utils.exams.room_selector import RoomSetSelector
+
+
+def _rooms(rng: random.Random, n: int) -> list:
+    return [{"classroom_name": f"D{i:02d}", "capacity": rng.choice([0, 10, 15, 20, 20, 30, 40])} for i in range(n)]
+
+
+def _brute_force(rooms: list, student_count: int, used: dict, unavailable: set, excluded: set):
+    """Seçicinin öncelik sırasıyla tüm kümeleri tek tek dener."""
+    candidates = [
+        i for i, room in enumerate(rooms)
+        if i not in unavailable and room["classroom_name"] not in excluded and room["capacity"] > 0
+    ]
+    need = max(student_count, 1)
+    best_key, best = None, None
+    for size in range(1, len(candidates) + 1):
+        for chosen in combinations(candidates, size):
+            capacity = sum(rooms[i]["capacity"] for i in chosen)
+            if capacity < need:
+                continue
+            usage = sum(used.get(rooms[i]["classroom_name"], 0) for i in chosen)
+            key = (usage, size, capacity - need, chosen)
+            if best_key is None or key < best_key:
+                best_key, best = key, chosen
+    return best
+
+
+def test_select_indices_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(300):
+        rooms = _rooms(rng, rng.randint(1, 8))
+        names = [room["classroom_name"] for room in rooms]
+        used = {name: rng.choice([0, 0, 1, 2, 3]) for name in names}
+        unavailable = set(rng.sample(range(len(rooms)), rng.randint(0, len(rooms) // 2)))
+        excluded = set(rng.sample(names, rng.randint(0, 1)))
+        student_count = rng.randint(1, 120)
+
+        chosen = RoomSetSelector(rooms).select_indices(student_count, list(excluded), used, unavailable)
+
+        assert chosen == _brute_force(rooms, student_count, used, unavailable, excluded)
+
+
+def test_select_indices_respects_unavailable_rooms():
+    rooms = [{"classroom_name": f"D{i}", "capacity": capacity} for i, capacity in enumerate([50, 30, 30, 20])]
+    selector = RoomSetSelector(rooms)
+
+    assert selector.select_indices(45) == (0,)
+    assert selector.select_indices(45, unavailable={0}) == (1, 3)
+    assert selector.select_indices(45, unavailable={0, 1}) == (2, 3)
+    assert selector.select_indices(45, unavailable={0, 1, 2}) is None
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from Backend.src.utils.exams.benchmark_fixtures import make_exam_program, synthetic_fixture
+from Backend.src.utils.exams.create_exam_program import create_exam_schedule
+from Backend.src.utils.exams.schedule_cache import ScheduleCache, dumps_result, loads_result
+
+
+def test_result_round_trips_through_json():
+    class_dict, classrooms = synthetic_fixture(n_students=120, n_courses=12, n_rooms=10)
+    result = create_exam_schedule(make_exam_program(), class_dict, classrooms, seed=0)
+    result["extra"] = {(1, "a"): {1, 2}, 3: ("x", [4])}
+
+    assert loads_result(dumps_result(result)) == result
+
+
+def test_cache_directory_is_private(tmp_path):
+    directory = tmp_path / "cache"
+    cache = ScheduleCache(str(directory))
+    cache.put("key", {"statistics": {}})
+
+    assert cache.enabled
+    assert (directory.stat().st_mode & 0o777) == 0o700
+    assert cache.get("key") == {"statistics": {}}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="dizin sahibini değiştirmek root gerektirir")
+def test_foreign_cache_directory_is_not_read(tmp_path):
+    directory = tmp_path / "cache"
+    ScheduleCache(str(directory)).put("key", {"statistics": {}})
+    os.chown(directory, 12345, 12345)
+
+    cache = ScheduleCache(str(directory))
+
+    assert not cache.enabled
+    assert cache.get("key") is None
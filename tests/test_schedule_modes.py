@@ -0,0 +1,57 @@
+from Backend.src.DataBase.src.structures.exam_program import ExamProgramRequest
+from Backend.src.utils.exams.benchmark_fixtures import synthetic_fixture
+from Backend.src.utils.exams.multi_start import create_exam_schedule_multi_start
+from Backend.src.utils.exams.schedule_cache import ScheduleCache, create_exam_schedule_cached
+
+
+def _request(**settings) -> ExamProgramRequest:
+    return ExamProgramRequest(
+        tarih_baslangic="2025-11-03", tarih_bitis="2025-11-14",
+        haris_gunler=["Cumartesi", "Pazar"], exam_conflict=True, **settings
+    )
+
+
+def test_multi_start_request_runs_every_seed(tmp_path):
+    class_dict, classrooms = synthetic_fixture(n_students=120, n_courses=12, n_rooms=10)
+    events = []
+
+    result = create_exam_schedule_cached(
+        _request(multi_start_runs=3).to_exam_program(), class_dict, classrooms,
+        cache=ScheduleCache(str(tmp_path)), progress=events.append
+    )
+
+    assert result["statistics"]["runs_completed"] == 3
+    assert [e["seed"] for e in events if e["type"] == "run_finished"]
+    assert not result["statistics"]["cache_hit"]
+
+
+def test_multi_start_settings_change_the_fingerprint():
+    single = _request().to_exam_program()
+    multi = _request(multi_start_runs=4).to_exam_program()
+    budgeted = _request(multi_start_runs=4, multi_start_time_budget=5).to_exam_program()
+
+    assert len({single.fingerprint(), multi.fingerprint(), budgeted.fingerprint()}) == 3
+    assert ExamProgramRequest(**multi.to_request_dict()).to_exam_program().fingerprint() == multi.fingerprint()
+
+
+def test_improvement_request_runs_local_search(tmp_path):
+    class_dict, classrooms = synthetic_fixture(n_students=120, n_courses=12, n_rooms=10)
+    request = _request(improve_iterations=50)
+
+    result = create_exam_schedule_cached(
+        request.to_exam_program(), class_dict, classrooms, cache=ScheduleCache(str(tmp_path)),
+        improve_iterations=request.improve_iterations, improve_time_budget=request.improve_time_budget
+    )
+
+    assert "local_search" in result["statistics"]
+    assert request.to_exam_program().fingerprint() != _request().to_exam_program().fingerprint()
+
+
+def test_multi_start_process_pool_matches_serial_runs():
+    class_dict, classrooms = synthetic_fixture(n_students=120, n_courses=12, n_rooms=10)
+    exam_program = _request().to_exam_program()
+
+    serial = create_exam_schedule_multi_start(exam_program, class_dict, classrooms, n_runs=3, n_jobs=1)
+    pooled = create_exam_schedule_multi_start(exam_program, class_dict, classrooms, n_runs=3, n_jobs=2)
+
+    assert [(r["seed"], r["score"]) for r in pooled["runs"]] == [(r["seed"], r["score"]) for r in serial["runs"]]